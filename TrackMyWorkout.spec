@@ -5,7 +5,7 @@ a = Analysis(
     ['src\\app.py'],
     pathex=[],
     binaries=[],
-    datas=[],
+    datas=[('build\\resources', 'resources')],  # אייקונים מוכנים - build_icons.py
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
@@ -0,0 +1,57 @@
+"""
+הגדרות לחבילת מדידות הביצועים (pytest-benchmark)
+
+הרצה:
+    python -m pytest benchmarks
+    python -m pytest benchmarks --benchmark-compare      # השוואה להרצה השמורה האחרונה
+    BENCH_SIZES=10,1000 python -m pytest benchmarks       # רק גדלים קטנים
+
+כל הרצה נשמרת ב-.benchmarks תחת השם v{__version__}, כך שאפשר להשוות
+בין גרסאות (למשל 1.0.2 מול הבאה) עם --benchmark-compare=<מספר הרצה>.
+
+זמני תגובה של הממשק עצמו (p50/p95) נמדדים בנפרד: python benchmarks/gui_latency.py
+"""
+import os
+
+import pytest
+
+from src.core.synthetic import synthetic_rows
+from src.version import __version__
+
+DEFAULT_SIZES = (10, 1_000, 100_000, 1_000_000)
+
+
+def bench_sizes() -> tuple[int, ...]:
+    env = os.environ.get("BENCH_SIZES")
+    if not env:
+        return DEFAULT_SIZES
+    return tuple(int(size) for size in env.split(",") if size.strip())
+
+
+def pytest_configure(config):
+    # שמירה אוטומטית לפי גרסה, אלא אם ביקשו שם אחר או כיבוי
+    if not (config.getoption("benchmark_save", None) or config.getoption("benchmark_disable", False)):
+        config.option.benchmark_save = f"v{__version__}"
+
+
+def pytest_benchmark_update_machine_info(config, machine_info):
+    machine_info["app_version"] = __version__
+
+
+_ROWS_CACHE: dict[int, list[list[str]]] = {}
+
+
+@pytest.fixture(params=bench_sizes(), ids=lambda n: f"{n}rows")
+def rows(request):
+    """שורות סינתטיות בגודל הפרמטר - נוצרות פעם אחת לכל גודל"""
+    size = request.param
+    if size not in _ROWS_CACHE:
+        _ROWS_CACHE[size] = synthetic_rows(size)
+    return _ROWS_CACHE[size]
+
+
+def run(benchmark, fn, *args, rows_count: int = 0, **kwargs):
+    """גדלים גדולים נמדדים בסיבוב בודד כדי שהחבילה לא תימשך שעות"""
+    if rows_count >= 100_000:
+        return benchmark.pedantic(fn, args=args, kwargs=kwargs, rounds=1, iterations=1)
+    return benchmark(fn, *args, **kwargs)
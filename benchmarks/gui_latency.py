@@ -0,0 +1,192 @@
+"""
+מדידת זמני תגובה של הממשק (offscreen) - p50/p95 לכל פעולה ולכל גודל היסטוריה
+
+הרצה:
+    python benchmarks/gui_latency.py
+    python benchmarks/gui_latency.py --sizes 100,10000 --repeat 30
+
+כל פעולה נמדדת מקצה לקצה: מהקריאה ועד שתור האירועים של Qt התרוקן
+(כולל ציור מחדש). גרף נמדד עד שהתמונה מוצגת - פעם בלי מטמון ופעם איתו.
+"""
+import argparse
+import itertools
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from core.synthetic import synthetic_rows  # noqa: E402
+
+DEFAULT_SIZES = (10, 1_000, 10_000)
+PROFILES = ("bench_a", "bench_b")
+EXERCISES = ("squat", "bench_press")
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """אחוזון באינטרפולציה לינארית"""
+    ordered = sorted(samples)
+    if len(ordered) == 1:
+        return ordered[0]
+    pos = (len(ordered) - 1) * pct / 100
+    low = int(pos)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (pos - low)
+
+
+def write_dataset(size: int):
+    """שני פרופילים, שני תרגילים לכל אחד, size שורות לתרגיל - בתיקיית העבודה"""
+    from core import storage
+
+    for p_index, profile in enumerate(PROFILES):
+        storage.save_profile(profile, {"name": profile})
+        for e_index, exercise in enumerate(EXERCISES):
+            storage.save_exercise(profile, exercise, synthetic_rows(size, seed=p_index * 10 + e_index))
+    storage.write_active_profile(PROFILES[0])
+
+
+class Harness:
+    def __init__(self, app, repeat: int):
+        self.app = app
+        self.repeat = repeat
+
+    def drain(self):
+        self.app.processEvents()
+
+    def wait_until(self, condition, timeout: float = 60.0):
+        end = time.perf_counter() + timeout
+        while not condition():
+            if time.perf_counter() > end:
+                raise TimeoutError("הפעולה לא הסתיימה בזמן")
+            self.app.processEvents()
+            time.sleep(0.001)
+
+    def measure(self, action, setup=None, done=None) -> list[float]:
+        """זמני action במילישניות; setup רץ לפני כל מדידה ולא נספר"""
+        samples = []
+        for _ in range(self.repeat):
+            if setup:
+                setup()
+            self.drain()
+            start = time.perf_counter()
+            action()
+            if done:
+                self.wait_until(done)
+            self.drain()
+            samples.append((time.perf_counter() - start) * 1000)
+        return samples
+
+
+def exercise_tabs(window, app_module):
+    return [window.tab_widget.widget(i) for i in range(window.tab_widget.count())
+            if isinstance(window.tab_widget.widget(i), app_module.ExerciseTab)]
+
+
+def run_size(app, app_module, size: int, repeat: int) -> dict[str, list[float]]:
+    write_dataset(size)
+    window = app_module.MainWindow()
+    window.resize(1000, 700)
+    window.show()
+    harness = Harness(app, repeat)
+    # התרגילים נטענים ב-_check_first_run שמתוזמן אחרי בניית החלון
+    harness.wait_until(lambda: exercise_tabs(window, app_module))
+
+    tab = exercise_tabs(window, app_module)[0]
+    window.tab_widget.setCurrentWidget(tab)
+    results = {}
+
+    def fill_inputs():
+        tab.input_weight.setText("60")
+        tab.input_sets.setText("3")
+        tab.input_reps.setText("10")
+        tab.input_last_reps.setText("8")
+
+    results["add_entry"] = harness.measure(tab.add_entry, setup=fill_inputs)
+    results["pop_last"] = harness.measure(tab.pop_last)
+
+    def select_rows():
+        tab.table.clearSelection()
+        for r in range(min(3, tab.table.rowCount())):
+            tab.table.selectRow(r)
+
+    results["delete_selected_rows"] = harness.measure(tab.delete_selected_rows, setup=select_rows)
+    results["undo"] = harness.measure(tab.undo, setup=tab.pop_last)
+    results["redo"] = harness.measure(tab.redo, setup=tab.undo)
+
+    indexes = list(range(window.tab_widget.count()))
+    cycle = iter(indexes * (repeat + 1))
+    results["tab_switch"] = harness.measure(lambda: window.tab_widget.setCurrentIndex(next(cycle)))
+
+    window.tab_widget.setCurrentWidget(tab)
+
+    def chart_shown():
+        return tab._render_task is None and tab.chart_label.pixmap() is not None \
+            and not tab.chart_label.pixmap().isNull()
+
+    def reset_chart(clear_cache: bool):
+        tab.restore_normal_view()
+        tab.chart_label.clear()
+        if clear_cache:
+            app_module.chart_cache.clear()
+
+    if app_module._HAS_MPL:
+        results["plot (cold)"] = harness.measure(tab.plot_selected_exercise, setup=lambda: reset_chart(True),
+                                                 done=chart_shown)
+        results["plot (cached)"] = harness.measure(tab.plot_selected_exercise, setup=lambda: reset_chart(False),
+                                                   done=chart_shown)
+        tab.restore_normal_view()
+
+    # החלפת פרופיל - אותה עבודה שהחלון עושה אחרי בחירה בדיאלוג
+    for t in exercise_tabs(window, app_module):
+        t._has_unsaved_changes = False
+    profiles = itertools.cycle(PROFILES[1:] + PROFILES[:1])
+    results["switch_profile"] = harness.measure(lambda: window._activate_profile(next(profiles)))
+
+    window.close()
+    window.deleteLater()
+    harness.drain()
+    return results
+
+
+def print_report(size: int, results: dict[str, list[float]]):
+    print(f"\n{size:,} rows per exercise")
+    print(f"  {'action':<22}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}{'n':>5}")
+    for name, samples in results.items():
+        print(f"  {name:<22}{percentile(samples, 50):>10.2f}{percentile(samples, 95):>10.2f}"
+              f"{max(samples):>10.2f}{len(samples):>5}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="GUI interaction latency (offscreen)")
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES),
+                        help="comma-separated history sizes per exercise")
+    parser.add_argument("--repeat", type=int, default=20, help="samples per action")
+    args = parser.parse_args(argv)
+
+    from PySide6.QtWidgets import QApplication
+    import app as app_module
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    app_module.apply_stylesheet(app)
+    # דיאלוגים מודאליים (למשל "אין תרגילים") לא יעצרו את המדידה
+    app_module.QMessageBox.information = staticmethod(lambda *args, **kwargs: None)
+
+    cwd = os.getcwd()
+    print(f"{app_module.get_version_string()} - {app.platformName()}, repeat={args.repeat}")
+    for size in (int(s) for s in args.sizes.split(",") if s.strip()):
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            try:
+                print_report(size, run_size(app, app_module, size, args.repeat))
+            finally:
+                os.chdir(cwd)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
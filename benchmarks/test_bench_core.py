@@ -0,0 +1,50 @@
+import pytest
+
+from src.core import UndoHistory, chart_points, storage, summarize
+from src.core.excel_export import HAS_OPENPYXL, write_workbook
+
+from conftest import run
+
+
+@pytest.mark.parametrize("suffix", [".json", ".tmwh"])
+def test_save(benchmark, rows, tmp_path, suffix):
+    path = tmp_path / f"exercise_bench_a{suffix}"
+    run(benchmark, storage.save_rows, path, rows, rows_count=len(rows))
+    assert path.exists()
+
+
+@pytest.mark.parametrize("suffix", [".json", ".tmwh"])
+def test_load(benchmark, rows, tmp_path, suffix):
+    path = tmp_path / f"exercise_bench_a{suffix}"
+    storage.save_rows(path, rows)
+    loaded = run(benchmark, storage.load_rows, path, rows_count=len(rows))
+    assert len(loaded) == len(rows)
+
+
+def test_summary(benchmark, rows):
+    summary = run(benchmark, summarize, rows, rows_count=len(rows))
+    assert summary.count == len(rows)
+
+
+def test_undo(benchmark, rows):
+    """snapshot לפני פעולה + undo - כמו בהוספת שורה בטאב"""
+    def add_and_undo():
+        history = UndoHistory()
+        history.push([list(row) for row in rows])
+        current = [list(row) for row in rows] + [rows[0]]
+        return history.undo(current)
+
+    restored = run(benchmark, add_and_undo, rows_count=len(rows))
+    assert len(restored) == len(rows)
+
+
+def test_plot_preparation(benchmark, rows):
+    points = run(benchmark, chart_points, rows, rows_count=len(rows))
+    assert len(points) == len(rows)
+
+
+@pytest.mark.skipif(not HAS_OPENPYXL, reason="openpyxl not installed")
+def test_excel_export(benchmark, rows, tmp_path):
+    filename = str(tmp_path / "export.xlsx")
+    sheets = run(benchmark, write_workbook, filename, [("bench", rows)], rows_count=len(rows))
+    assert sheets == 1
@@ -26,6 +26,15 @@ def build_exe():
         import shutil
         shutil.rmtree(build_dir)
     
+    # האייקון נארז כקבצים מוכנים (resources/icons ב-spec)
+    print("🎨 מצייר אייקונים...")
+    result = subprocess.run([sys.executable, "build_icons.py", str(build_dir / "resources" / "icons")],
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        print("❌ ציור האייקונים נכשל!")
+        print(result.stderr)
+        return False
+    
     # בניית ה-EXE
     print("⚙️  בונה את האפליקציה...")
     cmd = [
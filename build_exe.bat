@@ -6,17 +6,27 @@ echo.
 
 cd /d %~dp0
 
-echo [1/3] Cleaning old build files...
+echo [1/4] Cleaning old build files...
 if exist build rmdir /s /q build
 if exist dist rmdir /s /q dist
 
-echo [2/3] Building executable...
+echo [2/4] Rendering icons...
+.venv\Scripts\python.exe build_icons.py build\resources\icons
+if %errorlevel% neq 0 (
+    echo.
+    echo [ERROR] Icon rendering failed!
+    pause
+    exit /b 1
+)
+
+echo [3/4] Building executable...
 .venv\Scripts\pyinstaller.exe --noconfirm ^
     --onefile ^
     --windowed ^
     --name=TrackMyWorkout ^
     --clean ^
     --log-level=WARN ^
+    --add-data "build\resources;resources" ^
     src\app.py
 
 if %errorlevel% neq 0 (
@@ -27,7 +37,7 @@ if %errorlevel% neq 0 (
 )
 
 echo.
-echo [3/3] Cleaning up...
+echo [4/4] Cleaning up...
 if exist build rmdir /s /q build
 
 echo.
@@ -6,7 +6,7 @@ a = Analysis(
     ['src\\app.py'],
     pathex=[],
     binaries=[],
-    datas=[],
+    datas=[('build\\resources', 'resources')],  # אייקונים מוכנים - build_icons.py
     hiddenimports=[
         'PySide6.QtCore',
         'PySide6.QtGui',
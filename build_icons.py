@@ -0,0 +1,35 @@
+"""
+ציור סט האייקונים של האפליקציה לתיקייה - לאריזה בגרסה הבנויה
+
+build.py מריץ את זה לפני PyInstaller, והתיקייה נארזת כ-resources/icons,
+כך שהגרסה הבנויה לא מציירת את האייקון בכלל בעלייה.
+
+דוגמה:
+    python build_icons.py build/resources/icons
+"""
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+sys.path.insert(0, str(ROOT / "src"))
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 1:
+        print(__doc__)
+        return 2
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtGui import QGuiApplication
+
+    app = QGuiApplication.instance() or QGuiApplication([])  # noqa: F841 - נדרש לציור
+    from app import write_icon_set
+
+    for path in write_icon_set(argv[0]):
+        print(path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
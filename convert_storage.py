@@ -0,0 +1,39 @@
+"""
+המרת קבצי התרגילים בין JSON לפורמט הבינארי הקומפקטי (.tmwh)
+
+ההמרה ללא אובדן בשני הכיוונים. דוגמאות:
+    python convert_storage.py binary            # תיקיית העבודה הנוכחית
+    python convert_storage.py binary-zlib data
+    python convert_storage.py json data         # חזרה ל-JSON
+
+כדי שהאפליקציה תמשיך לשמור בפורמט החדש: WORKOUT_STORAGE_FORMAT=binary
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+from core import storage
+
+
+def _total_size(directory: Path) -> int:
+    return sum(f.stat().st_size for pattern in ("exercise_*.json", "exercise_*.tmwh")
+               for f in directory.glob(pattern) if not f.name.startswith(storage.LEGACY_EXERCISE_PREFIX))
+
+
+def main(argv=None):
+    """פונקציה ראשית"""
+    parser = argparse.ArgumentParser(description="המרת קבצי תרגילים בין JSON לפורמט בינארי")
+    parser.add_argument("format", choices=storage.STORAGE_FORMATS, help="פורמט היעד")
+    parser.add_argument("directory", type=Path, nargs="?", default=Path.cwd(), help="תיקיית הנתונים")
+    args = parser.parse_args(argv)
+
+    before = _total_size(args.directory)
+    converted = storage.convert_exercises(args.format, base_dir=args.directory)
+    after = _total_size(args.directory)
+    print(f"✅ הומרו {converted} קבצים ל-{args.format} ({before:,} -> {after:,} בתים)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
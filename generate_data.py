@@ -0,0 +1,64 @@
+"""
+יצירת נתונים סינתטיים לבדיקות עומס ולשחזור באגים
+
+דוגמאות:
+    python generate_data.py out --profiles 3 --exercises 8 --entries 5000
+    python generate_data.py out --entries 200 --distribution bursty --seed 7
+    python generate_data.py out --profiles 0 --legacy-exercises 4 --legacy-profile
+
+את התיקייה שנוצרה אפשר להפעיל כתיקיית עבודה של האפליקציה:
+    cd out && python ../src/app.py
+"""
+import argparse
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+from core.synthetic import DATE_DISTRIBUTIONS, generate_dataset
+
+
+def _date(text: str) -> datetime:
+    return datetime.strptime(text, "%Y-%m-%d")
+
+
+def main(argv=None):
+    """פונקציה ראשית"""
+    parser = argparse.ArgumentParser(description="יצירת פרופילים ותרגילים סינתטיים בפורמט של האפליקציה")
+    parser.add_argument("output", type=Path, help="תיקיית היעד")
+    parser.add_argument("--profiles", type=int, default=1, help="מספר פרופילים")
+    parser.add_argument("--exercises", type=int, default=3, help="תרגילים לכל פרופיל")
+    parser.add_argument("--entries", type=int, default=100, help="שורות לכל תרגיל")
+    parser.add_argument("--seed", type=int, default=0, help="seed - אותו seed יוצר אותם קבצים")
+    parser.add_argument("--start", type=_date, help="תאריך התחלה YYYY-MM-DD (ברירת מחדל: שנתיים לפני הסוף)")
+    parser.add_argument("--end", type=_date, help="תאריך סיום YYYY-MM-DD (ברירת מחדל: 2025-10-01)")
+    parser.add_argument("--distribution", choices=DATE_DISTRIBUTIONS, default="regular",
+                        help="פיזור התאריכים")
+    parser.add_argument("--legacy-exercises", type=int, default=0,
+                        help="קבצי exercise_state_* בפורמט הישן")
+    parser.add_argument("--legacy-profile", action="store_true", help="יצירת user_profile.json ישן")
+    args = parser.parse_args(argv)
+
+    if args.start and args.end and args.start > args.end:
+        parser.error("--start אחרי --end")
+
+    summary = generate_dataset(
+        args.output,
+        profiles=args.profiles,
+        exercises=args.exercises,
+        entries=args.entries,
+        seed=args.seed,
+        start=args.start,
+        end=args.end,
+        distribution=args.distribution,
+        legacy_exercises=args.legacy_exercises,
+        legacy_profile=args.legacy_profile,
+    )
+    print(f"✅ נוצרו {summary['files']} קבצים ({summary['rows']:,} שורות) ב-{args.output}")
+    if summary["profiles"]:
+        print(f"👤 פרופילים: {', '.join(summary['profiles'])}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
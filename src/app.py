@@ -1,60 +1,104 @@
-import json
 import os
 import sys
+import time
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+# נקודת ההתחלה לחישוב "זמן עד אינטראקטיבי" (לפני טעינת Qt)
+_APP_START = time.perf_counter()
+
+# במצב מדידה (startup_profile.py) נכתב לקובץ הזה דוח זמני עלייה ואז האפליקציה נסגרת
+STARTUP_REPORT_ENV = "WORKOUT_STARTUP_REPORT"
+_STARTUP_MARKS: dict[str, float] = {}
+
+
+def _mark_startup(name: str):
+    """רישום נקודת זמן בעלייה (מילישניות מ-_APP_START)"""
+    _STARTUP_MARKS.setdefault(name, (time.perf_counter() - _APP_START) * 1000)
+
 # ייבוא מידע גרסה
 try:
     from version import __version__, __app_name__, get_version_string
 except ImportError:
-    __version__ = "1.0.0"
-    __app_name__ = "מעקב אימונים"
-    def get_version_string():
-        return f"{__app_name__} v{__version__}"
+    try:
+        from src.version import __version__, __app_name__, get_version_string
+    except ImportError:
+        __version__ = "1.0.0"
+        __app_name__ = "מעקב אימונים"
+        def get_version_string():
+            return f"{__app_name__} v{__version__}"
+_mark_startup("import:version")
 
 # Optional dependencies: import lazily and tolerate absence so module can be
 # imported in environments missing optional packages (e.g., CI/test).
+# openpyxl נטען רק בזמן הייצוא עצמו (ב-thread רקע).
+# לוגיקת התחום (שמירה, חישובים, ייבוא/ייצוא) נמצאת בחבילת core ללא תלות ב-Qt.
 try:
-    from openpyxl import Workbook
-    from openpyxl.chart import LineChart, Reference
-    from openpyxl.styles import Alignment, Font, PatternFill
-    from openpyxl.utils import get_column_letter
-    _HAS_OPENPYXL = True
-except Exception:
-    Workbook = None  # type: ignore
-    LineChart = Reference = None  # type: ignore
-    Alignment = Font = PatternFill = None  # type: ignore
-    get_column_letter = None  # type: ignore
-    _HAS_OPENPYXL = False
-
-# Matplotlib / Qt canvas may be optional in headless/test environments.
-os.environ.setdefault('QT_API', 'pyside6')
+    from core import PROGRESS_LEVELS, UndoHistory, archive, chart_points, empty_profile, memreport, overview, progress_level, storage, total_volume, trace
+    from core.sysinfo import format_bytes, resource_dir, rss_bytes, user_cache_dir
+    from core.thumbnails import PROFILE_IMAGE_MAX, PYRAMID_SIZES, ThumbnailDiskCache, pick_variant, thumbnail_key, variant_path
+    from core.trace import traced
+    from core.excel_export import HAS_OPENPYXL as _HAS_OPENPYXL, ExportCancelled, update_workbook, write_workbook
+    from core.workout_import import parse_bulk_text, read_import_file
+except ImportError:
+    from src.core import PROGRESS_LEVELS, UndoHistory, archive, chart_points, empty_profile, memreport, overview, progress_level, storage, total_volume, trace
+    from src.core.sysinfo import format_bytes, resource_dir, rss_bytes, user_cache_dir
+    from src.core.thumbnails import PROFILE_IMAGE_MAX, PYRAMID_SIZES, ThumbnailDiskCache, pick_variant, thumbnail_key, variant_path
+    from src.core.trace import traced
+    from src.core.excel_export import HAS_OPENPYXL as _HAS_OPENPYXL, ExportCancelled, update_workbook, write_workbook
+    from src.core.workout_import import parse_bulk_text, read_import_file
+_mark_startup("import:core")
+
+# רינדור גרפים נעשה ב-thread רקע; matplotlib נטען רק בעת הציור הראשון.
 try:
-    from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-    from matplotlib.figure import Figure
-    import matplotlib.dates as mdates
-    _HAS_MPL = True
-except Exception:
-    FigureCanvas = None  # type: ignore
-    Figure = None  # type: ignore
-    mdates = None  # type: ignore
-    _HAS_MPL = False
+    from chart_render import HAS_MPL as _HAS_MPL, chart_cache, chart_cache_key, render_weight_chart
+except ImportError:
+    from src.chart_render import HAS_MPL as _HAS_MPL, chart_cache, chart_cache_key, render_weight_chart
+_mark_startup("import:chart_render")
+
+# ערכת העיצוב - גיליון סגנון אחד; widgets משויכים אליו בשם ובמאפיינים
+try:
+    from theme import CARD_COLORS, STYLESHEET, restyle, styled
+except ImportError:
+    from src.theme import CARD_COLORS, STYLESHEET, restyle, styled
+_mark_startup("import:theme")
 try:
-    from PySide6.QtCore import QDate, QEvent, QSize, Qt, QTimer, QRectF, QPointF
+    from PySide6.QtCore import (
+        QBuffer,
+        QDate,
+        QEvent,
+        QIODevice,
+        QObject,
+        QPointF,
+        QRectF,
+        QRunnable,
+        QSize,
+        Qt,
+        QThreadPool,
+        QTimer,
+        Signal,
+    )
     from PySide6.QtGui import (
         QAction,
+        QBrush,
         QColor,
         QDoubleValidator,
         QFont,
+        QFontMetrics,
+        QIcon,
+        QImage,
         QIntValidator,
         QKeySequence,
+        QLinearGradient,
         QPainter,
         QPainterPath,
         QPen,
         QPixmap,
+        QPixmapCache,
         QShortcut,
+        QStaticText,
         QValidator,
     )
     from PySide6.QtWidgets import (
@@ -75,6 +119,8 @@ try:
         QMainWindow,
         QMenu,
         QMessageBox,
+        QPlainTextEdit,
+        QProgressDialog,
         QPushButton,
         QRadioButton,
         QSizePolicy,
@@ -92,8 +138,122 @@ except Exception:
     _HAS_QT = False
     # Define placeholders so static analysis of the file can continue in limited fashion.
     QDate = QEvent = QSize = Qt = object
+    QObject = QRunnable = QThreadPool = object
+    Signal = lambda *args, **kwargs: None  # noqa: E731
     QAction = QColor = QDoubleValidator = QIntValidator = QKeySequence = QShortcut = QValidator = object
-    QApplication = QButtonGroup = QCalendarWidget = QDialog = QDialogButtonBox = QFileDialog = QFrame = QGridLayout = QHBoxLayout = QInputDialog = QLabel = QLineEdit = QListWidget = QListWidgetItem = QMainWindow = QMenu = QMessageBox = QPushButton = QRadioButton = QSizePolicy = QStatusBar = QTableWidget = QTableWidgetItem = QTabWidget = QToolBar = QVBoxLayout = QWidget = object
+    QApplication = QButtonGroup = QCalendarWidget = QDialog = QDialogButtonBox = QFileDialog = QFrame = QGridLayout = QHBoxLayout = QInputDialog = QLabel = QLineEdit = QListWidget = QListWidgetItem = QMainWindow = QMenu = QMessageBox = QPlainTextEdit = QProgressDialog = QPushButton = QRadioButton = QSizePolicy = QStatusBar = QTableWidget = QTableWidgetItem = QTabWidget = QToolBar = QVBoxLayout = QWidget = object
+_mark_startup("import:PySide6")
+
+
+class WorkerSignals(QObject):
+    """אותות ממשימת רקע חזרה ל-GUI thread"""
+    finished = Signal(object)
+    failed = Signal(str)
+    progress = Signal(int, int)
+
+
+class BackgroundTask(QRunnable):
+    """הרצת פונקציה ב-QThreadPool; התוצאה מגיעה דרך signals.finished"""
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+        self._cancelled = False
+
+    @classmethod
+    def with_progress(cls, fn, *args, **kwargs):
+        """משימה שהפונקציה שלה מקבלת progress(done, total) ו-is_cancelled()"""
+        task = cls(fn, *args, **kwargs)
+        task.kwargs.update(progress=task.signals.progress.emit, is_cancelled=task.is_cancelled)
+        return task
+
+    def cancel(self):
+        self._cancelled = True
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            result, error = None, str(e)
+        else:
+            error = None
+        try:
+            if error is None:
+                self.signals.finished.emit(result)
+            else:
+                self.signals.failed.emit(error)
+        except RuntimeError:
+            # האפליקציה נסגרה בזמן שהמשימה רצה - אין למי לדווח
+            pass
+
+
+class PerfHud(QLabel):
+    """שכבת מידע למפתחים מעל החלון: זמני פעולות, שורות, זיכרון ומטמונים"""
+    def __init__(self, window):
+        super().__init__(window)
+        self._window = window
+        self._last_operation = None  # (שם, מילישניות) - נכתב גם מ-threads של רקע
+        self._trace_was_enabled = False
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setLayoutDirection(Qt.LayoutDirection.RightToLeft)
+        styled(self, "perfHud")
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setInterval(500)
+        self._refresh_timer.timeout.connect(self.refresh)
+        self.hide()
+
+    def _on_traced(self, name: str, duration_ms: float):
+        # עשוי לרוץ ב-thread רקע - רק השמה, הציור בטיימר
+        self._last_operation = (name, duration_ms)
+
+    def toggle(self):
+        if self.isVisible():
+            self._refresh_timer.stop()
+            trace.remove_listener(self._on_traced)
+            if not self._trace_was_enabled:
+                trace.disable()
+            self.hide()
+            return
+        # הזמנים מגיעים ממדידת ה-trace, לכן היא פעילה כל עוד ה-HUD מוצג
+        self._trace_was_enabled = trace.is_enabled()
+        trace.enable()
+        trace.add_listener(self._on_traced)
+        self.refresh()
+        self.show()
+        self.raise_()
+        self._refresh_timer.start()
+
+    def refresh(self):
+        window = self._window
+        tabs = [window.tab_widget.widget(i) for i in range(window.tab_widget.count())]
+        exercise_tabs = [tab for tab in tabs if isinstance(tab, ExerciseTab)]
+        rows = sum(tab.table.rowCount() for tab in exercise_tabs)
+
+        if self._last_operation:
+            name, duration_ms = self._last_operation
+            last = f"{name} {duration_ms:,.1f} ms"
+        else:
+            last = "-"
+        tti = window._time_to_interactive_ms
+        lines = [
+            f"⏱ פעולה אחרונה: {last}",
+            f"📄 שורות: {rows:,} ב-{len(exercise_tabs)} תרגילים",
+            f"🧠 RSS: {format_bytes(rss_bytes())} | widgets: {len(QApplication.allWidgets()):,}"
+            f" | QObjects: {len(window.findChildren(QObject)):,}",
+            f"🖼 מטמון גרפים: {chart_cache.hit_rate:.0%} ({chart_cache.hits}/{chart_cache.hits + chart_cache.misses}),"
+            f" {len(chart_cache)} תמונות",
+            f"🚀 זמן עד אינטראקטיבי: {f'{tti:,.0f} ms' if tti is not None else '-'}",
+        ]
+        self.setText("\n".join(lines))
+        self.adjustSize()
+        top = window.menuBar().height() + 60
+        self.move(10, top)
+        self.raise_()
 
 
 # טבלה שמאזנת עמודות לרוחב שווה בכל שינוי גודל
@@ -129,33 +289,13 @@ class SummaryTab(QWidget):
         layout.setSpacing(20)
         
         # כותרת
-        title_label = QLabel("📊 סיכום כללי")
-        title_label.setStyleSheet("""
-            QLabel {
-                font-size: 24pt;
-                font-weight: bold;
-                color: #2196F3;
-                padding: 20px;
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #E3F2FD, stop:1 #BBDEFB);
-                border-radius: 10px;
-            }
-        """)
+        title_label = styled(QLabel("📊 סיכום כללי"), "summaryTitle")
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title_label)
         
         # הודעה זמנית
         info_label = QLabel("🚧 גיליון זה בבנייה...\n\nבעתיד יוצגו כאן:\n• סיכום כללי של כל התרגילים\n• גרפי השוואה\n• סטטיסטיקות מתקדמות")
-        info_label.setStyleSheet("""
-            QLabel {
-                font-size: 14pt;
-                color: #666;
-                padding: 40px;
-                background-color: #FAFAFA;
-                border: 2px dashed #BDBDBD;
-                border-radius: 8px;
-            }
-        """)
+        styled(info_label, "summaryPlaceholder")
         info_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(info_label)
         
@@ -163,28 +303,212 @@ class SummaryTab(QWidget):
         self.setLayout(layout)
 
 
+# מילוי כל סימן במחרוזת ProgressLevel.dots (●━◉━○...)
+_DOT_FILL = {"●": 1.0, "◉": 2 / 3, "◔": 1 / 3, "○": 0.0}
+
+
+class SummaryCard(QWidget):
+    """
+    קופסת סיכום בטאב תרגיל (כותרת, ערך, אייקון ואופציונלית נקודות התקדמות
+    ושורה תחתונה), מצוירת ישירות ב-paintEvent. כל שורה היא QStaticText
+    שנבנית רק כשהטקסט שלה משתנה, ושינוי מצייר מחדש רק את השורה שלו.
+    הצבעים מ-theme.CARD_COLORS.
+    """
+
+    WIDTH = 300
+    PADDING = 15
+
+    def __init__(self, kind, title, icon, value="", title_pt=16, value_pt=24, icon_pt=32,
+                 dots=0, footer_pt=None, parent=None):
+        super().__init__(parent)
+        self.setFixedWidth(self.WIDTH)
+        self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Preferred)
+        start, end, border = CARD_COLORS[kind]
+        self._colors = (QColor(start), QColor(end))
+        self._border_pen = QPen(QColor(border), 2)
+
+        # שורות לפי הסדר: שם -> [גופן, טקסט, QStaticText או None, מלבן]
+        self._lines = {}
+        self._add_line("title", title_pt, title)
+        self._add_line("value", value_pt, value)
+        self._add_line("icon", icon_pt, icon, bold=False)
+        self._dots = dots
+        self._dots_height = 18
+        self._dots_rect = QRectF()
+        self._progress = ()
+        if footer_pt:
+            self._add_line("footer", footer_pt, "", bold=False)
+
+    def _add_line(self, name, point_size, text, bold=True):
+        font = QFont(self.font())
+        font.setPointSizeF(point_size)
+        font.setBold(bold)
+        self._lines[name] = [font, text, None, QRectF()]
+
+    def _static_text(self, line):
+        font, text, static, _rect = line
+        if static is None:
+            static = QStaticText(text)
+            static.setTextFormat(Qt.TextFormat.PlainText)
+            static.prepare(font=font)
+            line[2] = static
+        return static
+
+    def _row_heights(self):
+        rows = [(name, QFontMetrics(line[0]).height()) for name, line in self._lines.items()]
+        if self._dots:
+            # הנקודות בין האייקון לשורה התחתונה
+            rows.insert(3, ("dots", self._dots_height))
+        return rows
+
+    def sizeHint(self):
+        return QSize(self.WIDTH, sum(height for _, height in self._row_heights()) + 2 * self.PADDING)
+
+    def minimumSizeHint(self):
+        return self.sizeHint()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        rows = self._row_heights()
+        y = (self.height() - sum(height for _, height in rows)) / 2
+        for name, height in rows:
+            rect = QRectF(0, y, self.width(), height)
+            if name == "dots":
+                self._dots_rect = rect
+            else:
+                self._lines[name][3] = rect
+            y += height
+
+    def _set_line(self, name, text):
+        line = self._lines[name]
+        if line[1] == text:
+            return
+        line[1] = text
+        line[2] = None
+        self.update(line[3].toAlignedRect())
+
+    def set_value(self, text):
+        self._set_line("value", text)
+
+    def set_icon(self, text):
+        self._set_line("icon", text)
+
+    def set_footer(self, text):
+        self._set_line("footer", text)
+
+    def set_progress(self, dots: str):
+        """נקודות לפי ProgressLevel.dots - כל סימן מצויר כעיגול מלא/חלקי/ריק"""
+        progress = tuple(_DOT_FILL.get(dot, 0.0) for dot in dots.split("━"))
+        if progress != self._progress:
+            self._progress = progress
+            self.update(self._dots_rect.toAlignedRect())
+
+    def value(self) -> str:
+        return self._lines["value"][1]
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        try:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setClipRect(event.rect())
+            frame = QRectF(self.rect()).adjusted(1, 1, -1, -1)
+            gradient = QLinearGradient(frame.topLeft(), frame.bottomRight())
+            gradient.setColorAt(0, self._colors[0])
+            gradient.setColorAt(1, self._colors[1])
+            painter.setBrush(QBrush(gradient))
+            painter.setPen(self._border_pen)
+            painter.drawRoundedRect(frame, 8, 8)
+
+            painter.setPen(Qt.GlobalColor.white)
+            dirty = QRectF(event.rect())
+            for line in self._lines.values():
+                rect = line[3]
+                if not line[1] or not rect.intersects(dirty):
+                    continue
+                static = self._static_text(line)
+                size = static.size()
+                painter.setFont(line[0])
+                painter.drawStaticText(QPointF(rect.center().x() - size.width() / 2,
+                                               rect.center().y() - size.height() / 2), static)
+            if self._dots and self._dots_rect.intersects(dirty):
+                self._paint_dots(painter)
+        finally:
+            painter.end()
+
+    def _paint_dots(self, painter):
+        fills = self._progress
+        radius = 6
+        gap = 22
+        center_y = self._dots_rect.center().y()
+        first_x = self.width() / 2 - gap * (self._dots - 1) / 2
+        # הרמה הראשונה מימין, כמו בשאר הטקסט העברי
+        centers = [QPointF(first_x + i * gap, center_y) for i in reversed(range(self._dots))]
+        white = QColor(Qt.GlobalColor.white)
+        painter.setPen(QPen(white, 2))
+        for left, right in zip(centers, centers[1:]):
+            step = QPointF(radius if right.x() > left.x() else -radius, 0)
+            painter.drawLine(left + step, right - step)
+        for index, center in enumerate(centers):
+            fill = fills[index] if index < len(fills) else 0.0
+            circle = QRectF(center.x() - radius, center.y() - radius, 2 * radius, 2 * radius)
+            painter.setBrush(white if fill >= 1 else Qt.BrushStyle.NoBrush)
+            painter.drawEllipse(circle)
+            if 0 < fill < 1:
+                # הרמה הנוכחית - פלח לפי הסימן (◔ / ◉)
+                painter.setBrush(white)
+                painter.drawPie(circle, 90 * 16, -int(fill * 360 * 16))
+
+
 class ExerciseTab(QWidget):
     def __init__(self, exercise_name: str, profile_name: str = None):
         super().__init__()
-        self.exercise_name = exercise_name
-        self.profile_name = profile_name or "ברירת מחדל"  # פרופיל ברירת מחדל אם לא צוין
         self.setContentsMargins(5, 5, 5, 5)
         self._has_unsaved_changes = False
         # מערכת Undo/Redo
-        self._undo_stack = []  # מחסנית של מצבי טבלה קודמים
-        self._redo_stack = []  # מחסנית של מצבים לשחזור
-        self._max_undo = 5  # מקסימום 5 פעולות
+        self._history = UndoHistory(max_undo=5)  # מקסימום 5 פעולות
+        self._undo_stack = self._history.undo_stack  # מחסנית של מצבי טבלה קודמים
+        self._redo_stack = self._history.redo_stack  # מחסנית של מצבים לשחזור
         self._is_restoring = False  # דגל למניעת שמירה בזמן שחזור
+        # רשומות ישנות שהועברו לארכיון (נפתח בעצלות, ב-mmap)
+        self._archive = None
+        self._archive_loaded = False
+        # שגיאת הטעינה האחרונה - כל עוד היא קיימת, הקובץ לא נדרס בשמירה
+        self._load_error = None
         self._init_ui()
-        try:
-            self.load_state()
-        except Exception:
-            pass
+        self.bind(exercise_name, profile_name)
+
+    def bind(self, exercise_name: str, profile_name: str = None):
+        """
+        חיבור הטאב לתרגיל (גם טאב קיים מהמאגר של MainWindow) - איפוס התצוגה,
+        הקלט וההיסטוריה וטעינת הנתונים. הווידג'טים עצמם לא נבנים מחדש.
+        """
+        self.reset()
+        self.exercise_name = exercise_name
+        self.profile_name = profile_name or "ברירת מחדל"  # פרופיל ברירת מחדל אם לא צוין
+        self.load_state()
+        if self.table.rowCount() == 0:
+            # load_state לא עדכן את הסיכום (אין קובץ) - אולי יש ארכיון בלבד
+            self._update_summary()
         # אחרי טעינת המצב, נאפס את דגל השינויים
         self._has_unsaved_changes = False
         # שמירת מצב ראשוני
         self._save_state_to_undo()
 
+    def reset(self):
+        """ניקוי הנתונים והמצב לפני החזרה למאגר או חיבור לתרגיל אחר"""
+        self.restore_normal_view()
+        self._render_task = None
+        self.chart_label.clear()
+        self._chart_resize_timer.stop()
+        self._release_archive()
+        for inp in self._inputs:
+            inp.clear()
+        self.table.clearSelection()
+        self.table.setRowCount(0)
+        self.btn_pop.setEnabled(False)
+        self._history.clear()
+        self._has_unsaved_changes = False
+
     def _show_status(self, message: str, duration: int = 2000):
         """הצגת הודעה בסטטוס בר"""
         window = self.window()
@@ -222,47 +546,17 @@ class ExerciseTab(QWidget):
         self.btn_pop = QPushButton("מחק אחרון")
         self.btn_delete_row = QPushButton("מחק שורה")
         self.btn_duplicate_row = QPushButton("שכפל שורה")
+        self.btn_bulk = QPushButton("הזנה מרובה")
+        self.btn_bulk.setToolTip("הדבקה או הקלדה של כמה רשומות בבת אחת (Ctrl+Shift+V)")
         self.btn_plot = QPushButton("הצג גרף")
         self.btn_back = QPushButton("חזור לטבלה")
         self.btn_back.hide()
         
-        # סגנון מיוחד לכפתורים
-        self.btn_plot.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-            }
-            QPushButton:hover {
-                background-color: #388E3C;
-            }
-        """)
-        
-        delete_buttons_style = """
-            QPushButton {
-                background-color: #f44336;
-            }
-            QPushButton:hover {
-                background-color: #d32f2f;
-            }
-            QPushButton:disabled {
-                background-color: #ffcdd2;
-            }
-        """
-        self.btn_pop.setStyleSheet(delete_buttons_style)
-        self.btn_delete_row.setStyleSheet(delete_buttons_style)
-        
-        # עיצוב כפתור שכפול
-        duplicate_button_style = """
-            QPushButton {
-                background-color: #FF9800;
-            }
-            QPushButton:hover {
-                background-color: #F57C00;
-            }
-            QPushButton:disabled {
-                background-color: #FFE0B2;
-            }
-        """
-        self.btn_duplicate_row.setStyleSheet(duplicate_button_style)
+        # צבעי הכפתורים מגיעים מערכת העיצוב (theme) לפי variant
+        styled(self.btn_plot, variant="success")
+        styled(self.btn_pop, variant="danger")
+        styled(self.btn_delete_row, variant="danger")
+        styled(self.btn_duplicate_row, variant="warning")
         
         # התחלת מצב כפתורים - מבוטלים
         self.btn_add.setEnabled(False)
@@ -274,90 +568,13 @@ class ExerciseTab(QWidget):
         summary_layout = QHBoxLayout()
         summary_layout.setSpacing(15)
         
-        # עיצוב תוויות הסיכום בקופסאות
-        # קופסה כחולה לאימונים
-        exercises_style = """
-            QLabel {
-                font-size: 16pt;
-                font-weight: bold;
-                color: white;
-                padding: 15px 25px;
-                border-radius: 8px;
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #2196F3, stop:1 #1976D2);
-                border: 2px solid #1565C0;
-            }
-        """
-        
-        # קופסה ירוקה למשקל שהרמתי
-        weight_style = """
-            QLabel {
-                font-size: 16pt;
-                font-weight: bold;
-                color: white;
-                padding: 15px 25px;
-                border-radius: 8px;
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #4CAF50, stop:1 #388E3C);
-                border: 2px solid #2E7D32;
-            }
-        """
-        
-        # קופסה כתומה לממוצע
-        avg_style = """
-            QLabel {
-                font-size: 16pt;
-                font-weight: bold;
-                color: white;
-                padding: 15px 25px;
-                border-radius: 8px;
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #FF9800, stop:1 #F57C00);
-                border: 2px solid #E65100;
-            }
-        """
-        
-        self.total_exercises_label = QLabel('<div style="text-align: center;">תרגילים<br><span style="font-size: 24pt;">0</span><br><span style="font-size: 32pt;">💪</span></div>')
-        self.total_exercises_label.setStyleSheet(exercises_style)
-        self.total_exercises_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.total_exercises_label.setMinimumWidth(300)
-        self.total_exercises_label.setMaximumWidth(300)
-        self.total_exercises_label.setTextFormat(Qt.TextFormat.RichText)
-        
-        self.total_weight_label = QLabel('<div style="text-align: center;">משקל שהרמתי<br><span style="font-size: 24pt;">0 ק"ג</span><br><span style="font-size: 32pt;">🏋️</span></div>')
-        self.total_weight_label.setStyleSheet(weight_style)
-        self.total_weight_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.total_weight_label.setMinimumWidth(300)
-        self.total_weight_label.setMaximumWidth(300)
-        self.total_weight_label.setTextFormat(Qt.TextFormat.RichText)
-        
-        self.avg_weight_label = QLabel('<div style="text-align: center;">משקל לסט<br><span style="font-size: 24pt;">0 ק"ג</span><br><span style="font-size: 32pt;">📊</span></div>')
-        self.avg_weight_label.setStyleSheet(avg_style)
-        self.avg_weight_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.avg_weight_label.setMinimumWidth(300)
-        self.avg_weight_label.setMaximumWidth(300)
-        self.avg_weight_label.setTextFormat(Qt.TextFormat.RichText)
-        
-        # קופסה סגולה לרמת התקדמות
-        progress_style = """
-            QLabel {
-                font-size: 16pt;
-                font-weight: bold;
-                color: white;
-                padding: 15px 25px;
-                border-radius: 8px;
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #9C27B0, stop:1 #7B1FA2);
-                border: 2px solid #6A1B9A;
-            }
-        """
-        
-        self.progress_label = QLabel('<div style="text-align: center;">רמה<br><span style="font-size: 20pt;">טירון</span><br><span style="font-size: 32pt;">🌱</span></div>')
-        self.progress_label.setStyleSheet(progress_style)
-        self.progress_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.progress_label.setMinimumWidth(300)
-        self.progress_label.setMaximumWidth(300)
-        self.progress_label.setTextFormat(Qt.TextFormat.RichText)
+        # קופסאות הסיכום (theme.CARD_COLORS): כחולה לאימונים, ירוקה למשקל
+        # שהרמתי, כתומה לממוצע, סגולה לרמה
+        self.total_exercises_label = SummaryCard("exercises", "תרגילים", "💪", "0")
+        self.total_weight_label = SummaryCard("weight", "משקל שהרמתי", "🏋️", '0 ק"ג')
+        self.avg_weight_label = SummaryCard("average", "משקל לסט", "📊", '0 ק"ג')
+        self.progress_label = SummaryCard("progress", "רמה", "", title_pt=14, value_pt=22, icon_pt=28,
+                                          dots=len(PROGRESS_LEVELS), footer_pt=11)
         
         summary_layout.addWidget(self.total_exercises_label)
         summary_layout.addWidget(self.total_weight_label)
@@ -408,6 +625,7 @@ class ExerciseTab(QWidget):
         self.btn_pop.clicked.connect(self.pop_last)
         self.btn_delete_row.clicked.connect(self.delete_selected_row)
         self.btn_duplicate_row.clicked.connect(self.duplicate_selected_row)
+        self.btn_bulk.clicked.connect(self.open_bulk_entry)
         self.btn_plot.clicked.connect(self.plot_selected_exercise)
         self.btn_back.clicked.connect(self.restore_normal_view)
         
@@ -427,9 +645,28 @@ class ExerciseTab(QWidget):
         duplicate_shortcut_he = QShortcut(QKeySequence("Ctrl+ג"), self)
         duplicate_shortcut_he.activated.connect(self.duplicate_selected_row)
 
-        # מסגרת גרף
-        self.figure = Figure(figsize=(6, 4))
-        self.canvas = FigureCanvas(self.figure)
+        # הדבקת כמה רשומות מהלוח
+        bulk_shortcut = QShortcut(QKeySequence("Ctrl+Shift+V"), self)
+        bulk_shortcut.activated.connect(lambda: self.open_bulk_entry(from_clipboard=True))
+
+        # מסגרת גרף - הגרף מרונדר ברקע לתמונה ומוצג כ-pixmap
+        self.chart_label = QLabel()
+        self.chart_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.chart_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.chart_label.setMinimumSize(1, 1)
+        self.chart_label.hide()
+        self._pending_chart_key = None
+        self._render_task = None
+        # אנימציית טעינה בזמן שהגרף מרונדר
+        self._spinner_frame = 0
+        self._spinner_timer = QTimer(self)
+        self._spinner_timer.setInterval(120)
+        self._spinner_timer.timeout.connect(self._advance_spinner)
+        # רינדור מחדש לאחר שינוי גודל (בהשהיה כדי לא לרנדר בכל פיקסל)
+        self._chart_resize_timer = QTimer(self)
+        self._chart_resize_timer.setSingleShot(True)
+        self._chart_resize_timer.setInterval(250)
+        self._chart_resize_timer.timeout.connect(self._request_chart_render)
 
         # הוספת רכיבים לממשק
         bottom_buttons = QHBoxLayout()
@@ -437,6 +674,7 @@ class ExerciseTab(QWidget):
         bottom_buttons.addWidget(self.btn_pop)
         bottom_buttons.addWidget(self.btn_delete_row)
         bottom_buttons.addWidget(self.btn_duplicate_row)
+        bottom_buttons.addWidget(self.btn_bulk)
         bottom_buttons.addWidget(self.btn_plot)
         bottom_buttons.addWidget(self.btn_back)
 
@@ -447,7 +685,7 @@ class ExerciseTab(QWidget):
         layout.addWidget(self.input_container)
         layout.addLayout(bottom_buttons)
         layout.addWidget(self.table)
-        layout.addWidget(self.canvas)
+        layout.addWidget(self.chart_label)
 
         self.setLayout(layout)
 
@@ -485,115 +723,68 @@ class ExerciseTab(QWidget):
         if self.btn_add.isEnabled():
             self.add_entry()
 
-    def _calculate_total_weight(self):
-        """חישוב סך המשקל המצטבר מכל האימונים"""
-        total = 0
-        for row in range(self.table.rowCount()):
+    def _table_rows(self) -> list[list[str]]:
+        """תוכן הטבלה כשורות טקסט"""
+        return [[self.table.item(r, c).text() if self.table.item(r, c) else ""
+                 for c in range(self.table.columnCount())]
+                for r in range(self.table.rowCount())]
+
+    def _archived(self):
+        """הארכיון של התרגיל, או None אם אין"""
+        if not self._archive_loaded:
+            self._archive_loaded = True
             try:
-                items = [self.table.item(row, i) for i in [3, 2, 1, 0]]  # weight, sets, reps, last_reps
-                
-                # בדיקה מקיפה של תקינות הנתונים
-                if not all(isinstance(item, QTableWidgetItem) and item.text() for item in items):
-                    continue
+                self._archive = archive.open_archive(self.profile_name, self.exercise_name)
+            except (OSError, ValueError) as e:
+                self._archive = None
+                self._show_status(f"שגיאה בקריאת הארכיון: {e}")
+        return self._archive
+
+    def _release_archive(self):
+        """סגירת קבצי הארכיון (לפני שינוי שם/מחיקה); ייפתחו מחדש בשימוש הבא"""
+        if self._archive is not None:
+            self._archive.close()
+        self._archive = None
+        self._archive_loaded = False
+
+    def _history_rows(self) -> list[list[str]]:
+        """כל ההיסטוריה - ארכיון ואחריו הטבלה"""
+        archived = self._archived()
+        return (archived.rows() if archived else []) + self._table_rows()
 
-                # המרת הערכים למספרים
-                weight = float(items[0].text().split()[0].replace(",", "."))
-                sets = int(items[1].text())
-                reps = int(items[2].text())
-                last_reps = int(items[3].text())
-                
-                # חישוב: (סטים-1 * חזרות * משקל) + (סט אחרון * משקל)
-                total += ((sets - 1) * reps * weight) + (last_reps * weight)
-            except (ValueError, AttributeError, IndexError):
-                continue
-        return total
+    def _calculate_total_weight(self):
+        """חישוב סך המשקל המצטבר מכל האימונים (כולל הארכיון)"""
+        archived = self._archived()
+        return total_volume(self._table_rows()) + (archived.total_volume if archived else 0.0)
 
+    @traced
     def _update_summary(self):
         """עדכון תוויות הסיכום"""
-        # עדכון מספר התרגילים
-        exercises_count = self.table.rowCount()
-        self.total_exercises_label.setText(f'<div style="text-align: center;">תרגילים<br><span style="font-size: 24pt;">{exercises_count}</span><br><span style="font-size: 32pt;">💪</span></div>')
+        # עדכון מספר התרגילים (כולל הארכיון)
+        archived = self._archived()
+        exercises_count = self.table.rowCount() + (len(archived) if archived else 0)
+        self.total_exercises_label.set_value(str(exercises_count))
         
         # עדכון סך המשקל
         total_weight = self._calculate_total_weight()
-        self.total_weight_label.setText(f'<div style="text-align: center;">משקל שהרמתי<br><span style="font-size: 24pt;">{total_weight:,.0f} ק"ג</span><br><span style="font-size: 32pt;">🏋️</span></div>')
+        self.total_weight_label.set_value(f'{total_weight:,.0f} ק"ג')
         
         # עדכון משקל ממוצע לסט
-        if exercises_count > 0:
-            avg_weight = total_weight / exercises_count
-            self.avg_weight_label.setText(f'<div style="text-align: center;">משקל לסט<br><span style="font-size: 24pt;">{avg_weight:,.0f} ק"ג</span><br><span style="font-size: 32pt;">📊</span></div>')
-        else:
-            self.avg_weight_label.setText('<div style="text-align: center;">משקל לסט<br><span style="font-size: 24pt;">0 ק"ג</span><br><span style="font-size: 32pt;">📊</span></div>')
+        avg_weight = total_weight / exercises_count if exercises_count > 0 else 0
+        self.avg_weight_label.set_value(f'{avg_weight:,.0f} ק"ג')
         
         # עדכון רמת התקדמות
         self._update_progress_level(exercises_count)
     
     def _update_progress_level(self, exercises_count):
         """עדכון רמת התקדמות על פי מספר האימונים"""
-        # הגדרת שלבים
-        levels = [
-            (0, 10, "טירון", "🌱", 0),
-            (10, 30, "מתחיל", "🌿", 1),
-            (30, 60, "מתקדם", "🌳", 2),
-            (60, 100, "מומחה", "🏆", 3),
-            (100, float('inf'), "אגדי", "👑", 4)
-        ]
-        
-        # מציאת הרמה הנוכחית
-        current_level = levels[0]
-        for level in levels:
-            min_val, max_val, name, emoji, level_num = level
-            if min_val <= exercises_count < max_val:
-                current_level = level
-                break
-        
-        min_val, max_val, level_name, emoji, level_num = current_level
-        
-        # חישוב אחוזי התקדמות ברמה הנוכחית
-        if max_val == float('inf'):
-            progress_percent = 100
-            next_milestone = "מקסימום!"
-        else:
-            progress_in_level = exercises_count - min_val
-            level_range = max_val - min_val
-            progress_percent = (progress_in_level / level_range) * 100
-            next_milestone = f"עד {max_val}"
-        
-        # יצירת פס התקדמות ויזואלי
-        # 3 קווים מייצגים את השלבים
-        total_levels = 5
-        filled_levels = level_num
-        
-        # יצירת פס עם נקודות
-        progress_dots = ""
-        for i in range(total_levels):
-            if i < filled_levels:
-                progress_dots += "●"  # נקודה מלאה
-            elif i == filled_levels:
-                # נקודה חלקית על פי האחוז
-                if progress_percent >= 66:
-                    progress_dots += "◉"  # כמעט מלא
-                elif progress_percent >= 33:
-                    progress_dots += "◔"  # חצי
-                else:
-                    progress_dots += "○"  # ריק
-            else:
-                progress_dots += "○"  # נקודה ריקה
-            
-            if i < total_levels - 1:
-                progress_dots += "━"  # קו מחבר
-        
-        # עדכון התווית
-        progress_html = f'''
-        <div style="text-align: center;">
-            <span style="font-size: 14pt;">רמה</span><br>
-            <span style="font-size: 22pt; font-weight: bold;">{level_name}</span><br>
-            <span style="font-size: 28pt;">{emoji}</span><br>
-            <span style="font-size: 12pt;">{progress_dots}</span><br>
-            <span style="font-size: 11pt;">{exercises_count} תרגילים | {next_milestone}</span>
-        </div>
-        '''
-        self.progress_label.setText(progress_html)
+        level = progress_level(exercises_count)
+        card = self.progress_label
+        card.set_value(level.name)
+        card.set_icon(level.emoji)
+        card.set_progress(level.dots)
+        # RLM - השורה מתחילה במספר, וכיוון הפסקה צריך להיות מימין לשמאל
+        card.set_footer(f"\u200f{exercises_count} תרגילים | {level.next_milestone}")
 
     def add_entry(self):
         weight_raw = self.input_weight.text().strip().replace(",", ".")
@@ -645,6 +836,54 @@ class ExerciseTab(QWidget):
         self.btn_pop.setEnabled(True)
         self._show_status(f"התווסף: {weight_str} Kg, {sets_val}x{reps_val}")
 
+    def add_entries(self, rows: list[list[str]], skip_existing: bool = False) -> int:
+        """הוספת רשומות רבות כפעולה אחת: רשומת undo אחת וחישוב סיכום אחד.
+
+        rows בפורמט הטבלה. עם skip_existing=True מדלגים על רשומות שכבר
+        קיימות בהיסטוריה - בטבלה או בארכיון (למשל ייבוא חוזר של אותו קובץ).
+        מחזיר כמה נוספו.
+        """
+        if skip_existing:
+            existing = Counter(tuple(row) for row in self._history_rows())
+            fresh = []
+            for row in rows:
+                key = tuple(str(v) for v in row)
+                if existing[key] > 0:
+                    existing[key] -= 1
+                else:
+                    fresh.append(row)
+            rows = fresh
+        if not rows:
+            return 0
+
+        self._save_state_to_undo()
+        self.table.setUpdatesEnabled(False)
+        try:
+            start = self.table.rowCount()
+            self.table.setRowCount(start + len(rows))
+            for offset, row_data in enumerate(rows):
+                for col, value in enumerate(row_data):
+                    item = QTableWidgetItem(str(value))
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignVCenter)
+                    self.table.setItem(start + offset, col, item)
+        finally:
+            self.table.setUpdatesEnabled(True)
+
+        self._has_unsaved_changes = True
+        self.btn_pop.setEnabled(True)
+        self._update_summary()
+        return len(rows)
+
+    def open_bulk_entry(self, from_clipboard: bool = False):
+        """פתיחת חלון הזנה מרובה; הרשומות נכנסות כפעולה אחת"""
+        text = QApplication.clipboard().text() if from_clipboard else ""
+        dialog = BulkEntryDialog(self.exercise_name, text, self)
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+        added = self.add_entries(dialog.rows)
+        if added:
+            self._show_status(f"התווספו {added} רשומות")
+
     def pop_last(self):
         rows = self.table.rowCount()
         if rows > 0:
@@ -656,6 +895,7 @@ class ExerciseTab(QWidget):
             self._update_summary()
             self._show_status("נמחק האחרון.")
 
+    @traced
     def plot_selected_exercise(self):
         # הסתר את האזורים שלא נחוצים בתצוגת גרף
         self.input_container.hide()
@@ -664,131 +904,147 @@ class ExerciseTab(QWidget):
         self.btn_pop.hide()
         self.btn_delete_row.hide()
         self.btn_duplicate_row.hide()
+        self.btn_bulk.hide()
         self.btn_plot.hide()
         self.btn_back.show()
 
-        # אסוף את כל הנתונים מהטבלה
-        points: list[tuple[datetime, float]] = []
-        for r in range(self.table.rowCount()):
-            date_item = self.table.item(r, 4)
-            weight_item = self.table.item(r, 3)
-            try:
-                wval = float(weight_item.text().split()[0].replace(",", ".")) if weight_item else 0.0
-                dval = datetime.strptime(date_item.text().strip(), "%d/%m/%Y") if date_item else datetime.now()
-                points.append((dval, wval))
-            except (ValueError, AttributeError):
-                continue
+        if not _HAS_MPL:
+            self._show_status("matplotlib לא מותקן - לא ניתן להציג גרף")
+            return
 
+        self.chart_label.show()
+        self._request_chart_render()
+
+    def _collect_chart_points(self) -> list[tuple[datetime, float]]:
+        """איסוף נקודות (תאריך, משקל) מהארכיון ומהטבלה"""
+        archived = self._archived()
+        return (archived.chart_points() if archived else []) + chart_points(self._table_rows())
+
+    def archive_old_entries(self, keep_recent: int = archive.ARCHIVE_KEEP_RECENT):
+        """העברת הרשומות הישנות למקטע ארכיון; בטבלה נשארות keep_recent האחרונות"""
+        old_rows, recent_rows = archive.split_rows(self._table_rows(), keep_recent)
+        if not old_rows:
+            self._show_status(f"אין מספיק רשומות ישנות להעברה (נשמרות {keep_recent} אחרונות)")
+            return 0
+        self._release_archive()
+        archive.write_segment(self.profile_name, self.exercise_name, old_rows)
+        # המצבים הקודמים כוללים את השורות שעברו - Undo שלהם היה משכפל אותן
+        self._history.clear()
+        self._restore_table_state(recent_rows)
+        self.save_state()
+        self._show_status(f"הועברו {len(old_rows):,} רשומות לארכיון")
+        return len(old_rows)
+
+    def _chart_target_size(self) -> tuple[int, int]:
+        """גודל התמונה לפי השטח הפנוי בטאב בתצוגת גרף"""
+        width = max(self.width() - 20, 320)
+        height = max(self.height() - self.btn_back.sizeHint().height() - 40, 240)
+        return width, height
+
+    def _request_chart_render(self):
+        """הצגת הגרף מהמטמון, או שליחת רינדור ל-thread רקע"""
+        if not self.chart_label.isVisible():
+            return
+        points = self._collect_chart_points()
         if not points:
+            self._stop_spinner()
+            self.chart_label.clear()
             self._show_status("אין רשומות להצגה")
             return
 
-        # מיין לפי תאריך
-        points.sort(key=lambda x: x[0])
-        xs = [p[0] for p in points]
-        ys = [p[1] for p in points]
-
-        # צייר גרף קווי עם ציר תאריכים
-        self.figure.clear()
-        # הגדר סגנון גרף
-        self.figure.patch.set_facecolor('#ffffff')
-        ax = self.figure.add_subplot(111)
-        ax.set_facecolor('#f8f9fa')
-        
-        dates = mdates.date2num(xs)
-        
-        # ציור הקו הבסיסי
-        ax.plot(dates, ys, '-', color='#2196F3', linewidth=3, alpha=0.7)
-        
-        # הוספת נקודות צבעוניות לפי עלייה/ירידה/ללא שינוי
-        for i, y in enumerate(ys):
-            if i == 0:
-                color, size = '#2196F3', 120
-            elif y > ys[i-1]:
-                color, size = '#4CAF50', 140
-            elif y < ys[i-1]:
-                color, size = '#f44336', 140
-            else:
-                color, size = '#FF9800', 120
-            
-            ax.scatter(dates[i], y, s=size, c=color, marker='o', 
-                      edgecolors='white', linewidths=2.5, zorder=5, alpha=0.9)
-        
-        ax.xaxis.set_major_locator(mdates.AutoDateLocator())
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%d/%m/%Y'))
-        self.figure.autofmt_xdate(rotation=30)
-        
-        # כותרת מעוצבת וגדולה יותר - מסגרת קטנה יותר
-        LRM = '\u200E'
+        width, height = self._chart_target_size()
         title = f"גרף משקלים - {self.exercise_name}"
-        ax.set_title(f"{LRM}{title[::-1]}", 
-                    fontsize=18,           # גודל גדול יותר
-                    fontweight='bold',     # מודגש
-                    pad=20,                # ריווח מהגרף
-                    color='#1976D2',       # צבע כחול כהה
-                    bbox=dict(boxstyle='round,pad=0.5', facecolor='#E3F2FD', 
-                             edgecolor='#2196F3', linewidth=1.5))  # מסגרת קטנה יותר
-        
-        # הוספת kg למספרים על ציר Y
-        from matplotlib.ticker import FuncFormatter
-        def kg_formatter(x, pos):
-            return f'{int(x)} kg'
-        ax.yaxis.set_major_formatter(FuncFormatter(kg_formatter))
-        
-        # הגדרת רשת עדינה ויפה יותר
-        ax.grid(True, linestyle='--', alpha=0.4, color='#BDBDBD', linewidth=0.8)
-        ax.grid(True, which='minor', linestyle=':', alpha=0.2, color='#E0E0E0')
-        ax.set_axisbelow(True)  # הרשת מאחורי הנתונים
-        
-        # עיצוב שולי הגרף - מסגרת מעוצבת יותר
-        spine_colors = {
-            'top': '#64B5F6',
-            'bottom': '#1976D2', 
-            'left': '#1976D2',
-            'right': '#64B5F6'
-        }
-        
-        for position, spine in ax.spines.items():
-            spine.set_color(spine_colors.get(position, '#90A4AE'))
-            spine.set_linewidth(2.5)
-            spine.set_capstyle('round')
-            
-        # התאמת צבע וגודל תוויות הצירים
-        ax.tick_params(axis='both', colors='#424242', labelsize=10, width=1.5, length=6)
-        ax.tick_params(axis='x', rotation=0)  # תיקון זווית
-        
-        # הוספת צל עדין לאזור הגרף
-        ax.set_facecolor('#FAFAFA')
-        
-        # שיפור המרווחים
-        self.figure.tight_layout(pad=2.0)
-        
-        self.canvas.draw()
-        self.canvas.show()
+        key = chart_cache_key(title, points, width, height)
+        if key == self._pending_chart_key:
+            return  # רינדור זהה כבר בדרך
+
+        cached = chart_cache.get(key)
+        if cached is not None:
+            self._pending_chart_key = None
+            self._show_chart_image(cached)
+            return
 
-    def save_state(self):
-        state = {"rows": [[self.table.item(r, c).text() if self.table.item(r, c) else "" 
-                          for c in range(self.table.columnCount())] 
-                         for r in range(self.table.rowCount())]}
+        def render():
+            with trace.span("chart.render"):
+                data = render_weight_chart(title, points, width, height)
+            chart_cache.put(key, data)
+            return key, data
+
+        self._pending_chart_key = key
+        self._start_spinner()
+        task = BackgroundTask(render)
+        task.signals.finished.connect(self._on_chart_rendered)
+        task.signals.failed.connect(self._on_chart_failed)
+        self._render_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def _on_chart_rendered(self, result):
+        key, data = result
+        # תוצאה של בקשה ישנה (הנתונים או הגודל השתנו בינתיים) - מתעלמים
+        if key != self._pending_chart_key:
+            return
+        self._pending_chart_key = None
+        self._render_task = None
+        self._show_chart_image(data)
+
+    def _on_chart_failed(self, message: str):
+        # כשל של רינדור שכבר הוחלף (או של טאב שמוחזר למאגר) - מתעלמים
+        if self._render_task is None or self.sender() is not self._render_task.signals:
+            return
+        self._pending_chart_key = None
+        self._render_task = None
+        self._stop_spinner()
+        self.chart_label.setText("")
+        self._show_status(f"שגיאה בציור הגרף: {message}")
+
+    def _show_chart_image(self, data: bytes):
+        self._stop_spinner()
+        pixmap = QPixmap()
+        pixmap.loadFromData(data, "PNG")
+        self.chart_label.setPixmap(pixmap)
+
+    def _start_spinner(self):
+        self._spinner_frame = 0
+        self._advance_spinner()
+        self._spinner_timer.start()
+
+    def _stop_spinner(self):
+        self._spinner_timer.stop()
+
+    def _advance_spinner(self):
+        frames = "◐◓◑◒"
+        self.chart_label.setText(f"{frames[self._spinner_frame % len(frames)]} מצייר גרף...")
+        self._spinner_frame += 1
 
-        path = Path.cwd() / f"exercise_{self.profile_name}_{self.exercise_name}.json"
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self.chart_label.isVisible():
+            self._chart_resize_timer.start()
+
+    @traced
+    def save_state(self):
+        if self._load_error is not None:
+            # הטבלה לא מכילה את הנתונים שבקובץ - שמירה הייתה מוחקת אותם
+            self._show_status(f"לא נשמר: הקובץ של '{self.exercise_name}' לא נטען ({self._load_error})", 5000)
+            return
         try:
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(state, f, ensure_ascii=False, indent=2)
+            path = storage.save_exercise(self.profile_name, self.exercise_name, self._table_rows())
             self._has_unsaved_changes = False
             self._show_status(f"נשמר ל־{path}")
         except Exception as e:
             self._show_status(f"שגיאה בשמירה: {e}")
 
+    @traced
     def load_state(self):
-        path = Path.cwd() / f"exercise_{self.profile_name}_{self.exercise_name}.json"
+        self._release_archive()
+        self._load_error = None
+        path = storage.exercise_path(self.profile_name, self.exercise_name)
         if not path.exists():
             return
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                state = json.load(f)
+            rows = storage.load_rows(path)
             self.table.setRowCount(0)
-            for row_data in state.get("rows", []):
+            for row_data in rows:
                 r = self.table.rowCount()
                 self.table.insertRow(r)
                 for c, val in enumerate(row_data):
@@ -798,8 +1054,14 @@ class ExerciseTab(QWidget):
             self.btn_pop.setEnabled(self.table.rowCount() > 0)
             self._update_summary()
             self._show_status(f"טען מצב מ־{path}")
-        except Exception as e:
+        except (OSError, ValueError) as e:
+            # קובץ פגום או לא קריא - הטאב נשאר ריק, והשמירה חסומה כדי לא לדרוס אותו
+            self._load_error = str(e)
+            self.table.setRowCount(0)
             self._show_status(f"שגיאה בטעינה: {e}")
+            QMessageBox.warning(self, "שגיאה בטעינה",
+                                f"לא ניתן לטעון את '{self.exercise_name}':\n{e}\n\n"
+                                "הקובץ לא יידרס עד שייטען בהצלחה.")
 
     def _show_table_context_menu(self, pos):
         menu = QMenu()
@@ -827,9 +1089,12 @@ class ExerciseTab(QWidget):
         self.btn_pop.show()
         self.btn_delete_row.show()
         self.btn_duplicate_row.show()
+        self.btn_bulk.show()
         self.btn_plot.show()
         self.btn_back.hide()
-        self.canvas.hide()
+        self.chart_label.hide()
+        self._stop_spinner()
+        self._pending_chart_key = None
 
     def _update_delete_button(self):
         """עדכון מצב כפתור מחיקת שורה בהתאם לבחירה"""
@@ -883,23 +1148,14 @@ class ExerciseTab(QWidget):
         if self._is_restoring:
             return
         
-        # שומר את המצב הנוכחי לפני השינוי
-        state = self._get_current_table_state()
-        # אם זה המצב הראשון, או שהמצב שונה מהמצב האחרון במחסנית
-        if not self._undo_stack or state != self._undo_stack[-1]:
-            self._undo_stack.append(state)
-            # שמירה של מקסימום 5+1 מצבים (כולל המצב הנוכחי)
-            if len(self._undo_stack) > self._max_undo + 1:
-                self._undo_stack.pop(0)
-        # כאשר נעשית פעולה חדשה, מנקים את מחסנית ה-Redo
-        self._redo_stack.clear()
+        # שומר את המצב הנוכחי לפני השינוי; פעולה חדשה מנקה את מחסנית ה-Redo
+        self._history.push(self._get_current_table_state())
     
     def _get_current_table_state(self):
         """קבלת המצב הנוכחי של הטבלה"""
-        return [[self.table.item(r, c).text() if self.table.item(r, c) else "" 
-                for c in range(self.table.columnCount())] 
-               for r in range(self.table.rowCount())]
+        return self._table_rows()
     
+    @traced
     def _restore_table_state(self, state):
         """שחזור מצב הטבלה"""
         self._is_restoring = True  # מסמן שאנחנו בתהליך שחזור
@@ -919,19 +1175,12 @@ class ExerciseTab(QWidget):
     
     def undo(self):
         """ביטול הפעולה האחרונה"""
-        if len(self._undo_stack) < 1:
+        if not self._undo_stack:
             self._show_status("אין מה לבטל")
             return
         
-        # שמירת המצב הנוכחי ל-Redo (רק אם עדיין לא שמרנו אותו)
-        current_state = self._get_current_table_state()
-        if not self._redo_stack or current_state != self._redo_stack[-1]:
-            self._redo_stack.append(current_state)
-            if len(self._redo_stack) > self._max_undo:
-                self._redo_stack.pop(0)
-        
-        # שחזור המצב הקודם
-        previous_state = self._undo_stack.pop()
+        # שחזור המצב הקודם; המצב הנוכחי נשמר ל-Redo
+        previous_state = self._history.undo(self._get_current_table_state())
         self._restore_table_state(previous_state)
         self._has_unsaved_changes = True
         self._show_status("בוטל", 1000)
@@ -942,15 +1191,8 @@ class ExerciseTab(QWidget):
             self._show_status("אין מה לשחזר")
             return
         
-        # שמירת המצב הנוכחי ל-Undo
-        current_state = self._get_current_table_state()
-        if not self._undo_stack or current_state != self._undo_stack[-1]:
-            self._undo_stack.append(current_state)
-            if len(self._undo_stack) > self._max_undo + 1:
-                self._undo_stack.pop(0)
-        
-        # שחזור המצב מ-Redo
-        state = self._redo_stack.pop()
+        # שחזור המצב מ-Redo; המצב הנוכחי נשמר ל-Undo
+        state = self._history.redo(self._get_current_table_state())
         self._restore_table_state(state)
         self._has_unsaved_changes = True
         self._show_status("שוחזר", 1000)
@@ -990,7 +1232,7 @@ class ExerciseTab(QWidget):
         # תווית להצגת התאריך הנבחר
         date_label = QLabel()
         date_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        date_label.setStyleSheet("font-size: 12pt; padding: 10px; background-color: #E3F2FD; border-radius: 4px;")
+        styled(date_label, role="highlight")
         
         def update_label():
             selected = calendar.selectedDate()
@@ -1034,6 +1276,129 @@ class ExerciseTab(QWidget):
             self.table.clearFocus()
 
 
+class BulkEntryDialog(QDialog):
+    """הזנת כמה רשומות בבת אחת - שורה לכל רשומה"""
+    def __init__(self, exercise_name: str, text: str = "", parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(f"הזנה מרובה - {exercise_name}")
+        self.setModal(True)
+        self.setMinimumSize(460, 380)
+        self.rows: list[list[str]] = []
+
+        layout = QVBoxLayout()
+
+        instructions = QLabel("שורה לכל רשומה: משקל סטים חזרות [סט אחרון] [תאריך]\n"
+                              "לדוגמה: 60 3 10 8   או   62.5 3x10 01/10/2025")
+        styled(instructions, role="hint")
+        layout.addWidget(instructions)
+
+        self.text_edit = QPlainTextEdit()
+        self.text_edit.setPlainText(text)
+        layout.addWidget(self.text_edit)
+
+        self.preview_label = QLabel()
+        self.preview_label.setWordWrap(True)
+        layout.addWidget(self.preview_label)
+
+        self.button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        self.button_box.button(QDialogButtonBox.StandardButton.Ok).setText("הוסף")
+        self.button_box.button(QDialogButtonBox.StandardButton.Cancel).setText("ביטול")
+        self.button_box.accepted.connect(self.accept)
+        self.button_box.rejected.connect(self.reject)
+        layout.addWidget(self.button_box)
+
+        self.setLayout(layout)
+
+        # אימות מחדש רק אחרי הפסקה קצרה בהקלדה - לא בכל תו
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(200)
+        self._validate_timer.timeout.connect(self._validate)
+        self.text_edit.textChanged.connect(self._validate_timer.start)
+        self._validate()
+
+    def _validate(self):
+        self.rows, errors = parse_bulk_text(self.text_edit.toPlainText())
+        summary = f"{len(self.rows)} רשומות תקינות"
+        if errors:
+            summary += f", {len(errors)} שגויות (ידולגו):\n" + "\n".join(errors[:5])
+        restyle(self.preview_label, validation="error" if errors else "ok")
+        self.preview_label.setText(summary)
+        self.button_box.button(QDialogButtonBox.StandardButton.Ok).setEnabled(bool(self.rows))
+
+    def accept(self):
+        # אימות אחרון למקרה שהטיימר עוד לא רץ
+        self._validate_timer.stop()
+        self._validate()
+        if self.rows:
+            super().accept()
+
+
+class CropCanvas(QWidget):
+    """
+    תמונה קבועה ומעליה שכבת החיתוך (הכהיה מחוץ למעגל ומסגרת), שמצוירת
+    ישירות ב-paintEvent בלי להעתיק את התמונה. שינויים במעגל מצטברים
+    ומצוירים לכל היותר פעם אחת לכל רענון של המסך, ורק באזור שהשתנה.
+    """
+
+    def __init__(self, pixmap, parent=None):
+        super().__init__(parent)
+        self._pixmap = pixmap
+        self.setFixedSize(pixmap.size())
+        self._circle = QRectF()
+        self._dirty = QRectF()
+        self._overlay_color = QColor(0, 0, 0, 150)
+        self._border_pen = QPen(QColor("#2196F3"), 3)
+        self._frame_pen = QPen(QColor("#2196F3"), 2)
+
+        screen = QApplication.primaryScreen()
+        refresh_rate = screen.refreshRate() if screen is not None else 60
+        self._frame_timer = QTimer(self)
+        self._frame_timer.setSingleShot(True)
+        self._frame_timer.setInterval(max(1, int(1000 / (refresh_rate or 60))))
+        self._frame_timer.timeout.connect(self._flush)
+
+    def set_crop(self, x, y, diameter):
+        """מיקום המעגל החדש; הציור עצמו יתבצע בפריים הבא"""
+        circle = QRectF(x, y, diameter, diameter)
+        if circle == self._circle:
+            return
+        self._dirty = self._dirty.united(self._circle).united(circle)
+        self._circle = circle
+        if not self._frame_timer.isActive():
+            self._frame_timer.start()
+
+    def _flush(self):
+        # שוליים לעובי המסגרת ולהחלקת הקצוות
+        margin = self._border_pen.widthF() + 1
+        self.update(self._dirty.adjusted(-margin, -margin, margin, margin).toAlignedRect())
+        self._dirty = QRectF()
+
+    def paintEvent(self, event):
+        rect = event.rect()
+        painter = QPainter(self)
+        try:
+            painter.drawPixmap(rect, self._pixmap, rect)
+            painter.setClipRect(rect)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+            # הכהיה של כל מה שמחוץ למעגל - מלבן פחות עיגול (OddEven)
+            overlay = QPainterPath()
+            overlay.setFillRule(Qt.FillRule.OddEvenFill)
+            overlay.addRect(QRectF(self.rect()))
+            overlay.addEllipse(self._circle)
+            painter.fillPath(overlay, self._overlay_color)
+
+            # גבול המעגל ומסגרת התמונה
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.setPen(self._border_pen)
+            painter.drawEllipse(self._circle)
+            painter.setPen(self._frame_pen)
+            painter.drawRect(QRectF(self.rect()).adjusted(1, 1, -1, -1))
+        finally:
+            painter.end()
+
+
 class ImageCropDialog(QDialog):
     """דיאלוג לחיתוך אזור עגול מתמונה"""
     def __init__(self, image_path, parent=None):
@@ -1064,61 +1429,32 @@ class ImageCropDialog(QDialog):
         layout = QVBoxLayout()
         
         # כותרת
-        title_label = QLabel("✂️ בחר את האזור לחיתוך")
-        title_label.setStyleSheet("font-size: 14pt; font-weight: bold; color: #2196F3; padding: 10px;")
+        title_label = styled(QLabel("✂️ בחר את האזור לחיתוך"), role="title")
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title_label)
         
         # הוראות
-        instructions = QLabel("גרור את המעגל למיקום הרצוי, השתמש בגלגלת לשינוי גודל")
-        instructions.setStyleSheet("font-size: 10pt; color: #666; padding: 5px;")
+        instructions = styled(QLabel("גרור את המעגל למיקום הרצוי, השתמש בגלגלת לשינוי גודל"), role="hint")
         instructions.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(instructions)
         
-        # תווית התמונה
-        self.image_label = QLabel()
-        self.image_label.setFixedSize(display_pixmap.width(), display_pixmap.height())
-        self.image_label.setPixmap(display_pixmap)
-        self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.image_label.setStyleSheet("border: 2px solid #2196F3;")
-        
-        # שמירת התמונה המקורית לתצוגה
-        self.display_pixmap = display_pixmap
+        # התמונה ושכבת החיתוך
+        self.canvas = CropCanvas(display_pixmap)
         
         # הוספה למרכז
         image_container = QHBoxLayout()
         image_container.addStretch()
-        image_container.addWidget(self.image_label)
+        image_container.addWidget(self.canvas)
         image_container.addStretch()
         layout.addLayout(image_container)
         
         # כפתורים
         button_layout = QHBoxLayout()
         
-        cancel_button = QPushButton("❌ ביטול")
-        cancel_button.setStyleSheet("""
-            QPushButton {
-                background-color: #f44336;
-                color: white;
-                padding: 10px 20px;
-                font-size: 11pt;
-                border-radius: 5px;
-            }
-            QPushButton:hover { background-color: #d32f2f; }
-        """)
+        cancel_button = styled(QPushButton("❌ ביטול"), variant="danger", scale="medium")
         cancel_button.clicked.connect(self.reject)
         
-        crop_button = QPushButton("✂️ חתוך")
-        crop_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                padding: 10px 20px;
-                font-size: 11pt;
-                border-radius: 5px;
-            }
-            QPushButton:hover { background-color: #45a049; }
-        """)
+        crop_button = styled(QPushButton("✂️ חתוך"), variant="success", scale="medium")
         crop_button.clicked.connect(self.accept)
         
         button_layout.addWidget(cancel_button)
@@ -1134,14 +1470,14 @@ class ImageCropDialog(QDialog):
         self.last_pos = None
         
         # התקנת event filter
-        self.image_label.installEventFilter(self)
+        self.canvas.installEventFilter(self)
         
         # שרטוט ראשוני
         self.update_display()
     
     def eventFilter(self, obj, event):
         """טיפול באירועי עכבר"""
-        if obj == self.image_label:
+        if obj == self.canvas:
             if event.type() == event.Type.MouseButtonPress:
                 # בדוק אם לחצו בתוך המעגל
                 pos = event.position()
@@ -1165,8 +1501,8 @@ class ImageCropDialog(QDialog):
                     self.crop_y += dy
                     
                     # הגבלה לגבולות התמונה
-                    self.crop_x = max(0, min(self.crop_x, self.image_label.width() - self.crop_diameter))
-                    self.crop_y = max(0, min(self.crop_y, self.image_label.height() - self.crop_diameter))
+                    self.crop_x = max(0, min(self.crop_x, self.canvas.width() - self.crop_diameter))
+                    self.crop_y = max(0, min(self.crop_y, self.canvas.height() - self.crop_diameter))
                     
                     self.last_pos = pos
                     self.update_display()
@@ -1184,7 +1520,7 @@ class ImageCropDialog(QDialog):
                 
                 new_diameter = self.crop_diameter + change
                 min_size = 50
-                max_size = min(self.image_label.width(), self.image_label.height())
+                max_size = min(self.canvas.width(), self.canvas.height())
                 
                 if min_size <= new_diameter <= max_size:
                     # שמור על המרכז
@@ -1198,8 +1534,8 @@ class ImageCropDialog(QDialog):
                     self.crop_y = center_y - self.crop_diameter // 2
                     
                     # הגבלה לגבולות
-                    self.crop_x = max(0, min(self.crop_x, self.image_label.width() - self.crop_diameter))
-                    self.crop_y = max(0, min(self.crop_y, self.image_label.height() - self.crop_diameter))
+                    self.crop_x = max(0, min(self.crop_x, self.canvas.width() - self.crop_diameter))
+                    self.crop_y = max(0, min(self.crop_y, self.canvas.height() - self.crop_diameter))
                     
                     self.update_display()
                 return True
@@ -1207,39 +1543,8 @@ class ImageCropDialog(QDialog):
         return super().eventFilter(obj, event)
     
     def update_display(self):
-        """עדכון התצוגה עם המעגל"""
-        # שכפול התמונה המקורית
-        display_pixmap = self.display_pixmap.copy()
-        
-        # שימוש ב-context manager כדי להבטיח סגירה נכונה
-        painter = QPainter(display_pixmap)
-        try:
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-            
-            # ציור רקע כהה למחוץ למעגל
-            painter.setBrush(QColor(0, 0, 0, 150))
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawRect(display_pixmap.rect())
-            
-            # ציור המעגל (החלק הנבחר) - מחיקת הרקע הכהה בתוכו
-            path = QPainterPath()
-            path.addEllipse(self.crop_x, self.crop_y, self.crop_diameter, self.crop_diameter)
-            
-            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_DestinationOut)
-            painter.fillPath(path, QColor(0, 0, 0, 150))
-            
-            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
-            
-            # ציור גבול המעגל
-            pen = QPen(QColor("#2196F3"), 3)
-            painter.setPen(pen)
-            painter.setBrush(Qt.BrushStyle.NoBrush)
-            painter.drawEllipse(self.crop_x, self.crop_y, self.crop_diameter, self.crop_diameter)
-        finally:
-            painter.end()
-        
-        # עכשיו אפשר להציב את הpixmap בבטחה
-        self.image_label.setPixmap(display_pixmap)
+        """עדכון מיקום המעגל בתצוגה (הציור מתבצע ב-CropCanvas, פעם בפריים)"""
+        self.canvas.set_crop(self.crop_x, self.crop_y, self.crop_diameter)
     
     def get_cropped_pixmap(self):
         """קבלת התמונה החתוכה"""
@@ -1273,11 +1578,18 @@ class ImageCropDialog(QDialog):
         return result
 
 
-def create_circular_pixmap(image_path, size):
-    """יצירת תמונה עגולה מתמונה מלבנית"""
-    # טעינת התמונה המקורית
-    source = QPixmap(image_path)
-    
+# גדלי התמונות הממוזערות של תמונת הפרופיל
+THUMB_TOOLBAR = 56
+THUMB_PROFILE_VIEW = 120
+THUMB_PROFILE_EDIT = 100
+THUMB_LIST = 32
+
+# מטמון תמונות ממוזערות: בזיכרון (QPixmapCache) ובדיסק (thumbnail_cache/ בתיקיית המטמון של המשתמש)
+_thumbnail_disk_cache = ThumbnailDiskCache()
+
+
+def _render_circular(source, size):
+    """תמונה עגולה בגודל size מתמונה מלבנית (ממורכזת וחתוכה)"""
     # יצירת pixmap חדש עם רקע שקוף
     target = QPixmap(size, size)
     target.fill(Qt.GlobalColor.transparent)
@@ -1312,66 +1624,730 @@ def create_circular_pixmap(image_path, size):
     return target
 
 
-class MainWindow(QMainWindow):
-    def __init__(self):
-        super().__init__()
+def _render_toolbar_avatar(source, size=THUMB_TOOLBAR):
+    """תמונה עגולה עם מסגרת כחולה ל-toolbar (עיגול של size-6 במרכז)"""
+    inner = size - 6
+    final_pixmap = QPixmap(size, size)
+    final_pixmap.fill(Qt.GlobalColor.transparent)
 
-        # הגדרות חלון ראשי
-        self.setWindowTitle(get_version_string())
-        self.setMinimumSize(QSize(800, 600))
-        self.showMaximized()  # פתיחה במסך מלא
-        
-        # הגדרת אייקון החלון
-        self._set_window_icon()
+    painter = QPainter(final_pixmap)
+    try:
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
 
-        # יצירת סטטוס בר
-        self.setStatusBar(QStatusBar())
+        # יצירת path עגול לתמונה (עם שוליים של 3 פיקסלים למסגרת)
+        path = QPainterPath()
+        path.addEllipse(3, 3, inner, inner)
+        painter.setClipPath(path)
+
+        # רינדור התמונה בגודל המתאים
+        scaled = source.scaled(inner, inner, Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+                               Qt.TransformationMode.SmoothTransformation)
+        x_offset = (inner - scaled.width()) // 2 + 3
+        y_offset = (inner - scaled.height()) // 2 + 3
+        painter.drawPixmap(x_offset, y_offset, scaled)
+
+        # ביטול ה-clip לציור הבורדר
+        painter.setClipping(False)
+
+        # ציור בורדר עגול
+        pen = QPen(QColor("#2196F3"), 3)
+        painter.setPen(pen)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawEllipse(2, 2, size - 4, size - 4)
+    finally:
+        painter.end()
+    return final_pixmap
+
+
+_THUMBNAIL_RENDERERS = {
+    "circle": _render_circular,
+    "toolbar": _render_toolbar_avatar,
+}
+
+
+def _pixmap_png_bytes(pixmap, quality=-1) -> bytes:
+    """קידוד QPixmap או QImage ל-PNG בזיכרון"""
+    buffer = QBuffer()
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    if not pixmap.save(buffer, "PNG", quality):
+        raise OSError("שגיאה בקידוד התמונה")
+    return bytes(buffer.data())
+
+
+def prefetch_thumbnail(image_path, size, style="circle"):
+    """
+    החלק של cached_thumbnail שלא תלוי ב-GUI thread: בחירת הגרסה, המפתח
+    וקריאת הקובץ ממטמון הדיסק. מחזיר (נתיב, מפתח, בייטים או None).
+    """
+    image_path = pick_variant(image_path, size)
+    key = thumbnail_key(image_path, size, style)
+    data = _thumbnail_disk_cache.get(key) if key is not None else None
+    return image_path, key, data
+
+
+def cached_thumbnail(image_path, size, style="circle", prefetched=None):
+    """
+    תמונה ממוזערת של image_path בסגנון style ("circle" / "toolbar").
+    נלקחת מ-QPixmapCache, אחר כך ממטמון הדיסק; רק אם שניהם מחטיאים
+    מפוענחת הגרסה הקטנה ביותר שמספיקה לגודל (ראו build_image_pyramid).
+    prefetched - תוצאה של prefetch_thumbnail מ-thread רקע.
+    QPixmap ריק אם לא ניתן לטעון את התמונה.
+    """
+    if prefetched is None:
+        image_path = pick_variant(image_path, size)
+        key = thumbnail_key(image_path, size, style)
+        data = None
+    else:
+        image_path, key, data = prefetched
+    if key is None:
+        return QPixmap()
+    pixmap = QPixmapCache.find(key)
+    if pixmap is not None:
+        return pixmap
+
+    pixmap = QPixmap()
+    if data is None:
+        data = _thumbnail_disk_cache.get(key)
+    if data is None or not pixmap.loadFromData(data, "PNG"):
+        source = QPixmap(str(image_path))
+        if source.isNull():
+            return QPixmap()
+        pixmap = _THUMBNAIL_RENDERERS[style](source, size)
+        _thumbnail_disk_cache.put(key, _pixmap_png_bytes(pixmap))
+    QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+# דחיסת PNG בשמירה (ב-Qt: 0 = דחיסה מקסימלית, 100 = ללא דחיסה)
+_PNG_QUALITY = 0
+
+
+def _save_image_atomic(image, path):
+    tmp_path = f"{path}.tmp"
+    if not image.save(tmp_path, "PNG", _PNG_QUALITY):
+        raise OSError(f"שגיאה בשמירת {path}")
+    os.replace(tmp_path, path)
+
+
+def build_image_pyramid(image, store):
+    """
+    שמירת תמונת פרופיל חתוכה (QImage) בגודל עד PROFILE_IMAGE_MAX במאגר
+    הנכסים, ולצידה גרסאות מוקטנות לכל אחד מ-PYRAMID_SIZES שקטן ממנה.
+    רץ ב-thread רקע (QImage בלבד, בלי QPixmap). תמונה שכבר קיימת במאגר
+    לא נכתבת שוב, וגם גרסאות קיימות שלה. מחזיר את ההפניה לנכס.
+    """
+    smooth = Qt.TransformationMode.SmoothTransformation
+    keep_aspect = Qt.AspectRatioMode.KeepAspectRatio
+    if max(image.width(), image.height()) > PROFILE_IMAGE_MAX:
+        image = image.scaled(PROFILE_IMAGE_MAX, PROFILE_IMAGE_MAX, keep_aspect, smooth)
+    ref = store.add(_pixmap_png_bytes(image, _PNG_QUALITY))
+    path = store.path(ref)
+    for size in PYRAMID_SIZES:
+        if size >= max(image.width(), image.height()):
+            break
+        variant = variant_path(path, size)
+        if not variant.exists():
+            _save_image_atomic(image.scaled(size, size, keep_aspect, smooth), str(variant))
+    return ref
+
+
+def create_circular_pixmap(image_path, size):
+    """יצירת תמונה עגולה מתמונה מלבנית (דרך מטמון התמונות הממוזערות)"""
+    pixmap = cached_thumbnail(image_path, size, "circle")
+    if pixmap.isNull():
+        pixmap = QPixmap(size, size)
+        pixmap.fill(Qt.GlobalColor.transparent)
+    return pixmap
+
+
+# אייקון האפליקציה מצויר בכל הגדלים האלה; להעלות את הגרסה כשהציור משתנה
+APP_ICON_SIZES = (16, 24, 32, 48, 64, 128, 256)
+APP_ICON_VERSION = 1
+
+
+def _app_icon_name(size) -> str:
+    return f"app_icon_{size}.png"
+
+
+def render_app_icon(size) -> QImage:
+    """ציור האייקון (עיגול כחול עם משקולת) בגודל size; QImage - אפשר גם בלי חלון"""
+    scale = size / 128
+    image = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)  # רקע שקוף
+
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+
+    # עיגול עם גרדיאנט
+    gradient = QLinearGradient(0, 0, size, size)
+    gradient.setColorAt(0, QColor(33, 150, 243))    # כחול בהיר #2196F3
+    gradient.setColorAt(1, QColor(25, 118, 210))    # כחול כהה #1976D2
+    painter.setBrush(QBrush(gradient))
+    painter.setPen(QPen(QColor(21, 101, 192), 3 * scale))  # מסגרת כחולה כהה
+    inset = 2 * scale
+    painter.drawEllipse(QRectF(inset, inset, size - 2 * inset, size - 2 * inset))
+
+    # הבר האמצעי של המשקולת
+    painter.setPen(QPen(QColor(255, 255, 255), 6 * scale, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap))
+    bar_y = size / 2
+    bar_left = size * 0.3
+    bar_right = size * 0.7
+    painter.drawLine(QPointF(bar_left, bar_y), QPointF(bar_right, bar_y))
+
+    # המשקולות משני הצדדים
+    weight_size = size * 0.15
+    painter.setBrush(QBrush(QColor(255, 255, 255)))
+    painter.setPen(QPen(QColor(224, 224, 224), 2 * scale))
+    left_rect = QRectF(bar_left - weight_size, bar_y - weight_size, weight_size * 2, weight_size * 2)
+    right_rect = QRectF(bar_right - weight_size, bar_y - weight_size, weight_size * 2, weight_size * 2)
+    painter.drawEllipse(left_rect)
+    painter.drawEllipse(right_rect)
+
+    # שלוש נקודות דקורטיביות במרכז כל משקולת (בגדלים קטנים הן רק מלכלכות)
+    if size >= 48:
+        painter.setPen(QPen(QColor(33, 150, 243), 2 * scale))
+        for rect in (left_rect, right_rect):
+            center = rect.center()
+            for offset in (-5, 0, 5):
+                painter.drawPoint(QPointF(center.x(), center.y() + offset * scale))
+
+    painter.end()
+    return image
+
+
+def write_icon_set(directory) -> list[Path]:
+    """ציור האייקון בכל APP_ICON_SIZES ושמירה ל-directory; מחזיר את הקבצים"""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    written = []
+    for size in APP_ICON_SIZES:
+        path = directory / _app_icon_name(size)
+        _save_image_atomic(render_app_icon(size), str(path))
+        written.append(path)
+    return written
+
+
+def _icon_set_dirs() -> list[Path]:
+    """איפה מחפשים את האייקונים: משאב ארוז (build.py), ואז מטמון המשתמש"""
+    return [resource_dir() / "icons", user_cache_dir() / "icons" / f"v{APP_ICON_VERSION}"]
+
+
+def load_app_icon() -> QIcon:
+    """
+    אייקון האפליקציה מקבצים מוכנים. הציור קורה רק אם אין סט שלם בשום
+    מקום, ואז הסט נשמר במטמון המשתמש להפעלות הבאות. QIcon טוען כל גודל
+    רק כשמבקשים אותו.
+    """
+    for directory in _icon_set_dirs():
+        paths = [directory / _app_icon_name(size) for size in APP_ICON_SIZES]
+        if all(path.is_file() for path in paths):
+            break
+    else:
+        try:
+            paths = write_icon_set(_icon_set_dirs()[-1])
+        except OSError:
+            # אין הרשאת כתיבה למטמון - מציירים בזיכרון בלבד
+            icon = QIcon()
+            for size in APP_ICON_SIZES:
+                icon.addPixmap(QPixmap.fromImage(render_app_icon(size)))
+            return icon
+    icon = QIcon()
+    for size, path in zip(APP_ICON_SIZES, paths):
+        icon.addFile(str(path), QSize(size, size))
+    return icon
+
+
+def _profile_list_entry(profile_name):
+    """נתוני שורה ברשימת הפרופילים (סקירה ותמונה ממוזערת) - רץ ב-thread רקע"""
+    image_path = storage.profile_image_path(storage.load_profile(profile_name))
+    thumbnail = prefetch_thumbnail(image_path, THUMB_LIST) if image_path else None
+    return profile_name, overview.profile_overview(profile_name), thumbnail
+
+
+def _profile_item_text(profile_name, active, details="⏳ טוען..."):
+    text = f"👤 {profile_name}" + (" (פעיל)" if active else "")
+    return f"{text}\n{details}"
+
+
+def _profile_details_text(info) -> str:
+    if not info.entries:
+        return "אין רשומות עדיין"
+    text = f"{info.entries} רשומות ב-{info.exercises} תרגילים"
+    if info.last_workout is not None:
+        text += f" · אחרון {info.last_workout.strftime('%d/%m/%Y')}"
+    return text
+
+
+class ProfileViewDialog(QDialog):
+    """
+    צפייה בפרופיל. נבנה פעם אחת ומתמלא מחדש בכל פתיחה (populate).
+    מעבר לעריכה או להחלפה מוחזר כתוצאה של exec, כך שהדיאלוג הבא נפתח
+    רק אחרי שזה נסגר.
+    """
+    EDIT = 2
+    SWITCH = 3
+
+    # (שדה, תווית, יחידה, צבע מתוך theme.ACCENT_COLORS)
+    FIELDS = (
+        ("name", "👤 שם מלא:", "", "blue"),
+        ("height", "📏 גובה:", ' ס"מ', "green"),
+        ("weight", "⚖️ משקל:", ' ק"ג', "orange"),
+        ("age", "🎂 גיל:", "", "pink"),
+        ("gender", "👥 מין:", "", "purple"),
+    )
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("פרופיל אישי")
+        self.setModal(True)
+        self.setMinimumWidth(450)
 
-        # יצירת מיכל מרכזי
-        main_widget = QWidget()
-        self.setCentralWidget(main_widget)
         layout = QVBoxLayout()
-        main_widget.setLayout(layout)
+        layout.setSpacing(20)
 
-        # הגדרת טאבים
-        self.tab_widget = QTabWidget()
-        self.tab_widget.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        self.tab_widget.customContextMenuRequested.connect(self._show_tab_context_menu)
-        layout.addWidget(self.tab_widget)
+        # תווית כותרת
+        title_label = styled(QLabel("📋 הפרופיל שלי"), role="title")
+        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(title_label)
 
-        # יצירת סרגל כלים
-        toolbar = QToolBar()
-        self.addToolBar(toolbar)
-        
-        # כפתור שמירה בסרגל כלים עם קיצור מקלדת
-        save_action = QAction("שמור", self)
-        save_action.setShortcuts([QKeySequence("Ctrl+S"), QKeySequence("Ctrl+ד")])  # תמיכה באנגלית ועברית
-        save_action.triggered.connect(self._save_current_tab)
-        toolbar.addAction(save_action)
-        
-        # הוספת spacer כדי לדחוף את תמונת הפרופיל לצד ימין
-        spacer = QWidget()
-        spacer.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
-        toolbar.addWidget(spacer)
-        
-        # קונטיינר לתמונה ושם פרופיל
-        profile_container = QWidget()
-        profile_layout = QHBoxLayout(profile_container)
-        profile_layout.setContentsMargins(5, 0, 5, 0)
-        profile_layout.setSpacing(10)
-        
-        # שם הפרופיל
-        self.profile_name_label = QLabel()
-        self.profile_name_label.setStyleSheet("""
-            QLabel {
-                font-size: 13pt;
-                font-weight: bold;
-                color: #2196F3;
-                padding: 5px;
-            }
-        """)
-        self.profile_name_label.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.profile_name_label.mousePressEvent = lambda e: self._show_profile_dialog()
+        # תמונת פרופיל (מוסתרת כשאין)
+        self.image_label = styled(QLabel(), avatar="view")
+        self.image_label.setFixedSize(120, 120)
+        self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.image_label.setScaledContents(True)
+
+        image_container = QHBoxLayout()
+        image_container.addStretch()
+        image_container.addWidget(self.image_label)
+        image_container.addStretch()
+        layout.addLayout(image_container)
+
+        # תצוגת הפרטים - שורה לכל שדה, מוסתרת כשהשדה ריק
+        info_widget = styled(QFrame(), "profileInfo")
+        info_layout = QVBoxLayout(info_widget)
+        info_layout.setSpacing(15)
+
+        self._rows = {}
+        for key, label_text, _unit, accent in self.FIELDS:
+            item_widget = styled(QFrame(), accent=accent)
+
+            item_layout = QHBoxLayout(item_widget)
+            item_layout.setContentsMargins(10, 8, 10, 8)
+
+            label = styled(QLabel(label_text), accent=accent)
+            label.setMinimumWidth(120)
+
+            value_label = styled(QLabel(), role="profileValue")
+            # יישור לימין רק לגיל
+            if key == "age":
+                value_label.setAlignment(Qt.AlignmentFlag.AlignRight)
+            else:
+                value_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
+
+            item_layout.addWidget(value_label)
+            item_layout.addWidget(label)
+
+            info_layout.addWidget(item_widget)
+            self._rows[key] = (item_widget, value_label)
+
+        layout.addWidget(info_widget)
+
+        # כפתורים
+        buttons_layout = QHBoxLayout()
+
+        edit_button = styled(QPushButton("✏️ ערוך פרופיל"), scale="large")
+        edit_button.clicked.connect(lambda: self.done(self.EDIT))
+
+        switch_button = styled(QPushButton("🔄 החלף פרופיל"), variant="warning", scale="large")
+        switch_button.clicked.connect(lambda: self.done(self.SWITCH))
+
+        close_button = styled(QPushButton("סגור"), variant="neutral", scale="large")
+        close_button.clicked.connect(self.reject)
+
+        buttons_layout.addWidget(edit_button)
+        buttons_layout.addWidget(switch_button)
+        buttons_layout.addWidget(close_button)
+
+        layout.addLayout(buttons_layout)
+
+        self.setLayout(layout)
+
+    def populate(self, profile_data: dict):
+        image_path = storage.profile_image_path(profile_data)
+        has_image = bool(image_path) and Path(image_path).exists()
+        if has_image:
+            self.image_label.setPixmap(create_circular_pixmap(image_path, THUMB_PROFILE_VIEW))
+        self.image_label.setVisible(has_image)
+
+        for key, _label_text, unit, _accent in self.FIELDS:
+            item_widget, value_label = self._rows[key]
+            value = profile_data.get(key, "")
+            value_label.setText(f"{value}{unit}" if value else "")
+            item_widget.setVisible(bool(value))
+        self.adjustSize()
+
+
+class ProfileEditDialog(QDialog):
+    """
+    טופס עריכת פרופיל. נבנה פעם אחת ומתמלא מחדש בכל פתיחה (populate);
+    אחרי Accepted הערכים החדשים ב-values().
+    process_image(pixmap, label, buttons, on_stored) - עיבוד תמונה שהועלתה
+    ברקע (MainWindow._start_profile_image_processing); cancel_image() מנתק
+    עיבוד שעוד רץ, כך שתמונה של פתיחה קודמת לא תגיע לטופס.
+    """
+
+    def __init__(self, process_image, cancel_image, parent=None):
+        super().__init__(parent)
+        self._process_image = process_image
+        self._cancel_image = cancel_image
+        # הערך שיישמר בפרופיל (הפניה לנכס)
+        self._image_ref = ""
+        self.setWindowTitle("עריכת פרופיל אישי")
+        self.setModal(True)
+        self.setMinimumWidth(400)
+
+        layout = QVBoxLayout()
+        layout.setSpacing(15)
+
+        # תווית כותרת
+        title_label = styled(QLabel("📋 פרטים אישיים"), role="title")
+        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(title_label)
+
+        # תמונת פרופיל
+        image_layout = QHBoxLayout()
+
+        # תצוגת התמונה
+        self.image_label = styled(QLabel("📷\nאין תמונה"), avatar="edit", empty=True)
+        self.image_label.setFixedSize(100, 100)
+        self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        image_layout.addStretch()
+        image_layout.addWidget(self.image_label)
+
+        # כפתורי תמונה
+        image_buttons_layout = QVBoxLayout()
+
+        self.upload_image_button = styled(QPushButton("📤 העלה תמונה"), scale="small")
+        remove_image_button = styled(QPushButton("🗑️ הסר תמונה"), variant="danger", scale="small")
+
+        self.upload_image_button.clicked.connect(self._upload_image)
+        remove_image_button.clicked.connect(self._remove_image)
+
+        image_buttons_layout.addWidget(self.upload_image_button)
+        image_buttons_layout.addWidget(remove_image_button)
+        image_buttons_layout.addStretch()
+
+        image_layout.addLayout(image_buttons_layout)
+        image_layout.addStretch()
+
+        layout.addLayout(image_layout)
+
+        # מפריד
+        separator = styled(QFrame(), role="separator")
+        separator.setFrameShape(QFrame.Shape.HLine)
+        layout.addWidget(separator)
+
+        # טופס הפרטים
+        form_layout = QGridLayout()
+        form_layout.setSpacing(10)
+
+        # (שדה, תווית, טקסט לדוגמה, validator, יישור)
+        fields = (
+            ("name", "שם מלא:", "הכנס את שמך המלא", None, Qt.AlignmentFlag.AlignLeft),
+            ("height", "גובה (ס\"מ):", "לדוגמה: 175", QIntValidator(100, 250, self), Qt.AlignmentFlag.AlignRight),
+            ("weight", "משקל (ק\"ג):", "לדוגמה: 75.5", QDoubleValidator(30.0, 300.0, 1, self), Qt.AlignmentFlag.AlignRight),
+            ("age", "גיל:", "לדוגמה: 25", QIntValidator(10, 120, self), Qt.AlignmentFlag.AlignRight),
+        )
+        self._inputs = {}
+        for row, (key, label_text, placeholder, validator, alignment) in enumerate(fields):
+            label = styled(QLabel(label_text), role="field")
+            label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+            field = QLineEdit()
+            field.setPlaceholderText(placeholder)
+            if validator is not None:
+                field.setValidator(validator)
+            field.setAlignment(alignment)
+            form_layout.addWidget(field, row, 0)
+            form_layout.addWidget(label, row, 1)
+            self._inputs[key] = field
+
+        # מין
+        gender_label = styled(QLabel("מין:"), role="field")
+        gender_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        gender_layout = QHBoxLayout()
+
+        self._gender_group = QButtonGroup(self)
+        self._male_radio = QRadioButton("זכר")
+        self._female_radio = QRadioButton("נקבה")
+        self._gender_group.addButton(self._male_radio)
+        self._gender_group.addButton(self._female_radio)
+
+        gender_layout.addStretch()
+        gender_layout.addWidget(self._female_radio)
+        gender_layout.addWidget(self._male_radio)
+
+        form_layout.addLayout(gender_layout, len(fields), 0)
+        form_layout.addWidget(gender_label, len(fields), 1)
+
+        layout.addLayout(form_layout)
+
+        # כפתורי פעולה
+        self.button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Save | QDialogButtonBox.StandardButton.Cancel)
+        self.button_box.button(QDialogButtonBox.StandardButton.Save).setText("שמור")
+        self.button_box.button(QDialogButtonBox.StandardButton.Cancel).setText("ביטול")
+        self.button_box.accepted.connect(self.accept)
+        self.button_box.rejected.connect(self.reject)
+
+        layout.addWidget(self.button_box)
+
+        self.setLayout(layout)
+
+    def populate(self, profile_data: dict):
+        self._cancel_image()
+        self.upload_image_button.setEnabled(True)
+        self.button_box.button(QDialogButtonBox.StandardButton.Save).setEnabled(True)
+        for key, field in self._inputs.items():
+            field.setText(profile_data.get(key, ""))
+        self._inputs["name"].setFocus()
+
+        # ביטול הבחירה הקודמת - בקבוצה בלעדית אי אפשר לבטל את הכפתור המסומן
+        self._gender_group.setExclusive(False)
+        self._male_radio.setChecked(profile_data.get("gender", "") == "זכר")
+        self._female_radio.setChecked(profile_data.get("gender", "") == "נקבה")
+        self._gender_group.setExclusive(True)
+
+        self._image_ref = profile_data.get("profile_image", "")
+        image_path = storage.profile_image_path(profile_data)
+        if image_path and Path(image_path).exists():
+            self.image_label.setScaledContents(True)
+            self.image_label.setPixmap(create_circular_pixmap(image_path, THUMB_PROFILE_EDIT))
+            self._set_empty(False)
+        else:
+            self._show_no_image()
+
+    def values(self) -> dict:
+        selected_gender = ""
+        if self._male_radio.isChecked():
+            selected_gender = "זכר"
+        elif self._female_radio.isChecked():
+            selected_gender = "נקבה"
+        profile_data = {key: field.text().strip() for key, field in self._inputs.items()}
+        profile_data["gender"] = selected_gender
+        profile_data["profile_image"] = self._image_ref
+        return profile_data
+
+    def _set_image_ref(self, ref):
+        self._image_ref = ref
+
+    def _set_empty(self, empty: bool):
+        # ליטוש מחדש רק כשהמצב משתנה - בפתיחה הראשונה הוא כבר נכון
+        if self.image_label.property("empty") != empty:
+            restyle(self.image_label, empty=empty)
+
+    def _show_no_image(self):
+        self.image_label.clear()
+        self.image_label.setText("📷\nאין תמונה")
+        self._set_empty(True)
+
+    def _upload_image(self):
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "בחר תמונת פרופיל",
+            str(Path.home()),
+            "תמונות (*.png *.jpg *.jpeg *.bmp *.gif)"
+        )
+        if not file_path:
+            return
+        try:
+            # פתיחת דיאלוג חיתוך
+            crop_dialog = ImageCropDialog(file_path, self)
+            if crop_dialog.exec() == QDialog.DialogCode.Accepted:
+                # קבלת התמונה החתוכה
+                cropped_pixmap = crop_dialog.get_cropped_pixmap()
+
+                # הקטנה ושמירה של התמונה (PNG) וגרסאותיה במאגר ברקע;
+                # ההפניה והתצוגה מתעדכנות בסיום
+                save_button = self.button_box.button(QDialogButtonBox.StandardButton.Save)
+                self._process_image(cropped_pixmap, self.image_label,
+                                    (self.upload_image_button, save_button), self._set_image_ref)
+                self.image_label.clear()
+                self.image_label.setText("⏳\nמעבד תמונה...")
+                self._set_empty(False)
+            crop_dialog.deleteLater()
+        except Exception as e:
+            QMessageBox.warning(self, "שגיאה", f"שגיאה בהעלאת התמונה: {e}")
+
+    def _remove_image(self):
+        self._image_ref = ""
+        self._show_no_image()
+        self.image_label.setScaledContents(False)
+
+    def accept(self):
+        # בדיקת תקינות
+        if not self._inputs["name"].text().strip():
+            QMessageBox.warning(self, "שגיאה", "נא למלא שם")
+            return
+        super().accept()
+
+    def reject(self):
+        self._cancel_image()
+        super().reject()
+
+
+class ProfileSwitchDialog(QDialog):
+    """
+    בחירה, מחיקה ושינוי שם של פרופילים ויצירת פרופיל חדש. נבנה פעם אחת;
+    populate ממלא את הרשימה מחדש. הפעולות עצמן ב-MainWindow.
+    CREATED - נוצר פרופיל חדש (ואחרי הסגירה נפתחת עריכת הפרטים).
+    """
+    CREATED = 2
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("החלף פרופיל")
+        self.setModal(True)
+        self.setMinimumWidth(400)
+
+        layout = QVBoxLayout()
+        layout.setSpacing(15)
+
+        # תווית כותרת
+        title_label = styled(QLabel("🔄 בחר פרופיל או צור חדש"), role="title")
+        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(title_label)
+
+        # רשימת פרופילים קיימים - מוסתרת כשאין פרופילים
+        self.existing_section = QWidget()
+        existing_layout = QVBoxLayout(self.existing_section)
+        existing_layout.setContentsMargins(0, 0, 0, 0)
+        existing_layout.setSpacing(15)
+
+        profiles_label = styled(QLabel("פרופילים קיימים:"), role="heading")
+        existing_layout.addWidget(profiles_label)
+
+        self.profiles_list = styled(QListWidget(), "profileList")
+        self.profiles_list.setIconSize(QSize(THUMB_LIST, THUMB_LIST))
+        self.profiles_list.setMaximumHeight(260)
+        existing_layout.addWidget(self.profiles_list)
+
+        # מקום ריק בגודל התמונה, כדי שהשורות לא יזוזו כשהתמונות נטענות
+        placeholder = QPixmap(THUMB_LIST, THUMB_LIST)
+        placeholder.fill(Qt.GlobalColor.transparent)
+        self._placeholder_icon = QIcon(placeholder)
+
+        self.load_button = styled(QPushButton("✅ טען פרופיל נבחר"), variant="success", scale="large")
+        self.delete_button = styled(QPushButton("🗑️ מחק פרופיל נבחר"), variant="danger", scale="large")
+        self.rename_button = styled(QPushButton("✏️ ערוך שם פרופיל נבחר"), variant="warning", scale="large")
+        existing_layout.addWidget(self.load_button)
+        existing_layout.addWidget(self.delete_button)
+        existing_layout.addWidget(self.rename_button)
+
+        # מפריד
+        separator = styled(QFrame(), role="separator")
+        separator.setFrameShape(QFrame.Shape.HLine)
+        existing_layout.addWidget(separator)
+
+        layout.addWidget(self.existing_section)
+
+        # יצירת פרופיל חדש
+        new_profile_label = styled(QLabel("צור פרופיל חדש:"), role="heading")
+        layout.addWidget(new_profile_label)
+
+        self.name_input = styled(QLineEdit(), scale="large")
+        self.name_input.setPlaceholderText("הכנס שם לפרופיל החדש")
+        layout.addWidget(self.name_input)
+
+        self.create_button = styled(QPushButton("➕ צור פרופיל חדש"), scale="large")
+        layout.addWidget(self.create_button)
+
+        # כפתור סגירה
+        close_button = styled(QPushButton("סגור"), variant="neutral", scale="medium")
+        close_button.clicked.connect(self.reject)
+        layout.addWidget(close_button)
+
+        self.setLayout(layout)
+
+    def populate(self, profiles, current_profile_name):
+        self.profiles_list.clear()
+        for profile in profiles:
+            item = QListWidgetItem(self._placeholder_icon, _profile_item_text(profile, profile == current_profile_name))
+            item.setData(Qt.ItemDataRole.UserRole, profile)
+            if profile == current_profile_name:
+                self.mark_active(item)
+            self.profiles_list.addItem(item)
+        self.existing_section.setVisible(bool(profiles))
+        self.name_input.clear()
+        self.adjustSize()
+
+    @staticmethod
+    def mark_active(item):
+        item.setForeground(QColor("#4CAF50"))
+        font = item.font()
+        font.setBold(True)
+        item.setFont(font)
+
+
+# מספר טאבי התרגיל הפנויים שנשמרים לשימוש חוזר; מעבר לזה הם נמחקים
+EXERCISE_TAB_POOL_MAX = 16
+
+
+class MainWindow(QMainWindow):
+    def __init__(self):
+        super().__init__()
+
+        # הגדרות חלון ראשי
+        self.setWindowTitle(get_version_string())
+        self.setMinimumSize(QSize(800, 600))
+        self.showMaximized()  # פתיחה במסך מלא
+        
+        # הגדרת אייקון החלון
+        self._set_window_icon()
+
+        # יצירת סטטוס בר
+        self.setStatusBar(QStatusBar())
+
+        # יצירת מיכל מרכזי
+        main_widget = QWidget()
+        self.setCentralWidget(main_widget)
+        layout = QVBoxLayout()
+        main_widget.setLayout(layout)
+
+        # הגדרת טאבים
+        self.tab_widget = QTabWidget()
+        self.tab_widget.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.tab_widget.customContextMenuRequested.connect(self._show_tab_context_menu)
+        layout.addWidget(self.tab_widget)
+        # טאבי תרגיל שהוסרו (החלפת פרופיל, ניקוי) ומחכים לשימוש חוזר
+        self._tab_pool = []
+
+        # יצירת סרגל כלים
+        toolbar = QToolBar()
+        self.addToolBar(toolbar)
+        
+        # כפתור שמירה בסרגל כלים עם קיצור מקלדת
+        save_action = QAction("שמור", self)
+        save_action.setShortcuts([QKeySequence("Ctrl+S"), QKeySequence("Ctrl+ד")])  # תמיכה באנגלית ועברית
+        save_action.triggered.connect(self._save_current_tab)
+        toolbar.addAction(save_action)
+        
+        # הוספת spacer כדי לדחוף את תמונת הפרופיל לצד ימין
+        spacer = QWidget()
+        spacer.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
+        toolbar.addWidget(spacer)
+        
+        # קונטיינר לתמונה ושם פרופיל
+        profile_container = QWidget()
+        profile_layout = QHBoxLayout(profile_container)
+        profile_layout.setContentsMargins(5, 0, 5, 0)
+        profile_layout.setSpacing(10)
+        
+        # שם הפרופיל
+        self.profile_name_label = styled(QLabel(), "profileNameLabel")
+        self.profile_name_label.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.profile_name_label.mousePressEvent = lambda e: self._show_profile_dialog()
         self.profile_name_label.setToolTip("לחץ לצפייה בפרופיל (Ctrl+P)")
         profile_layout.addWidget(self.profile_name_label)
         
@@ -1434,7 +2410,17 @@ class MainWindow(QMainWindow):
         export_action.setShortcuts([QKeySequence("Ctrl+E"), QKeySequence("Ctrl+ק")])  # תמיכה באנגלית ועברית
         export_action.triggered.connect(self._export_to_excel)
         file_menu.addAction(export_action)
+
+        # עדכון קובץ אקסל קיים (רק רשומות חדשות)
+        update_export_action = QAction("עדכן קובץ אקסל קיים", self)
+        update_export_action.triggered.connect(self._update_excel_export)
+        file_menu.addAction(update_export_action)
         
+        # ייבוא היסטוריה מאקסל/CSV
+        import_action = QAction("ייבא מאקסל/CSV", self)
+        import_action.triggered.connect(self._import_history)
+        file_menu.addAction(import_action)
+
         file_menu.addSeparator()
         
         # פעולת עזרה
@@ -1466,8 +2452,50 @@ class MainWindow(QMainWindow):
         clear_all_action.triggered.connect(self._clear_all_tabs)
         edit_menu.addAction(clear_all_action)
 
+        edit_menu.addSeparator()
+
+        # העברת רשומות ישנות לארכיון
+        archive_action = QAction("העבר רשומות ישנות לארכיון", self)
+        archive_action.triggered.connect(self._archive_current_tab)
+        edit_menu.addAction(archive_action)
+
+        # פעולות מפתחים נסתרות (ללא תפריט): HUD ביצועים, מדידת זמנים וייצוא trace
+        self._time_to_interactive_ms = None
+        self._perf_hud = PerfHud(self)
+        hud_action = QAction(self)
+        hud_action.setShortcut(QKeySequence("Ctrl+Alt+Shift+H"))
+        hud_action.triggered.connect(self._perf_hud.toggle)
+        self.addAction(hud_action)
+
+        trace_toggle_action = QAction(self)
+        trace_toggle_action.setShortcut(QKeySequence("Ctrl+Alt+Shift+T"))
+        trace_toggle_action.triggered.connect(self._toggle_trace)
+        self.addAction(trace_toggle_action)
+        trace_export_action = QAction(self)
+        trace_export_action.setShortcut(QKeySequence("Ctrl+Alt+Shift+E"))
+        trace_export_action.triggered.connect(self._export_trace)
+        self.addAction(trace_export_action)
+        memory_report_action = QAction(self)
+        memory_report_action.setShortcut(QKeySequence("Ctrl+Alt+Shift+M"))
+        memory_report_action.triggered.connect(self._memory_report)
+        self.addAction(memory_report_action)
+
         # שמירה בסגירה
         self._closing = False
+
+        # ייצוא/ייבוא/עיבוד תמונה ברקע (אם יש)
+        self._image_task = None
+        self._image_task_target = None
+        # טעינת שורות רשימת הפרופילים ברקע (שם פרופיל -> משימה)
+        self._profile_list_tasks = {}
+        self._profile_list_widget = None
+        # דיאלוגי הפרופיל - נבנים בפתיחה הראשונה ונשמרים
+        self._view_dialog = None
+        self._edit_dialog = None
+        self._switch_dialog = None
+        self._export_task = None
+        self._export_progress = None
+        self._import_task = None
         
         # טעינת פרטי פרופיל
         self.current_profile_name = None  # שם הפרופיל הנוכחי
@@ -1477,13 +2505,93 @@ class MainWindow(QMainWindow):
         # טעינת התרגילים תתבצע בסוף _check_first_run או ישירות אם יש פרופיל
         QTimer.singleShot(100, self._check_first_run)
     
+    def _toggle_trace(self):
+        """הפעלה/כיבוי של מדידת זמנים"""
+        if trace.is_enabled():
+            trace.disable()
+            self.statusBar().showMessage("מדידת זמנים כובתה", 2000)
+        else:
+            trace.enable()
+            self.statusBar().showMessage("מדידת זמנים פעילה (Ctrl+Alt+Shift+E לייצוא)", 3000)
+
+    def _export_trace(self):
+        """ייצוא המדידות לקובץ Chrome trace / Perfetto"""
+        if not trace.events():
+            self.statusBar().showMessage("אין מדידות לייצוא (Ctrl+Alt+Shift+T להפעלה)", 3000)
+            return
+        default_filename = f"trace_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        filename, _ = QFileDialog.getSaveFileName(self, "שמור קובץ trace", default_filename, "JSON Files (*.json)")
+        if not filename:
+            return
+        try:
+            count = trace.export_chrome_trace(filename)
+            self.statusBar().showMessage(f"נשמרו {count} מדידות ל־{filename}", 3000)
+        except OSError as e:
+            QMessageBox.warning(self, "שגיאה", f"שגיאה בשמירת הקובץ: {e}")
+
+    def _memory_report(self):
+        """לחיצה ראשונה מפעילה מעקב זיכרון; הבאות כותבות דוח לתיקיית העבודה"""
+        if not memreport.is_tracing():
+            memreport.start()
+            self.statusBar().showMessage("מעקב זיכרון הופעל - Ctrl+Alt+Shift+M שוב לכתיבת דוח", 4000)
+            return
+        path = Path.cwd() / f"memory_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+        try:
+            memreport.write_report(path, self._memory_attributor(), extra=self._native_memory_stats())
+            self.statusBar().showMessage(f"דוח זיכרון נשמר ל־{path}", 4000)
+        except OSError as e:
+            QMessageBox.warning(self, "שגיאה", f"שגיאה בשמירת דוח הזיכרון: {e}")
+
+    def _memory_attributor(self):
+        """כללי השיוך של הקצאות לתתי-מערכות באפליקציה"""
+        return memreport.MemoryAttributor([
+            ("Undo/Redo", [ExerciseTab._get_current_table_state, ExerciseTab._save_state_to_undo,
+                           ExerciseTab.undo, ExerciseTab.redo, os.path.join("core", "history.py")]),
+            ("שורות טבלה", [ExerciseTab.load_state, ExerciseTab.add_entry, ExerciseTab.add_entries,
+                            ExerciseTab._restore_table_state, ExerciseTab.duplicate_selected_row,
+                            ExerciseTab._edit_date_cell]),
+            ("גרפים (matplotlib)", ["matplotlib", "chart_render.py", ExerciseTab._request_chart_render,
+                                    ExerciseTab._on_chart_rendered, ExerciseTab._show_chart_image]),
+            ("תמונות (pixmaps)", [ImageCropDialog.__init__, ImageCropDialog.update_display, CropCanvas.paintEvent,
+                                  ImageCropDialog.get_cropped_pixmap, create_circular_pixmap, cached_thumbnail,
+                                  MainWindow._update_profile_image_widget, MainWindow._set_default_profile_image]),
+            ("אקסל (openpyxl)", ["openpyxl", "excel_export.py", "workout_import.py"]),
+        ])
+
+    def _native_memory_stats(self) -> dict:
+        """זיכרון בצד ה-C++ של Qt ונתונים נוספים שלא נראים ל-tracemalloc"""
+        tabs = [self.tab_widget.widget(i) for i in range(self.tab_widget.count())]
+        exercise_tabs = [tab for tab in tabs if isinstance(tab, ExerciseTab)]
+        items = sum(tab.table.rowCount() * tab.table.columnCount() for tab in exercise_tabs)
+        undo_states = sum(len(tab._undo_stack) + len(tab._redo_stack) for tab in exercise_tabs)
+        undo_rows = sum(len(state) for tab in exercise_tabs for state in tab._undo_stack + tab._redo_stack)
+
+        pixmap_count = pixmap_bytes = 0
+        for widget in QApplication.allWidgets():
+            if isinstance(widget, QLabel):
+                pixmap = widget.pixmap()
+                if pixmap is not None and not pixmap.isNull():
+                    pixmap_count += 1
+                    pixmap_bytes += pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+        return {
+            "RSS": format_bytes(rss_bytes()),
+            "תאי טבלה (QTableWidgetItem)": f"{items:,} ב-{len(exercise_tabs)} טאבים",
+            "מצבי Undo/Redo": f"{undo_states} מצבים, {undo_rows:,} שורות",
+            "תמונות מוצגות (QPixmap)": f"{pixmap_count} תמונות, {format_bytes(pixmap_bytes)} פיקסלים",
+            "מטמון גרפים (PNG)": f"{len(chart_cache)} תמונות, {format_bytes(chart_cache.size_bytes())}",
+            "ווידג'טים": f"{len(QApplication.allWidgets()):,}",
+        }
+
     def _check_first_run(self):
         """בדיקה אם זו הפעלה ראשונה ואין פרופיל"""
         # בדוק אם יש פרופילים קיימים
         profiles = self._get_all_profiles()
         
         if not profiles:
-            # אין פרופילים - זו הפעלה ראשונה!
+            # אין פרופילים - זו הפעלה ראשונה! טופס הפרטים נבנה כבר בזמן
+            # שהודעת הפתיחה מוצגת, כך שבסוף התהליך הוא נפתח מיד
+            QTimer.singleShot(0, self._prepare_profile_edit_dialog)
             msg = QMessageBox(self)
             msg.setIcon(QMessageBox.Icon.Information)
             msg.setWindowTitle("ברוך הבא! 👋")
@@ -1497,7 +2605,26 @@ class MainWindow(QMainWindow):
         
         # טען תרגילים (לאחר שהפרופיל נקבע)
         self._reload_exercises()
+        # נמדד אחרי שהאירועים שבתור (כולל הציור הראשון) טופלו
+        if self._time_to_interactive_ms is None:
+            QTimer.singleShot(0, self._mark_interactive)
     
+    def _mark_interactive(self):
+        self._time_to_interactive_ms = (time.perf_counter() - _APP_START) * 1000
+        _mark_startup("interactive")
+        QTimer.singleShot(0, self._collect_asset_garbage)
+        report_path = os.environ.get(STARTUP_REPORT_ENV)
+        if report_path:
+            write_startup_report(report_path)
+            QApplication.quit()
+
+    def _collect_asset_garbage(self):
+        """מחיקת תמונות במאגר שאף פרופיל לא מפנה אליהן - אחרי שהחלון כבר מוכן"""
+        try:
+            storage.collect_asset_garbage()
+        except OSError:
+            pass
+
     def _create_first_profile(self):
         """יצירת פרופיל ראשון"""
         while True:
@@ -1513,16 +2640,9 @@ class MainWindow(QMainWindow):
             if ok and name.strip():
                 # יצירת פרופיל חדש
                 self.current_profile_name = name.strip()
-                empty_profile = {
-                    "name": "",
-                    "height": "",
-                    "weight": "",
-                    "age": "",
-                    "gender": "",
-                    "profile_image": ""
-                }
-                self._save_profile(empty_profile, self.current_profile_name)
-                self.profile_data = empty_profile
+                profile_data = empty_profile()
+                self._save_profile(profile_data, self.current_profile_name)
+                self.profile_data = profile_data
                 
                 # הצע למלא פרטים נוספים
                 reply = QMessageBox.question(
@@ -1557,77 +2677,13 @@ class MainWindow(QMainWindow):
                     break
     
     def _set_window_icon(self):
-        """יצירת והגדרת אייקון מקצועי לחלון"""
+        """הגדרת אייקון החלון (ראו load_app_icon)"""
         try:
-            from PySide6.QtGui import QIcon, QBrush, QLinearGradient
-            
-            # יצירת פיקסמאפ בגודל גדול יותר לאיכות טובה
-            size = 128
-            pixmap = QPixmap(size, size)
-            pixmap.fill(Qt.GlobalColor.transparent)  # רקע שקוף
-            
-            painter = QPainter(pixmap)
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
-            
-            # יצירת רקע עם גרדיאנט
-            gradient = QLinearGradient(0, 0, size, size)
-            gradient.setColorAt(0, QColor(33, 150, 243))    # כחול בהיר #2196F3
-            gradient.setColorAt(1, QColor(25, 118, 210))    # כחול כהה #1976D2
-            
-            # ציור עיגול עם גרדיאנט
-            painter.setBrush(QBrush(gradient))
-            painter.setPen(QPen(QColor(21, 101, 192), 3))  # מסגרת כחולה כהה
-            painter.drawEllipse(QRectF(2, 2, size-4, size-4))
-            
-            # ציור משקולת מסוגננת
-            painter.setPen(QPen(QColor(255, 255, 255), 6, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap))
-            
-            # הבר האמצעי של המשקולת
-            bar_y = size // 2
-            bar_left = size * 0.3
-            bar_right = size * 0.7
-            painter.drawLine(int(bar_left), bar_y, int(bar_right), bar_y)
-            
-            # המשקולות משני הצדדים
-            weight_size = size * 0.15
-            
-            # משקולת שמאלית
-            painter.setBrush(QBrush(QColor(255, 255, 255)))
-            painter.setPen(QPen(QColor(224, 224, 224), 2))
-            left_rect = QRectF(bar_left - weight_size, bar_y - weight_size, weight_size * 2, weight_size * 2)
-            painter.drawEllipse(left_rect)
-            
-            # משקולת ימנית
-            right_rect = QRectF(bar_right - weight_size, bar_y - weight_size, weight_size * 2, weight_size * 2)
-            painter.drawEllipse(right_rect)
-            
-            # הוספת נקודות דקורטיביות על המשקולות
-            painter.setPen(QPen(QColor(33, 150, 243), 2))
-            for rect in [left_rect, right_rect]:
-                center_x = rect.center().x()
-                center_y = rect.center().y()
-                # שלוש נקודות במרכז כל משקולת
-                painter.drawPoint(QPointF(center_x, center_y - 5))
-                painter.drawPoint(QPointF(center_x, center_y))
-                painter.drawPoint(QPointF(center_x, center_y + 5))
-            
-            painter.end()
-            
-            # הגדרת האייקון
-            icon = QIcon(pixmap)
-            self.setWindowIcon(icon)
-            
-            # שמירת האייקון לקובץ (אופציונלי - לשימוש עתידי)
-            try:
-                icon_path = Path.cwd() / "app_icon.png"
-                pixmap.save(str(icon_path), "PNG")
-            except Exception:
-                pass
-                
+            self.setWindowIcon(load_app_icon())
         except Exception:
             pass  # אם נכשל, פשוט לא יהיה אייקון
 
+    @traced
     def _load_profile(self):
         """טעינת פרטי הפרופיל מקובץ"""
         # אם current_profile_name לא מוגדר (התחלת התוכנית),
@@ -1640,50 +2696,21 @@ class MainWindow(QMainWindow):
             load_from_active_file = True
             
         if load_from_active_file:
-            active_profile_path = Path.cwd() / "active_profile.json"
-            if active_profile_path.exists():
-                try:
-                    with open(active_profile_path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                        self.current_profile_name = data.get("active_profile")
-                except Exception:
-                    pass
+            self.current_profile_name = storage.read_active_profile()
         
         # אם אין פרופיל פעיל, ננסה לטעון את הפרופיל הישן (user_profile.json)
         if not self.current_profile_name:
-            old_profile_path = Path.cwd() / "user_profile.json"
-            if old_profile_path.exists():
+            old_data = storage.read_legacy_profile()
+            if old_data is not None:
                 self.current_profile_name = "פרופיל ראשי"
                 # העברת הפרופיל הישן לפורמט החדש
-                try:
-                    with open(old_profile_path, "r", encoding="utf-8") as f:
-                        old_data = json.load(f)
-                        if old_data.get("name"):  # אם יש נתונים בפרופיל הישן
-                            self._save_profile(old_data, "פרופיל ראשי")
-                except Exception:
-                    pass
-        
-        # איפוס נתוני הפרופיל - חשוב! כדי שלא יישארו ערכים מהפרופיל הקודם
-        self.profile_data = {
-            "name": "",
-            "height": "",
-            "weight": "",
-            "age": "",
-            "gender": "",
-            "profile_image": ""
-        }
+                if isinstance(old_data, dict) and old_data.get("name"):  # אם יש נתונים בפרופיל הישן
+                    self._save_profile(old_data, "פרופיל ראשי")
         
-        # טעינת נתוני הפרופיל הנוכחי מהקובץ שלו
+        # טעינת נתוני הפרופיל הנוכחי - שדות חסרים מאופסים כדי שלא יישארו ערכים מהפרופיל הקודם
         if self.current_profile_name:
-            profile_path = Path.cwd() / f"profile_{self.current_profile_name}.json"
-            if profile_path.exists():
-                try:
-                    with open(profile_path, "r", encoding="utf-8") as f:
-                        loaded_data = json.load(f)
-                        # עדכון רק השדות שקיימים בקובץ
-                        self.profile_data.update(loaded_data)
-                except Exception:
-                    pass
+            # תמונה שנשמרה כנתיב (גרסאות קודמות) עוברת למאגר הנכסים
+            self.profile_data = storage.migrate_profile_image(self.current_profile_name)
             
             # עדכון שם הפרופיל בכותרת החלון
             self.setWindowTitle(f"{get_version_string()} - {self.current_profile_name}")
@@ -1691,6 +2718,7 @@ class MainWindow(QMainWindow):
             # עדכון תמונת הפרופיל ב-toolbar
             self._update_profile_image_widget()
         else:
+            self.profile_data = empty_profile()
             self.setWindowTitle(get_version_string())
             self._update_profile_image_widget()
 
@@ -1703,53 +2731,73 @@ class MainWindow(QMainWindow):
         if hasattr(self, 'profile_name_label'):
             self.profile_name_label.setText(self.current_profile_name or "")
             
-        profile_image_path = self.profile_data.get("profile_image", "")
+        profile_image_path = storage.profile_image_path(self.profile_data)
         if profile_image_path and Path(profile_image_path).exists():
-            try:
-                # טעינת התמונה המקורית
-                original = QPixmap(profile_image_path)
-                if original.isNull():
-                    self._set_default_profile_image()
-                    return
-                
-                # יצירת פיקסמפ סופי בגודל 56x56 עם שקיפות
-                final_pixmap = QPixmap(56, 56)
-                final_pixmap.fill(Qt.GlobalColor.transparent)
-                
-                painter = QPainter(final_pixmap)
-                try:
-                    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-                    painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
-                    
-                    # יצירת path עגול לתמונה (50x50 במרכז)
-                    path = QPainterPath()
-                    path.addEllipse(3, 3, 50, 50)
-                    painter.setClipPath(path)
-                    
-                    # רינדור התמונה בגודל המתאים
-                    scaled = original.scaled(50, 50, Qt.AspectRatioMode.KeepAspectRatioByExpanding, 
-                                            Qt.TransformationMode.SmoothTransformation)
-                    x_offset = (50 - scaled.width()) // 2 + 3
-                    y_offset = (50 - scaled.height()) // 2 + 3
-                    painter.drawPixmap(x_offset, y_offset, scaled)
-                    
-                    # ביטול ה-clip לציור הבורדר
-                    painter.setClipping(False)
-                    
-                    # ציור בורדר עגול
-                    pen = QPen(QColor("#2196F3"), 3)
-                    painter.setPen(pen)
-                    painter.setBrush(Qt.BrushStyle.NoBrush)
-                    painter.drawEllipse(2, 2, 52, 52)
-                finally:
-                    painter.end()
-                
-                self.profile_image_widget.setPixmap(final_pixmap)
-            except Exception:
+            pixmap = cached_thumbnail(profile_image_path, THUMB_TOOLBAR, "toolbar")
+            if pixmap.isNull():
                 self._set_default_profile_image()
+            else:
+                self.profile_image_widget.setPixmap(pixmap)
         else:
             self._set_default_profile_image()
     
+    def _start_profile_image_processing(self, cropped_pixmap, label, buttons, on_stored):
+        """
+        הקטנת תמונה שהועלתה ושמירתה במאגר הנכסים (build_image_pyramid) ב-thread רקע.
+        בסיום on_stored מקבל את ההפניה לנכס.
+        """
+        task = BackgroundTask(build_image_pyramid, cropped_pixmap.toImage(), storage.asset_store())
+        task.signals.finished.connect(self._on_profile_image_ready)
+        task.signals.failed.connect(self._on_profile_image_failed)
+        # עד הסיום אין העלאה נוספת ואין שמירה - ההפניה לתמונה עוד לא ידועה
+        for button in buttons:
+            button.setEnabled(False)
+        self._image_task = task
+        self._image_task_target = (label, buttons, on_stored)
+        QThreadPool.globalInstance().start(task)
+
+    def _cancel_profile_image_processing(self):
+        """ניתוק העיבוד הנוכחי מהטופס (ביטול/פתיחה מחדש) - התוצאה שלו תתעלם"""
+        if self._image_task is not None:
+            self._image_task.cancel()
+            self._finish_profile_image_task()
+
+    def _finish_profile_image_task(self):
+        label, buttons, on_stored = self._image_task_target
+        self._image_task = self._image_task_target = None
+        try:
+            for button in buttons:
+                button.setEnabled(True)
+        except RuntimeError:
+            pass  # הדיאלוג כבר נסגר
+        return label, on_stored
+
+    def _is_current_image_task(self) -> bool:
+        """האות הגיע מהמשימה הנוכחית - ולא ממשימה שבוטלה או הוחלפה"""
+        return self._image_task is not None and self.sender() is self._image_task.signals
+
+    def _on_profile_image_ready(self, ref):
+        if not self._is_current_image_task():
+            return
+        label, on_stored = self._finish_profile_image_task()
+        on_stored(ref)
+        try:
+            label.setPixmap(create_circular_pixmap(storage.asset_store().resolve(ref), THUMB_PROFILE_EDIT))
+            label.setText("")
+        except RuntimeError:
+            pass  # הדיאלוג כבר נסגר
+
+    def _on_profile_image_failed(self, message: str):
+        if not self._is_current_image_task():
+            return
+        label, _on_stored = self._finish_profile_image_task()
+        try:
+            label.setText("📷\nאין תמונה")
+            restyle(label, empty=True)
+        except RuntimeError:
+            pass
+        QMessageBox.warning(self, "שגיאה", f"שגיאה בהעלאת התמונה: {message}")
+
     def _set_default_profile_image(self):
         """הגדרת תמונת פרופיל ברירת מחדל"""
         if not hasattr(self, 'profile_image_widget'):
@@ -1795,18 +2843,12 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "שגיאה", "לא נבחר פרופיל")
             return
             
-        profile_path = Path.cwd() / f"profile_{profile_name}.json"
         try:
-            with open(profile_path, "w", encoding="utf-8") as f:
-                json.dump(profile_data, f, ensure_ascii=False, indent=2)
+            # שמירת הפרופיל וסימונו כפעיל
+            storage.save_profile(profile_name, profile_data)
             self.profile_data = profile_data
             self.current_profile_name = profile_name
             
-            # שמירת הפרופיל הפעיל
-            active_profile_path = Path.cwd() / "active_profile.json"
-            with open(active_profile_path, "w", encoding="utf-8") as f:
-                json.dump({"active_profile": profile_name}, f, ensure_ascii=False, indent=2)
-            
             self.setWindowTitle(f"{get_version_string()} - {profile_name}")
             
             # עדכון תמונת הפרופיל ב-toolbar
@@ -1818,434 +2860,328 @@ class MainWindow(QMainWindow):
     
     def _get_all_profiles(self):
         """קבלת רשימת כל הפרופילים"""
-        profiles = []
-        for file in Path.cwd().glob("profile_*.json"):
-            profile_name = file.stem.replace("profile_", "")
-            profiles.append(profile_name)
-        return sorted(profiles)
+        return storage.list_profiles()
+
+    def _start_profile_list_loading(self, profiles_list):
+        """מילוי התמונות והנתונים של כל שורה ברשימת הפרופילים - משימת רקע לכל פרופיל"""
+        self._cancel_profile_list_loading()
+        self._profile_list_widget = profiles_list
+        for row in range(profiles_list.count()):
+            profile_name = profiles_list.item(row).data(Qt.ItemDataRole.UserRole)
+            task = BackgroundTask(_profile_list_entry, profile_name)
+            task.signals.finished.connect(self._on_profile_list_entry)
+            self._profile_list_tasks[profile_name] = task
+            QThreadPool.globalInstance().start(task)
+
+    def _cancel_profile_list_loading(self):
+        """משימות שעוד לא התחילו יוצאות מהתור; תוצאות של משימות שרצות יתעלמו"""
+        pool = QThreadPool.globalInstance()
+        for profile_name, task in list(self._profile_list_tasks.items()):
+            try:
+                taken = pool.tryTake(task)
+            except RuntimeError:
+                taken = False  # המשימה כבר רצה ונמחקה; התוצאה שלה עוד בתור
+            if taken:
+                del self._profile_list_tasks[profile_name]
+        self._profile_list_widget = None
+
+    def _on_profile_list_entry(self, result):
+        profile_name, info, thumbnail = result
+        self._profile_list_tasks.pop(profile_name, None)
+        profiles_list = self._profile_list_widget
+        if profiles_list is None:
+            return
+        try:
+            items = [profiles_list.item(row) for row in range(profiles_list.count())]
+        except RuntimeError:
+            return  # הדיאלוג כבר נסגר
+        for item in items:
+            if item.data(Qt.ItemDataRole.UserRole) != profile_name:
+                continue
+            details = _profile_details_text(info)
+            item.setData(Qt.ItemDataRole.UserRole + 1, details)
+            item.setText(_profile_item_text(profile_name, profile_name == self.current_profile_name, details))
+            if thumbnail is not None:
+                pixmap = cached_thumbnail(None, THUMB_LIST, "circle", thumbnail)
+                if not pixmap.isNull():
+                    item.setIcon(QIcon(pixmap))
     
+    def _profile_switch_dialog(self):
+        """דיאלוג החלפת הפרופיל - נבנה בפתיחה הראשונה ונשמר לפתיחות הבאות"""
+        if self._switch_dialog is None:
+            dialog = ProfileSwitchDialog(self)
+            dialog.load_button.clicked.connect(self._load_selected_profile)
+            dialog.delete_button.clicked.connect(self._delete_selected_profile)
+            dialog.rename_button.clicked.connect(self._rename_selected_profile)
+            dialog.create_button.clicked.connect(self._create_new_profile)
+            dialog.finished.connect(self._cancel_profile_list_loading)
+            self._switch_dialog = dialog
+        return self._switch_dialog
+
     def _switch_profile(self):
         """החלפת פרופיל"""
-        dialog = QDialog(self)
-        dialog.setWindowTitle("החלף פרופיל")
-        dialog.setModal(True)
-        dialog.setMinimumWidth(400)
-        
-        layout = QVBoxLayout()
-        layout.setSpacing(15)
-        
-        # תווית כותרת
-        title_label = QLabel("🔄 בחר פרופיל או צור חדש")
-        title_label.setStyleSheet("font-size: 16pt; font-weight: bold; color: #2196F3; padding: 10px;")
-        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(title_label)
-        
-        # רשימת פרופילים קיימים
+        dialog = self._profile_switch_dialog()
         profiles = self._get_all_profiles()
-        
+        dialog.populate(profiles, self.current_profile_name)
         if profiles:
-            profiles_label = QLabel("פרופילים קיימים:")
-            profiles_label.setStyleSheet("font-weight: bold; font-size: 12pt;")
-            layout.addWidget(profiles_label)
-            
-            profiles_list = QListWidget()
-            profiles_list.setStyleSheet("""
-                QListWidget {
-                    border: 2px solid #2196F3;
-                    border-radius: 5px;
-                    padding: 5px;
-                    font-size: 11pt;
-                }
-                QListWidget::item {
-                    padding: 8px;
-                    border-radius: 3px;
-                }
-                QListWidget::item:selected {
-                    background-color: #2196F3;
-                    color: white;
-                }
-                QListWidget::item:hover {
-                    background-color: #E3F2FD;
-                }
-            """)
-            
-            for profile in profiles:
-                item = QListWidgetItem(f"👤 {profile}")
-                if profile == self.current_profile_name:
-                    item.setText(f"👤 {profile} (פעיל)")
-                    item.setForeground(QColor("#4CAF50"))
-                    font = item.font()
-                    font.setBold(True)
-                    item.setFont(font)
-                profiles_list.addItem(item)
-            
-            profiles_list.setMaximumHeight(200)
-            layout.addWidget(profiles_list)
-            
-            # כפתור טעינת פרופיל
-            load_button = QPushButton("✅ טען פרופיל נבחר")
-            load_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #4CAF50;
-                    color: white;
-                    padding: 10px;
-                    font-size: 12pt;
-                    font-weight: bold;
-                    border-radius: 5px;
-                }
-                QPushButton:hover {
-                    background-color: #45a049;
-                }
-            """)
-            
-            def load_selected_profile():
-                current_item = profiles_list.currentItem()
-                if current_item:
-                    profile_text = current_item.text()
-                    # הסרת האימוג'י וה"(פעיל)" אם קיים
-                    profile_name = profile_text.replace("👤 ", "").replace(" (פעיל)", "").strip()
-                    if profile_name != self.current_profile_name:
-                        # בדיקה אם יש שינויים שלא נשמרו
-                        has_unsaved = False
+            # הדיאלוג נפתח מיד; התמונות ומספרי הרשומות מתמלאים כשהם מוכנים
+            self._start_profile_list_loading(dialog.profiles_list)
+        if dialog.exec() == ProfileSwitchDialog.CREATED:
+            # פתיחת חלון עריכת פרופיל
+            self._show_profile_edit()
+
+    def _load_selected_profile(self):
+        dialog = self._switch_dialog
+        current_item = dialog.profiles_list.currentItem()
+        if current_item:
+            profile_name = current_item.data(Qt.ItemDataRole.UserRole)
+            if profile_name != self.current_profile_name:
+                # בדיקה אם יש שינויים שלא נשמרו
+                has_unsaved = False
+                for i in range(self.tab_widget.count()):
+                    tab = self.tab_widget.widget(i)
+                    if isinstance(tab, ExerciseTab) and tab._has_unsaved_changes:
+                        has_unsaved = True
+                        break
+                
+                # אם יש שינויים, שאל את המשתמש
+                if has_unsaved:
+                    reply = QMessageBox.question(
+                        dialog,
+                        "שינויים לא נשמרו",
+                        f"⚠️ יש שינויים שלא נשמרו בפרופיל הנוכחי!\n\nהאם ברצונך לשמור לפני ההחלפה לפרופיל '{profile_name}'?",
+                        QMessageBox.StandardButton.Save | QMessageBox.StandardButton.Discard | QMessageBox.StandardButton.Cancel,
+                        QMessageBox.StandardButton.Save
+                    )
+                    
+                    if reply == QMessageBox.StandardButton.Cancel:
+                        return  # ביטול ההחלפה
+                    elif reply == QMessageBox.StandardButton.Save:
+                        # שמירת כל הטאבים עם שינויים
                         for i in range(self.tab_widget.count()):
                             tab = self.tab_widget.widget(i)
                             if isinstance(tab, ExerciseTab) and tab._has_unsaved_changes:
-                                has_unsaved = True
-                                break
-                        
-                        # אם יש שינויים, שאל את המשתמש
-                        if has_unsaved:
-                            reply = QMessageBox.question(
-                                dialog,
-                                "שינויים לא נשמרו",
-                                f"⚠️ יש שינויים שלא נשמרו בפרופיל הנוכחי!\n\nהאם ברצונך לשמור לפני ההחלפה לפרופיל '{profile_name}'?",
-                                QMessageBox.StandardButton.Save | QMessageBox.StandardButton.Discard | QMessageBox.StandardButton.Cancel,
-                                QMessageBox.StandardButton.Save
-                            )
-                            
-                            if reply == QMessageBox.StandardButton.Cancel:
-                                return  # ביטול ההחלפה
-                            elif reply == QMessageBox.StandardButton.Save:
-                                # שמירת כל הטאבים עם שינויים
-                                for i in range(self.tab_widget.count()):
-                                    tab = self.tab_widget.widget(i)
-                                    if isinstance(tab, ExerciseTab) and tab._has_unsaved_changes:
-                                        try:
-                                            tab.save_state()
-                                        except Exception as e:
-                                            QMessageBox.warning(dialog, "שגיאה בשמירה", f"שגיאה בשמירת {tab.exercise_name}: {e}")
-                                            return
-                        
-                        # עדכון הפרופיל הנוכחי
-                        self.current_profile_name = profile_name
-                        
-                        # שמירת הפרופיל הפעיל לקובץ
-                        try:
-                            active_profile_path = Path.cwd() / "active_profile.json"
-                            with open(active_profile_path, "w", encoding="utf-8") as f:
-                                json.dump({"active_profile": profile_name}, f, ensure_ascii=False, indent=2)
-                        except Exception:
-                            pass
-                        
-                        # טעינת נתוני הפרופיל
-                        self._load_profile()
-                        # טעינה מחדש של התרגילים
-                        self._reload_exercises()
-                        
-                        QMessageBox.information(dialog, "הצלחה", f"הפרופיל '{profile_name}' נטען בהצלחה!")
-                        dialog.accept()
-                    else:
-                        QMessageBox.information(dialog, "מידע", "פרופיל זה כבר פעיל")
-                else:
-                    QMessageBox.warning(dialog, "שגיאה", "נא לבחור פרופיל מהרשימה")
-            
-            load_button.clicked.connect(load_selected_profile)
-            layout.addWidget(load_button)
-            
-            # כפתור מחיקת פרופיל
-            delete_button = QPushButton("🗑️ מחק פרופיל נבחר")
-            delete_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #f44336;
-                    color: white;
-                    padding: 10px;
-                    font-size: 12pt;
-                    font-weight: bold;
-                    border-radius: 5px;
-                }
-                QPushButton:hover {
-                    background-color: #d32f2f;
-                }
-            """)
-            
-            def delete_selected_profile():
-                current_item = profiles_list.currentItem()
-                if not current_item:
-                    QMessageBox.warning(dialog, "שגיאה", "נא לבחור פרופיל מהרשימה")
-                    return
-                
-                profile_text = current_item.text()
-                profile_name = profile_text.replace("👤 ", "").replace(" (פעיל)", "").strip()
+                                try:
+                                    tab.save_state()
+                                except Exception as e:
+                                    QMessageBox.warning(dialog, "שגיאה בשמירה", f"שגיאה בשמירת {tab.exercise_name}: {e}")
+                                    return
                 
-                # אם זה הפרופיל הפעיל, לא ניתן למחוק
-                if profile_name == self.current_profile_name:
-                    QMessageBox.warning(dialog, "שגיאה", "לא ניתן למחוק את הפרופיל הפעיל הנוכחי.\nנא להחליף לפרופיל אחר לפני המחיקה.")
-                    return
+                self._activate_profile(profile_name)
                 
-                # אישור מחיקה
-                reply = QMessageBox.question(
-                    dialog,
-                    "אישור מחיקה",
-                    f"האם אתה בטוח שברצונך למחוק את הפרופיל '{profile_name}'?\n\n⚠️ פעולה זו תמחק:\n• את פרטי הפרופיל\n• את כל נתוני התרגילים של הפרופיל\n\nהפעולה היא בלתי הפיכה!",
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                    QMessageBox.StandardButton.No
-                )
-                
-                if reply == QMessageBox.StandardButton.Yes:
-                    try:
-                        # מחיקת קובץ הפרופיל
-                        profile_path = Path.cwd() / f"profile_{profile_name}.json"
-                        if profile_path.exists():
-                            os.remove(profile_path)
-                        
-                        # מחיקת כל קבצי התרגילים של הפרופיל
-                        for exercise_file in Path.cwd().glob(f"exercise_{profile_name}_*.json"):
-                            try:
-                                os.remove(exercise_file)
-                            except Exception:
-                                pass
-                        
-                        # הסרת הפרופיל מהרשימה
-                        row = profiles_list.row(current_item)
-                        profiles_list.takeItem(row)
-                        
-                        QMessageBox.information(dialog, "הצלחה", f"הפרופיל '{profile_name}' נמחק בהצלחה!")
-                        
-                        # אם אין יותר פרופילים, נסגור את הדיאלוג
-                        if profiles_list.count() == 0:
-                            QMessageBox.information(dialog, "מידע", "כל הפרופילים נמחקו.\nתוכל ליצור פרופיל חדש למטה.")
-                    except Exception as e:
-                        QMessageBox.warning(dialog, "שגיאה", f"שגיאה במחיקת הפרופיל: {e}")
-            
-            delete_button.clicked.connect(delete_selected_profile)
-            layout.addWidget(delete_button)
-            
-            # כפתור עריכת שם פרופיל
-            rename_button = QPushButton("✏️ ערוך שם פרופיל נבחר")
-            rename_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #FF9800;
-                    color: white;
-                    padding: 10px;
-                    font-size: 12pt;
-                    font-weight: bold;
-                    border-radius: 5px;
-                }
-                QPushButton:hover {
-                    background-color: #F57C00;
-                }
-            """)
-            
-            def rename_selected_profile():
-                current_item = profiles_list.currentItem()
-                if not current_item:
-                    QMessageBox.warning(dialog, "שגיאה", "נא לבחור פרופיל מהרשימה")
-                    return
+                QMessageBox.information(dialog, "הצלחה", f"הפרופיל '{profile_name}' נטען בהצלחה!")
+                dialog.accept()
+            else:
+                QMessageBox.information(dialog, "מידע", "פרופיל זה כבר פעיל")
+        else:
+            QMessageBox.warning(dialog, "שגיאה", "נא לבחור פרופיל מהרשימה")
+
+    def _delete_selected_profile(self):
+        dialog = self._switch_dialog
+        profiles_list = dialog.profiles_list
+        current_item = profiles_list.currentItem()
+        if not current_item:
+            QMessageBox.warning(dialog, "שגיאה", "נא לבחור פרופיל מהרשימה")
+            return
+        
+        profile_name = current_item.data(Qt.ItemDataRole.UserRole)
+        
+        # אם זה הפרופיל הפעיל, לא ניתן למחוק
+        if profile_name == self.current_profile_name:
+            QMessageBox.warning(dialog, "שגיאה", "לא ניתן למחוק את הפרופיל הפעיל הנוכחי.\nנא להחליף לפרופיל אחר לפני המחיקה.")
+            return
+        
+        # אישור מחיקה
+        reply = QMessageBox.question(
+            dialog,
+            "אישור מחיקה",
+            f"האם אתה בטוח שברצונך למחוק את הפרופיל '{profile_name}'?\n\n⚠️ פעולה זו תמחק:\n• את פרטי הפרופיל\n• את כל נתוני התרגילים של הפרופיל\n\nהפעולה היא בלתי הפיכה!",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No
+        )
+        
+        if reply == QMessageBox.StandardButton.Yes:
+            try:
+                # מחיקת קובץ הפרופיל וכל קבצי התרגילים; התמונה נמחקת
+                # מהמאגר רק אם אף פרופיל אחר לא משתמש בה
+                storage.delete_profile(profile_name)
                 
-                profile_text = current_item.text()
-                old_name = profile_text.replace("👤 ", "").replace(" (פעיל)", "").strip()
+                # הסרת הפרופיל מהרשימה
+                row = profiles_list.row(current_item)
+                profiles_list.takeItem(row)
                 
-                # בקש שם חדש
-                new_name, ok = QInputDialog.getText(
-                    dialog,
-                    "עריכת שם פרופיל",
-                    f"שם חדש עבור פרופיל '{old_name}':",
-                    QLineEdit.EchoMode.Normal,
-                    old_name
-                )
+                QMessageBox.information(dialog, "הצלחה", f"הפרופיל '{profile_name}' נמחק בהצלחה!")
                 
-                if ok and new_name.strip() and new_name != old_name:
-                    # בדוק שאין פרופיל עם שם זהה
-                    existing_profiles = self._get_all_profiles()
-                    if new_name in existing_profiles:
-                        QMessageBox.warning(dialog, "שגיאה", f"פרופיל בשם '{new_name}' כבר קיים!")
-                        return
-                    
-                    try:
-                        # שנה שם קובץ הפרופיל
-                        old_profile_path = Path.cwd() / f"profile_{old_name}.json"
-                        new_profile_path = Path.cwd() / f"profile_{new_name}.json"
-                        
-                        if old_profile_path.exists():
-                            old_profile_path.rename(new_profile_path)
-                        
-                        # שנה שם כל קבצי התרגילים
-                        for old_exercise_file in Path.cwd().glob(f"exercise_{old_name}_*.json"):
-                            exercise_name = old_exercise_file.stem.replace(f"exercise_{old_name}_", "")
-                            new_exercise_file = Path.cwd() / f"exercise_{new_name}_{exercise_name}.json"
-                            old_exercise_file.rename(new_exercise_file)
-                        
-                        # אם זה הפרופיל הפעיל, עדכן את השם הפעיל
-                        if old_name == self.current_profile_name:
-                            self.current_profile_name = new_name
-                            active_profile_path = Path.cwd() / "active_profile.json"
-                            with open(active_profile_path, "w", encoding="utf-8") as f:
-                                json.dump({"active_profile": new_name}, f, ensure_ascii=False, indent=2)
-                            self.setWindowTitle(f"{get_version_string()} - {new_name}")
-                        
-                        # עדכן את הרשימה
-                        item_text = f"👤 {new_name}"
-                        if old_name == self.current_profile_name:
-                            item_text += " (פעיל)"
-                            current_item.setForeground(QColor("#4CAF50"))
-                            font = current_item.font()
-                            font.setBold(True)
-                            current_item.setFont(font)
-                        current_item.setText(item_text)
-                        
-                        QMessageBox.information(dialog, "הצלחה", f"שם הפרופיל שונה מ-'{old_name}' ל-'{new_name}'!")
-                    except Exception as e:
-                        QMessageBox.warning(dialog, "שגיאה", f"שגיאה בעריכת שם הפרופיל: {e}")
-            
-            rename_button.clicked.connect(rename_selected_profile)
-            layout.addWidget(rename_button)
-            
-            # מפריד
-            separator = QFrame()
-            separator.setFrameShape(QFrame.Shape.HLine)
-            separator.setStyleSheet("color: #ccc;")
-            layout.addWidget(separator)
+                # אם אין יותר פרופילים, נסגור את הדיאלוג
+                if profiles_list.count() == 0:
+                    QMessageBox.information(dialog, "מידע", "כל הפרופילים נמחקו.\nתוכל ליצור פרופיל חדש למטה.")
+            except Exception as e:
+                QMessageBox.warning(dialog, "שגיאה", f"שגיאה במחיקת הפרופיל: {e}")
+
+    def _rename_selected_profile(self):
+        dialog = self._switch_dialog
+        profiles_list = dialog.profiles_list
+        current_item = profiles_list.currentItem()
+        if not current_item:
+            QMessageBox.warning(dialog, "שגיאה", "נא לבחור פרופיל מהרשימה")
+            return
         
-        # יצירת פרופיל חדש
-        new_profile_label = QLabel("צור פרופיל חדש:")
-        new_profile_label.setStyleSheet("font-weight: bold; font-size: 12pt;")
-        layout.addWidget(new_profile_label)
+        old_name = current_item.data(Qt.ItemDataRole.UserRole)
         
-        name_input = QLineEdit()
-        name_input.setPlaceholderText("הכנס שם לפרופיל החדש")
-        name_input.setStyleSheet("""
-            QLineEdit {
-                padding: 8px;
-                font-size: 11pt;
-                border: 2px solid #2196F3;
-                border-radius: 5px;
-            }
-        """)
-        layout.addWidget(name_input)
-        
-        create_button = QPushButton("➕ צור פרופיל חדש")
-        create_button.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                padding: 10px;
-                font-size: 12pt;
-                font-weight: bold;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #1976D2;
-            }
-        """)
-        
-        def create_new_profile():
-            new_name = name_input.text().strip()
-            if not new_name:
-                QMessageBox.warning(dialog, "שגיאה", "נא להכניס שם לפרופיל")
-                return
-            
-            if new_name in profiles:
-                QMessageBox.warning(dialog, "שגיאה", "פרופיל בשם זה כבר קיים")
+        # בקש שם חדש
+        new_name, ok = QInputDialog.getText(
+            dialog,
+            "עריכת שם פרופיל",
+            f"שם חדש עבור פרופיל '{old_name}':",
+            QLineEdit.EchoMode.Normal,
+            old_name
+        )
+        
+        if ok and new_name.strip() and new_name != old_name:
+            # בדוק שאין פרופיל עם שם זהה
+            existing_profiles = self._get_all_profiles()
+            if new_name in existing_profiles:
+                QMessageBox.warning(dialog, "שגיאה", f"פרופיל בשם '{new_name}' כבר קיים!")
                 return
             
-            # בדיקה אם יש שינויים שלא נשמרו בפרופיל הנוכחי
-            has_unsaved = False
-            for i in range(self.tab_widget.count()):
-                tab = self.tab_widget.widget(i)
-                if isinstance(tab, ExerciseTab) and tab._has_unsaved_changes:
-                    has_unsaved = True
-                    break
-            
-            # אם יש שינויים, שאל את המשתמש
-            if has_unsaved:
-                reply = QMessageBox.question(
-                    dialog,
-                    "שינויים לא נשמרו",
-                    f"⚠️ יש שינויים שלא נשמרו בפרופיל הנוכחי!\n\nהאם ברצונך לשמור לפני יצירת הפרופיל החדש '{new_name}'?",
-                    QMessageBox.StandardButton.Save | QMessageBox.StandardButton.Discard | QMessageBox.StandardButton.Cancel,
-                    QMessageBox.StandardButton.Save
-                )
+            try:
+                # שנה שם קובץ הפרופיל וקבצי התרגילים (התמונה במאגר לא זזה)
+                self._release_archives()
+                storage.rename_profile(old_name, new_name)
                 
-                if reply == QMessageBox.StandardButton.Cancel:
-                    return  # ביטול יצירת הפרופיל
-                elif reply == QMessageBox.StandardButton.Save:
-                    # שמירת כל הטאבים עם שינויים
+                # אם זה הפרופיל הפעיל, עדכן את השם הפעיל
+                if old_name == self.current_profile_name:
+                    self.current_profile_name = new_name
                     for i in range(self.tab_widget.count()):
                         tab = self.tab_widget.widget(i)
-                        if isinstance(tab, ExerciseTab) and tab._has_unsaved_changes:
-                            try:
-                                tab.save_state()
-                            except Exception as e:
-                                QMessageBox.warning(dialog, "שגיאה בשמירה", f"שגיאה בשמירת {tab.exercise_name}: {e}")
-                                return
-            
-            # יצירת פרופיל ריק חדש
-            self.current_profile_name = new_name
-            empty_profile = {
-                "name": "",
-                "height": "",
-                "weight": "",
-                "age": "",
-                "gender": ""
-            }
-            self._save_profile(empty_profile, new_name)
-            self.profile_data = empty_profile
-            self._reload_exercises()  # טעינה מחדש של התרגילים (יהיה ריק)
-            
-            QMessageBox.information(dialog, "הצלחה", f"פרופיל '{new_name}' נוצר בהצלחה!\nכעת תוכל למלא את פרטי הפרופיל.")
-            dialog.accept()
-            # פתיחת חלון עריכת פרופיל
-            self._show_profile_edit()
+                        if isinstance(tab, ExerciseTab):
+                            tab.profile_name = new_name
+                    storage.write_active_profile(new_name)
+                    self.setWindowTitle(f"{get_version_string()} - {new_name}")
+                
+                # עדכן את הרשימה
+                is_active = new_name == self.current_profile_name
+                if is_active:
+                    ProfileSwitchDialog.mark_active(current_item)
+                current_item.setData(Qt.ItemDataRole.UserRole, new_name)
+                details = current_item.data(Qt.ItemDataRole.UserRole + 1)
+                current_item.setText(_profile_item_text(new_name, is_active, *([details] if details else [])))
+                if old_name in self._profile_list_tasks:
+                    # שורה שעוד נטענת - נטען מחדש בשם החדש
+                    self._start_profile_list_loading(profiles_list)
+                
+                QMessageBox.information(dialog, "הצלחה", f"שם הפרופיל שונה מ-'{old_name}' ל-'{new_name}'!")
+            except Exception as e:
+                QMessageBox.warning(dialog, "שגיאה", f"שגיאה בעריכת שם הפרופיל: {e}")
+
+    def _create_new_profile(self):
+        dialog = self._switch_dialog
+        new_name = dialog.name_input.text().strip()
+        if not new_name:
+            QMessageBox.warning(dialog, "שגיאה", "נא להכניס שם לפרופיל")
+            return
         
-        create_button.clicked.connect(create_new_profile)
-        layout.addWidget(create_button)
+        if new_name in self._get_all_profiles():
+            QMessageBox.warning(dialog, "שגיאה", "פרופיל בשם זה כבר קיים")
+            return
         
-        # כפתור סגירה
-        close_button = QPushButton("סגור")
-        close_button.setStyleSheet("""
-            QPushButton {
-                background-color: #6c757d;
-                color: white;
-                padding: 8px;
-                font-size: 11pt;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #5a6268;
-            }
-        """)
-        close_button.clicked.connect(dialog.reject)
-        layout.addWidget(close_button)
+        # בדיקה אם יש שינויים שלא נשמרו בפרופיל הנוכחי
+        has_unsaved = False
+        for i in range(self.tab_widget.count()):
+            tab = self.tab_widget.widget(i)
+            if isinstance(tab, ExerciseTab) and tab._has_unsaved_changes:
+                has_unsaved = True
+                break
+        
+        # אם יש שינויים, שאל את המשתמש
+        if has_unsaved:
+            reply = QMessageBox.question(
+                dialog,
+                "שינויים לא נשמרו",
+                f"⚠️ יש שינויים שלא נשמרו בפרופיל הנוכחי!\n\nהאם ברצונך לשמור לפני יצירת הפרופיל החדש '{new_name}'?",
+                QMessageBox.StandardButton.Save | QMessageBox.StandardButton.Discard | QMessageBox.StandardButton.Cancel,
+                QMessageBox.StandardButton.Save
+            )
+            
+            if reply == QMessageBox.StandardButton.Cancel:
+                return  # ביטול יצירת הפרופיל
+            elif reply == QMessageBox.StandardButton.Save:
+                # שמירת כל הטאבים עם שינויים
+                for i in range(self.tab_widget.count()):
+                    tab = self.tab_widget.widget(i)
+                    if isinstance(tab, ExerciseTab) and tab._has_unsaved_changes:
+                        try:
+                            tab.save_state()
+                        except Exception as e:
+                            QMessageBox.warning(dialog, "שגיאה בשמירה", f"שגיאה בשמירת {tab.exercise_name}: {e}")
+                            return
+        
+        # יצירת פרופיל ריק חדש
+        self.current_profile_name = new_name
+        profile_data = empty_profile()
+        self._save_profile(profile_data, new_name)
+        self.profile_data = profile_data
+        self._reload_exercises()  # טעינה מחדש של התרגילים (יהיה ריק)
+        
+        QMessageBox.information(dialog, "הצלחה", f"פרופיל '{new_name}' נוצר בהצלחה!\nכעת תוכל למלא את פרטי הפרופיל.")
+        # עריכת הפרופיל נפתחת ב-_switch_profile אחרי שהדיאלוג נסגר
+        dialog.done(ProfileSwitchDialog.CREATED)
+    
+    def _activate_profile(self, profile_name: str):
+        """מעבר לפרופיל: שמירתו כפעיל, טעינת נתוניו וטעינת התרגילים שלו"""
+        self.current_profile_name = profile_name
+        
+        # שמירת הפרופיל הפעיל לקובץ
+        try:
+            storage.write_active_profile(profile_name)
+        except Exception:
+            pass
         
-        dialog.setLayout(layout)
-        dialog.exec()
-    
+        # טעינת נתוני הפרופיל
+        self._load_profile()
+        # טעינה מחדש של התרגילים
+        self._reload_exercises()
+
+    def _take_exercise_tab(self, exercise_name: str, profile_name: str = None):
+        """טאב לתרגיל - מהמאגר (מחובר מחדש לנתונים) או חדש אם המאגר ריק"""
+        profile_name = profile_name or self.current_profile_name
+        if self._tab_pool:
+            tab = self._tab_pool.pop()
+            tab.bind(exercise_name, profile_name)
+            return tab
+        return ExerciseTab(exercise_name, profile_name)
+
+    def _recycle_exercise_tab(self, tab):
+        """החזרת טאב שהוסר מה-QTabWidget למאגר"""
+        if not isinstance(tab, ExerciseTab):
+            return
+        if len(self._tab_pool) >= EXERCISE_TAB_POOL_MAX:
+            tab._release_archive()
+            tab.deleteLater()
+            return
+        tab.reset()
+        self._tab_pool.append(tab)
+
+    def _remove_exercise_tab(self, index: int):
+        tab = self.tab_widget.widget(index)
+        self.tab_widget.removeTab(index)
+        self._recycle_exercise_tab(tab)
+
+    @traced
     def _reload_exercises(self):
         """טעינה מחדש של כל התרגילים לפרופיל הנוכחי"""
-        # מחיקת כל הטאבים הקיימים
+        # הטאבים הקיימים חוזרים למאגר ומחוברים לתרגילים של הפרופיל החדש
         while self.tab_widget.count() > 0:
-            self.tab_widget.removeTab(0)
+            self._remove_exercise_tab(0)
         
         # טעינת התרגילים של הפרופיל הנוכחי
         profile_name = self.current_profile_name or "ברירת מחדל"
-        exercise_files = list(Path.cwd().glob(f"exercise_{profile_name}_*.json"))
+        exercise_names = storage.list_exercises(profile_name)
         
-        if exercise_files:
-            for file in exercise_files:
-                exercise_name = file.stem.replace(f"exercise_{profile_name}_", "")
-                tab = ExerciseTab(exercise_name, profile_name)
+        if exercise_names:
+            for exercise_name in exercise_names:
+                tab = self._take_exercise_tab(exercise_name, profile_name)
                 self.tab_widget.addTab(tab, exercise_name)
-                tab.load_state()  # טעינת הנתונים
         else:
             # אם אין תרגילים, נציע ליצור אחד
             QMessageBox.information(self, "אין תרגילים", f"לפרופיל '{profile_name}' אין עדיין תרגילים.\nתוכל להוסיף תרגיל חדש דרך התפריט 'עריכה'.")
@@ -2263,434 +3199,42 @@ class MainWindow(QMainWindow):
         else:
             self._show_profile_edit()
     
+    def _profile_view_dialog(self):
+        if self._view_dialog is None:
+            self._view_dialog = ProfileViewDialog(self)
+        return self._view_dialog
+
+    def _profile_edit_dialog(self):
+        if self._edit_dialog is None:
+            self._edit_dialog = ProfileEditDialog(self._start_profile_image_processing,
+                                                  self._cancel_profile_image_processing, self)
+        return self._edit_dialog
+
+    def _prepare_profile_edit_dialog(self):
+        """בניית טופס הפרטים מראש - ליטוש, פריסה וחלון מוכנים לפני ההצגה הראשונה"""
+        dialog = self._profile_edit_dialog()
+        dialog.ensurePolished()
+        dialog.layout().activate()
+        dialog.winId()
+
     def _show_profile_view(self):
         """הצגת פרופיל קיים במצב צפייה"""
-        dialog = QDialog(self)
-        dialog.setWindowTitle("פרופיל אישי")
-        dialog.setModal(True)
-        dialog.setMinimumWidth(450)
-        
-        layout = QVBoxLayout()
-        layout.setSpacing(20)
-        
-        # תווית כותרת
-        title_label = QLabel("📋 הפרופיל שלי")
-        title_label.setStyleSheet("font-size: 18pt; font-weight: bold; color: #2196F3; padding: 15px;")
-        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(title_label)
-        
-        # תמונת פרופיל
-        profile_image_path = self.profile_data.get("profile_image", "")
-        if profile_image_path and Path(profile_image_path).exists():
-            image_label = QLabel()
-            image_label.setFixedSize(120, 120)
-            image_label.setStyleSheet("""
-                QLabel {
-                    border: 4px solid #2196F3;
-                    border-radius: 60px;
-                    background-color: #E3F2FD;
-                }
-            """)
-            image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            image_label.setScaledContents(True)
-            
-            circular_pixmap = create_circular_pixmap(profile_image_path, 120)
-            image_label.setPixmap(circular_pixmap)
-            
-            image_container = QHBoxLayout()
-            image_container.addStretch()
-            image_container.addWidget(image_label)
-            image_container.addStretch()
-            layout.addLayout(image_container)
-        
-        # תצוגת הפרטים
-        info_widget = QWidget()
-        info_widget.setStyleSheet("""
-            QWidget {
-                background-color: #f8f9fa;
-                border-radius: 10px;
-                padding: 20px;
-            }
-        """)
-        info_layout = QVBoxLayout(info_widget)
-        info_layout.setSpacing(15)
-        
-        # יצירת תוויות עם הפרטים
-        profile_items = [
-            ("👤 שם מלא:", self.profile_data.get("name", ""), "#E3F2FD", "#2196F3"),
-            ("📏 גובה:", f"{self.profile_data.get('height', '')} ס\"מ" if self.profile_data.get('height') else "", "#E8F5E9", "#4CAF50"),
-            ("⚖️ משקל:", f"{self.profile_data.get('weight', '')} ק\"ג" if self.profile_data.get('weight') else "", "#FFF3E0", "#FF9800"),
-            ("🎂 גיל:", self.profile_data.get("age", ""), "#FCE4EC", "#E91E63"),
-            ("👥 מין:", self.profile_data.get("gender", ""), "#F3E5F5", "#9C27B0")
-        ]
-        
-        for label_text, value, bg_color, border_color in profile_items:
-            if value:
-                # יצירת מסגרת לכל פריט
-                item_widget = QWidget()
-                item_widget.setStyleSheet(f"""
-                    QWidget {{
-                        background-color: {bg_color};
-                        border: 2px solid {border_color};
-                        border-radius: 8px;
-                        padding: 12px;
-                    }}
-                """)
-                
-                item_layout = QHBoxLayout(item_widget)
-                item_layout.setContentsMargins(10, 8, 10, 8)
-                
-                label = QLabel(label_text)
-                label.setStyleSheet(f"font-size: 13pt; font-weight: bold; color: {border_color}; border: none; background: transparent;")
-                label.setMinimumWidth(120)
-                
-                value_label = QLabel(str(value))
-                value_label.setStyleSheet("font-size: 13pt; font-weight: 600; color: #212529; border: none; background: transparent;")
-                # יישור לימין רק לגיל
-                if label_text.startswith("🎂"):
-                    value_label.setAlignment(Qt.AlignmentFlag.AlignRight)
-                else:
-                    value_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
-                
-                item_layout.addWidget(value_label)
-                item_layout.addWidget(label)
-                
-                info_layout.addWidget(item_widget)
-        
-        layout.addWidget(info_widget)
-        
-        # כפתורים
-        buttons_layout = QHBoxLayout()
-        
-        edit_button = QPushButton("✏️ ערוך פרופיל")
-        edit_button.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                padding: 10px 20px;
-                font-size: 12pt;
-                font-weight: bold;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #1976D2;
-            }
-        """)
-        edit_button.clicked.connect(lambda: (dialog.close(), self._show_profile_edit()))
-        
-        switch_button = QPushButton("🔄 החלף פרופיל")
-        switch_button.setStyleSheet("""
-            QPushButton {
-                background-color: #FF9800;
-                color: white;
-                padding: 10px 20px;
-                font-size: 12pt;
-                font-weight: bold;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #F57C00;
-            }
-        """)
-        switch_button.clicked.connect(lambda: (dialog.close(), self._switch_profile()))
-        
-        close_button = QPushButton("סגור")
-        close_button.setStyleSheet("""
-            QPushButton {
-                background-color: #6c757d;
-                color: white;
-                padding: 10px 20px;
-                font-size: 12pt;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #5a6268;
-            }
-        """)
-        close_button.clicked.connect(dialog.close)
-        
-        buttons_layout.addWidget(edit_button)
-        buttons_layout.addWidget(switch_button)
-        buttons_layout.addWidget(close_button)
-        
-        layout.addLayout(buttons_layout)
-        
-        dialog.setLayout(layout)
-        dialog.exec()
+        dialog = self._profile_view_dialog()
+        dialog.populate(self.profile_data)
+        result = dialog.exec()
+        if result == ProfileViewDialog.EDIT:
+            self._show_profile_edit()
+        elif result == ProfileViewDialog.SWITCH:
+            self._switch_profile()
     
     def _show_profile_edit(self):
         """הצגת טופס עריכת פרופיל"""
-        dialog = QDialog(self)
-        dialog.setWindowTitle("עריכת פרופיל אישי")
-        dialog.setModal(True)
-        dialog.setMinimumWidth(400)
-        
-        layout = QVBoxLayout()
-        layout.setSpacing(15)
-        
-        # תווית כותרת
-        title_label = QLabel("📋 פרטים אישיים")
-        title_label.setStyleSheet("font-size: 16pt; font-weight: bold; color: #2196F3; padding: 10px;")
-        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(title_label)
-        
-        # תמונת פרופיל
-        image_layout = QHBoxLayout()
-        
-        # תצוגת התמונה
-        profile_image_label = QLabel()
-        profile_image_label.setFixedSize(100, 100)
-        profile_image_label.setStyleSheet("""
-            QLabel {
-                border: 3px solid #2196F3;
-                border-radius: 50px;
-                background-color: #E3F2FD;
-            }
-        """)
-        profile_image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        profile_image_label.setScaledContents(True)
-        
-        # טעינת תמונה קיימת או הצגת טקסט ברירת מחדל
-        current_image_path = self.profile_data.get("profile_image", "")
-        if current_image_path and Path(current_image_path).exists():
-            circular_pixmap = create_circular_pixmap(current_image_path, 100)
-            profile_image_label.setPixmap(circular_pixmap)
-        else:
-            profile_image_label.setText("📷\nאין תמונה")
-            profile_image_label.setStyleSheet("""
-                QLabel {
-                    border: 3px dashed #2196F3;
-                    border-radius: 50px;
-                    background-color: #E3F2FD;
-                    color: #2196F3;
-                    font-size: 10pt;
-                }
-            """)
-        
-        image_layout.addStretch()
-        image_layout.addWidget(profile_image_label)
-        
-        # כפתורי תמונה
-        image_buttons_layout = QVBoxLayout()
-        
-        upload_image_button = QPushButton("📤 העלה תמונה")
-        upload_image_button.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                padding: 8px;
-                font-size: 10pt;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #1976D2;
-            }
-        """)
-        
-        remove_image_button = QPushButton("🗑️ הסר תמונה")
-        remove_image_button.setStyleSheet("""
-            QPushButton {
-                background-color: #f44336;
-                color: white;
-                padding: 8px;
-                font-size: 10pt;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #d32f2f;
-            }
-        """)
-        
-        selected_image_path = [current_image_path]  # משתמשים ברשימה כדי לעדכן מתוך פונקציה פנימית
-        
-        def upload_image():
-            file_path, _ = QFileDialog.getOpenFileName(
-                dialog,
-                "בחר תמונת פרופיל",
-                str(Path.home()),
-                "תמונות (*.png *.jpg *.jpeg *.bmp *.gif)"
-            )
-            
-            if file_path:
-                try:
-                    # פתיחת דיאלוג חיתוך
-                    crop_dialog = ImageCropDialog(file_path, dialog)
-                    if crop_dialog.exec() == QDialog.DialogCode.Accepted:
-                        # קבלת התמונה החתוכה
-                        cropped_pixmap = crop_dialog.get_cropped_pixmap()
-                        
-                        # שמירת התמונה החתוכה - תמיד כ-PNG (תומך בשקיפות)
-                        new_image_path = Path.cwd() / f"profile_image_{self.current_profile_name}.png"
-                        
-                        # שמירה
-                        if not cropped_pixmap.save(str(new_image_path), "PNG"):
-                            raise Exception("שגיאה בשמירת הקובץ")
-                        
-                        selected_image_path[0] = str(new_image_path)
-                        
-                        # עדכון התצוגה
-                        circular_pixmap = create_circular_pixmap(str(new_image_path), 100)
-                        profile_image_label.setPixmap(circular_pixmap)
-                        profile_image_label.setText("")
-                        profile_image_label.setStyleSheet("""
-                            QLabel {
-                                border: 3px solid #2196F3;
-                                border-radius: 50px;
-                                background-color: #E3F2FD;
-                            }
-                        """)
-                except Exception as e:
-                    QMessageBox.warning(dialog, "שגיאה", f"שגיאה בהעלאת התמונה: {e}")
-        
-        def remove_image():
-            selected_image_path[0] = ""
-            profile_image_label.clear()
-            profile_image_label.setText("📷\nאין תמונה")
-            profile_image_label.setStyleSheet("""
-                QLabel {
-                    border: 3px dashed #2196F3;
-                    border-radius: 50px;
-                    background-color: #E3F2FD;
-                    color: #2196F3;
-                    font-size: 10pt;
-                }
-            """)
-            profile_image_label.setScaledContents(False)
-        
-        upload_image_button.clicked.connect(upload_image)
-        remove_image_button.clicked.connect(remove_image)
-        
-        image_buttons_layout.addWidget(upload_image_button)
-        image_buttons_layout.addWidget(remove_image_button)
-        image_buttons_layout.addStretch()
-        
-        image_layout.addLayout(image_buttons_layout)
-        image_layout.addStretch()
-        
-        layout.addLayout(image_layout)
-        
-        # מפריד
-        separator = QFrame()
-        separator.setFrameShape(QFrame.Shape.HLine)
-        separator.setStyleSheet("color: #ccc;")
-        layout.addWidget(separator)
-        
-        # טופס הפרטים
-        form_layout = QGridLayout()
-        form_layout.setSpacing(10)
-        
-        # שם
-        name_label = QLabel("שם מלא:")
-        name_label.setStyleSheet("font-weight: bold;")
-        name_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-        name_input = QLineEdit()
-        name_input.setPlaceholderText("הכנס את שמך המלא")
-        name_input.setText(self.profile_data.get("name", ""))
-        name_input.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        form_layout.addWidget(name_input, 0, 0)
-        form_layout.addWidget(name_label, 0, 1)
-        
-        # גובה
-        height_label = QLabel("גובה (ס\"מ):")
-        height_label.setStyleSheet("font-weight: bold;")
-        height_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-        height_input = QLineEdit()
-        height_input.setPlaceholderText("לדוגמה: 175")
-        height_input.setValidator(QIntValidator(100, 250, self))
-        height_input.setText(self.profile_data.get("height", ""))
-        height_input.setAlignment(Qt.AlignmentFlag.AlignRight)
-        form_layout.addWidget(height_input, 1, 0)
-        form_layout.addWidget(height_label, 1, 1)
-        
-        # משקל
-        weight_label = QLabel("משקל (ק\"ג):")
-        weight_label.setStyleSheet("font-weight: bold;")
-        weight_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-        weight_input = QLineEdit()
-        weight_input.setPlaceholderText("לדוגמה: 75.5")
-        weight_input.setValidator(QDoubleValidator(30.0, 300.0, 1, self))
-        weight_input.setText(self.profile_data.get("weight", ""))
-        weight_input.setAlignment(Qt.AlignmentFlag.AlignRight)
-        form_layout.addWidget(weight_input, 2, 0)
-        form_layout.addWidget(weight_label, 2, 1)
-        
-        # גיל
-        age_label = QLabel("גיל:")
-        age_label.setStyleSheet("font-weight: bold;")
-        age_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-        age_input = QLineEdit()
-        age_input.setPlaceholderText("לדוגמה: 25")
-        age_input.setValidator(QIntValidator(10, 120, self))
-        age_input.setText(self.profile_data.get("age", ""))
-        age_input.setAlignment(Qt.AlignmentFlag.AlignRight)
-        form_layout.addWidget(age_input, 3, 0)
-        form_layout.addWidget(age_label, 3, 1)
-        
-        # מין
-        gender_label = QLabel("מין:")
-        gender_label.setStyleSheet("font-weight: bold;")
-        gender_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-        gender_layout = QHBoxLayout()
-        
-        gender_group = QButtonGroup(dialog)
-        male_radio = QRadioButton("זכר")
-        female_radio = QRadioButton("נקבה")
-        gender_group.addButton(male_radio)
-        gender_group.addButton(female_radio)
-        
-        current_gender = self.profile_data.get("gender", "")
-        if current_gender == "זכר":
-            male_radio.setChecked(True)
-        elif current_gender == "נקבה":
-            female_radio.setChecked(True)
-        
-        gender_layout.addStretch()
-        gender_layout.addWidget(female_radio)
-        gender_layout.addWidget(male_radio)
-        
-        form_layout.addLayout(gender_layout, 4, 0)
-        form_layout.addWidget(gender_label, 4, 1)
-        
-        layout.addLayout(form_layout)
-        
-        # כפתורי פעולה
-        button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Save | QDialogButtonBox.StandardButton.Cancel)
-        button_box.button(QDialogButtonBox.StandardButton.Save).setText("שמור")
-        button_box.button(QDialogButtonBox.StandardButton.Cancel).setText("ביטול")
-        
-        def save_profile():
-            # בדיקת תקינות
-            if not name_input.text().strip():
-                QMessageBox.warning(dialog, "שגיאה", "נא למלא שם")
-                return
-            
-            # קבלת המין שנבחר
-            selected_gender = ""
-            if male_radio.isChecked():
-                selected_gender = "זכר"
-            elif female_radio.isChecked():
-                selected_gender = "נקבה"
-            
-            profile_data = {
-                "name": name_input.text().strip(),
-                "height": height_input.text().strip(),
-                "weight": weight_input.text().strip(),
-                "age": age_input.text().strip(),
-                "gender": selected_gender,
-                "profile_image": selected_image_path[0]
-            }
-            self._save_profile(profile_data)
-            dialog.accept()
+        dialog = self._profile_edit_dialog()
+        dialog.populate(self.profile_data)
+        if dialog.exec() == QDialog.DialogCode.Accepted:
+            self._save_profile(dialog.values())
             # הצגת מסך הפרופיל אחרי השמירה
             self._show_profile_view()
-        
-        button_box.accepted.connect(save_profile)
-        button_box.rejected.connect(dialog.reject)
-        
-        layout.addWidget(button_box)
-        
-        dialog.setLayout(layout)
-        dialog.exec()
 
     def _add_exercise(self):
         title, ok = QInputDialog.getText(self, "הוספת תרגיל", "שם התרגיל:")
@@ -2702,7 +3246,7 @@ class MainWindow(QMainWindow):
                 if isinstance(tab, ExerciseTab):
                     existing.add(tab.exercise_name)
             if title not in existing:
-                tab = ExerciseTab(title, self.current_profile_name)
+                tab = self._take_exercise_tab(title, self.current_profile_name)
                 self.tab_widget.addTab(tab, title)
                 self.tab_widget.setCurrentWidget(tab)
                 # עדכן את גיליון הסיכום
@@ -2762,13 +3306,10 @@ class MainWindow(QMainWindow):
                 QMessageBox.warning(self, "שגיאה", f"תרגיל בשם '{new_name}' כבר קיים!")
                 return
             
-            # שנה את שם הקובץ
-            old_path = Path.cwd() / f"exercise_{self.current_profile_name}_{old_name}.json"
-            new_path = Path.cwd() / f"exercise_{self.current_profile_name}_{new_name}.json"
-            
             try:
-                if old_path.exists():
-                    old_path.rename(new_path)
+                # שנה את שם הקובץ (ומקטעי הארכיון)
+                tab._release_archive()
+                storage.rename_exercise(self.current_profile_name, old_name, new_name)
                 
                 # עדכן את הטאב
                 tab.exercise_name = new_name
@@ -2817,16 +3358,35 @@ class MainWindow(QMainWindow):
             except Exception as e:
                 QMessageBox.warning(self, "שגיאה בשחזור", str(e))
     
-    def _export_to_excel(self):
-        """ייצוא כל העמודים לקובץ אקסל, כל עמוד לגיליון נפרד"""
+    def _collect_export_data(self):
+        """צילום הנתונים מהטבלאות לייצוא, או None אם לא ניתן לייצא כעת"""
         # בדוק אם openpyxl מותקן
         if not _HAS_OPENPYXL:
             QMessageBox.critical(self, "שגיאה", "openpyxl לא מותקן.\n\nכדי לייצא לאקסל, התקן את החבילה:\npip install openpyxl")
-            return
-        
+            return None
+
+        if self._export_task is not None:
+            QMessageBox.information(self, "ייצוא", "ייצוא קודם עדיין רץ")
+            return None
+
+        # הצילום נעשה ב-GUI thread - הכתיבה עצמה רצה ברקע
+        exercises = []
+        for tab_index in range(self.tab_widget.count()):
+            tab = self.tab_widget.widget(tab_index)
+            if isinstance(tab, ExerciseTab):
+                exercises.append((tab.exercise_name, tab._history_rows()))
+
         # בדוק אם יש עמודים לייצא
-        if self.tab_widget.count() == 0:
+        if not exercises:
             QMessageBox.warning(self, "שגיאה", "אין עמודים לייצוא")
+            return None
+        return exercises
+
+    @traced
+    def _export_to_excel(self):
+        """ייצוא כל העמודים לקובץ אקסל, כל עמוד לגיליון נפרד"""
+        exercises = self._collect_export_data()
+        if exercises is None:
             return
         
         # צור שם קובץ ברירת מחדל
@@ -2843,192 +3403,199 @@ class MainWindow(QMainWindow):
         
         if not filename:
             return  # המשתמש ביטל
-        
-        try:
-            # צור חוברת עבודה חדשה
-            wb = Workbook()
-            # הסר את הגיליון הראשון שנוצר אוטומטית
-            if wb.active:
-                wb.remove(wb.active)
-            
-            # עבור על כל העמודים באפליקציה
-            for tab_index in range(self.tab_widget.count()):
-                tab = self.tab_widget.widget(tab_index)
-                if not isinstance(tab, ExerciseTab):
-                    continue
-                
-                exercise_name = tab.exercise_name
-                
-                # צור גיליון חדש לתרגיל הזה
-                ws = wb.create_sheet(title=exercise_name[:31])  # שם גיליון מוגבל ל-31 תווים
-                
-                # הגדר את הגיליון להיות מימין לשמאל (RTL)
-                ws.sheet_view.rightToLeft = True
-                
-                # הוסף כותרות
-                headers = ["תאריך", "משקל", "סטים", "חזרות", "סט אחרון"]
-                ws.append(headers)
-                
-                # עצב את שורת הכותרת
-                header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-                header_font = Font(bold=True, color="FFFFFF", size=12)
-                header_alignment = Alignment(horizontal="center", vertical="center")
-                
-                for col_num, header in enumerate(headers, 1):
-                    cell = ws.cell(row=1, column=col_num)
-                    cell.fill = header_fill
-                    cell.font = header_font
-                    cell.alignment = header_alignment
-                
-                # הוסף נתונים מהטבלה
-                table = tab.table
-                for row in range(table.rowCount()):
-                    row_data = []
-                    
-                    # קרא את כל הערכים מהשורה
-                    values = []
-                    for col in range(table.columnCount()):
-                        item = table.item(row, col)
-                        values.append(item.text() if item else "")
-                    
-                    # הוסף בסדר הפוך: תאריך (4), משקל (3), סטים (2), חזרות (1), סט אחרון (0)
-                    for col_index in [4, 3, 2, 1, 0]:
-                        text = values[col_index]
-                        if not text:
-                            row_data.append("")
-                            continue
-                        
-                        # עמודה 4 מהטבלה היא תאריך
-                        if col_index == 4:
-                            try:
-                                date_obj = datetime.strptime(text, "%d/%m/%Y")
-                                row_data.append(date_obj)
-                            except ValueError:
-                                row_data.append(text)
-                        # עמודה 3 היא משקל - נסיר את "kg"
-                        elif col_index == 3:
-                            clean_text = text.replace("kg", "").replace("KG", "").strip()
-                            parts = text.split()
-                            if parts:
-                                clean_text = parts[0].replace(",", ".")
-                            
-                            try:
-                                if '.' in clean_text or ',' in clean_text:
-                                    row_data.append(float(clean_text.replace(",", ".")))
-                                else:
-                                    row_data.append(int(clean_text))
-                            except (ValueError, AttributeError):
-                                try:
-                                    import re
-                                    number_str = re.search(r'[\d.,]+', text)
-                                    if number_str:
-                                        num_text = number_str.group().replace(",", ".")
-                                        if '.' in num_text:
-                                            row_data.append(float(num_text))
-                                        else:
-                                            row_data.append(int(num_text))
-                                    else:
-                                        row_data.append(0)
-                                except Exception:
-                                    row_data.append(0)
-                        # עמודות 0-2 הן מספרים אחרים
-                        else:
-                            try:
-                                if '.' in text:
-                                    row_data.append(float(text))
-                                else:
-                                    row_data.append(int(text))
-                            except ValueError:
-                                row_data.append(text)
-                    
-                    ws.append(row_data)
-                
-                # הפוך את הטבלה לטבלה חכמה של Excel
-                if _HAS_OPENPYXL:
-                    try:
-                        from openpyxl.worksheet.table import Table, TableStyleInfo
-                    except ImportError:
-                        pass
-                
-                max_row = ws.max_row
-                max_col = ws.max_column
-                if max_row > 1 and _HAS_OPENPYXL:
-                    try:
-                        table_range = f"A1:{get_column_letter(max_col)}{max_row}"
-                        excel_table = Table(displayName=f"DataTable{tab_index}", ref=table_range)
-                        
-                        style = TableStyleInfo(
-                            name="TableStyleMedium2",
-                            showFirstColumn=False,
-                            showLastColumn=False,
-                            showRowStripes=True,
-                            showColumnStripes=False
-                        )
-                        excel_table.tableStyleInfo = style
-                        ws.add_table(excel_table)
-                    except Exception:
-                        pass  # אם הטבלה נכשלת, נמשיך בלי
-                
-                # התאם רוחב עמודות
-                for col in range(1, max_col + 1):
-                    ws.column_dimensions[get_column_letter(col)].width = 15
-                
-                # עצב את עמודת התאריך
-                for row in range(2, max_row + 1):
-                    date_cell = ws.cell(row=row, column=1)
-                    if date_cell.value and isinstance(date_cell.value, datetime):
-                        date_cell.number_format = 'DD/MM/YYYY'
-                
-                # צור גרף קווי
-                if max_row > 1 and _HAS_OPENPYXL:
-                    try:
-                        chart = LineChart()
-                        chart.title = f"גרף משקלים - {exercise_name}"
-                        chart.style = 10
-                        chart.y_axis.title = None
-                        chart.x_axis.title = None
-                        chart.legend = None
-                        
-                        data = Reference(ws, min_col=2, min_row=2, max_col=2, max_row=max_row)
-                        dates = Reference(ws, min_col=1, min_row=2, max_row=max_row)
-                        
-                        chart.add_data(data, titles_from_data=False)
-                        chart.set_categories(dates)
-                        
-                        if len(chart.series) > 0:
-                            series = chart.series[0]
-                            series.smooth = False
-                            
-                            try:
-                                from openpyxl.chart.marker import Marker
-                                from openpyxl.drawing.line import LineProperties
-                                
-                                line = LineProperties()
-                                line.solidFill = "2196F3"
-                                line.width = 25000
-                                series.graphicalProperties.line = line
-                                
-                                marker = Marker(symbol='circle', size=5)
-                                series.marker = marker
-                            except ImportError:
-                                pass  # אם לא ניתן לעצב, נמשיך בלי
-                        
-                        chart.width = 20
-                        chart.height = 12
-                        
-                        ws.add_chart(chart, f"A{max_row + 3}")
-                    except Exception:
-                        pass  # אם הגרף נכשל, נמשיך בלי
-            
-            # שמור את הקובץ
-            wb.save(filename)
-            
-            self.statusBar().showMessage(f"נשמר בהצלחה: {filename}", 3000)
-            QMessageBox.information(self, "הצלחה", f"הקובץ נשמר בהצלחה:\n{filename}\n\nיוצאו {self.tab_widget.count()} תרגילים")
-            
-        except Exception as e:
-            QMessageBox.critical(self, "שגיאה", f"שגיאה בשמירת הקובץ:\n{str(e)}")
+
+        def export(progress, is_cancelled):
+            sheet_count = write_workbook(filename, exercises, progress, is_cancelled)
+            return f"הקובץ נשמר בהצלחה:\n{filename}\n\nיוצאו {sheet_count} תרגילים"
+
+        self._start_export(filename, exercises, export)
+
+    def _update_excel_export(self):
+        """עדכון קובץ אקסל קיים - מוסיף רק רשומות חדשות מאז הייצוא הקודם"""
+        exercises = self._collect_export_data()
+        if exercises is None:
+            return
+
+        filename, _ = QFileDialog.getOpenFileName(
+            self,
+            "בחר קובץ אקסל לעדכון",
+            "",
+            "Excel Files (*.xlsx)"
+        )
+
+        if not filename:
+            return  # המשתמש ביטל
+
+        def export(progress, is_cancelled):
+            sheet_count, row_count = update_workbook(filename, exercises, progress, is_cancelled)
+            if not sheet_count:
+                return f"הקובץ כבר מעודכן:\n{filename}"
+            return f"הקובץ עודכן בהצלחה:\n{filename}\n\nעודכנו {sheet_count} תרגילים ({row_count} רשומות)"
+
+        self._start_export(filename, exercises, export)
+
+    def _start_export(self, filename: str, exercises, export):
+        """הרצת פונקציית ייצוא ברקע עם חלון התקדמות וביטול"""
+        def run(progress, is_cancelled):
+            try:
+                return filename, export(progress, is_cancelled)
+            except ExportCancelled:
+                return filename, None
+
+        total_rows = sum(len(rows) for _, rows in exercises)
+        self._export_progress = QProgressDialog("מייצא לאקסל...", "ביטול", 0, max(total_rows, 1), self)
+        self._export_progress.setWindowTitle("ייצוא לאקסל")
+        self._export_progress.setWindowModality(Qt.WindowModality.WindowModal)
+        self._export_progress.setMinimumDuration(300)
+
+        task = BackgroundTask.with_progress(run)
+        task.signals.progress.connect(self._on_export_progress)
+        task.signals.finished.connect(self._on_export_finished)
+        task.signals.failed.connect(self._on_export_failed)
+        self._export_progress.canceled.connect(task.cancel)
+        self._export_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def _on_export_progress(self, done: int, total: int):
+        if self._export_progress is not None:
+            self._export_progress.setMaximum(max(total, 1))
+            self._export_progress.setValue(done)
+
+    def _finish_export(self):
+        self._export_task = None
+        if self._export_progress is not None:
+            self._export_progress.reset()
+            self._export_progress.deleteLater()
+            self._export_progress = None
+
+    def _on_export_finished(self, result):
+        self._finish_export()
+        filename, message = result
+        if message is None:
+            self.statusBar().showMessage("הייצוא בוטל", 3000)
+            return
+        self.statusBar().showMessage(f"נשמר בהצלחה: {filename}", 3000)
+        QMessageBox.information(self, "הצלחה", message)
+
+    def _on_export_failed(self, message: str):
+        self._finish_export()
+        QMessageBox.critical(self, "שגיאה", f"שגיאה בשמירת הקובץ:\n{message}")
     
+    def _find_exercise_tab(self, exercise_name: str):
+        for i in range(self.tab_widget.count()):
+            tab = self.tab_widget.widget(i)
+            if isinstance(tab, ExerciseTab) and tab.exercise_name == exercise_name:
+                return tab
+        return None
+
+    def _release_archives(self):
+        """סגירת קבצי הארכיון הממופים בכל הטאבים - לפני שינוי שם או מחיקה של קבצים"""
+        for i in range(self.tab_widget.count()):
+            tab = self.tab_widget.widget(i)
+            if isinstance(tab, ExerciseTab):
+                tab._release_archive()
+
+    def _archive_current_tab(self):
+        current = self.tab_widget.currentWidget()
+        if not isinstance(current, ExerciseTab):
+            return
+        keep = archive.ARCHIVE_KEEP_RECENT
+        old_count = current.table.rowCount() - keep
+        if old_count < archive.ARCHIVE_MIN_BATCH:
+            QMessageBox.information(
+                self, "ארכיון",
+                f"בעמוד '{current.exercise_name}' אין מספיק רשומות ישנות.\n"
+                f"בטבלה נשארות {keep} הרשומות האחרונות, וההעברה מתבצעת מ-{archive.ARCHIVE_MIN_BATCH} רשומות ישנות ומעלה.")
+            return
+        reply = QMessageBox.question(
+            self,
+            "העברה לארכיון",
+            f"להעביר {old_count:,} רשומות ישנות מהעמוד '{current.exercise_name}' לארכיון?\n\n"
+            f"הרשומות ימשיכו להופיע בסיכום, בגרף ובייצוא לאקסל, אבל לא יהיו ניתנות לעריכה.\n"
+            f"לא ניתן לבטל פעולה זו עם Undo.",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+        )
+        if reply == QMessageBox.StandardButton.Yes:
+            try:
+                current.archive_old_entries(keep)
+            except Exception as e:
+                QMessageBox.warning(self, "שגיאה בהעברה לארכיון", str(e))
+
+    def _import_history(self):
+        """ייבוא היסטוריה מקובץ אקסל/CSV - הקובץ מנותח ברקע"""
+        if self._import_task is not None:
+            QMessageBox.information(self, "ייבוא", "ייבוא קודם עדיין רץ")
+            return
+
+        filename, _ = QFileDialog.getOpenFileName(
+            self,
+            "בחר קובץ לייבוא",
+            "",
+            "Excel / CSV (*.xlsx *.xlsm *.csv)"
+        )
+        if not filename:
+            return  # המשתמש ביטל
+
+        if filename.lower().endswith((".xlsx", ".xlsm")) and not _HAS_OPENPYXL:
+            QMessageBox.critical(self, "שגיאה", "openpyxl לא מותקן.\n\nכדי לייבא מאקסל, התקן את החבילה:\npip install openpyxl")
+            return
+
+        # CSV ללא עמודת תרגיל ייובא לתרגיל הנוכחי
+        current = self.tab_widget.currentWidget()
+        default_exercise = current.exercise_name if isinstance(current, ExerciseTab) else None
+
+        task = BackgroundTask(read_import_file, filename, default_exercise)
+        task.signals.finished.connect(self._on_import_parsed)
+        task.signals.failed.connect(self._on_import_failed)
+        self._import_task = task
+        self.statusBar().showMessage("מנתח קובץ ייבוא...")
+        QThreadPool.globalInstance().start(task)
+
+    def _on_import_failed(self, message: str):
+        self._import_task = None
+        self.statusBar().clearMessage()
+        QMessageBox.critical(self, "שגיאה", f"שגיאה בקריאת הקובץ:\n{message}")
+
+    def _on_import_parsed(self, result):
+        self._import_task = None
+        self.statusBar().clearMessage()
+
+        if not result.row_count:
+            details = "\n".join(result.errors[:10])
+            QMessageBox.warning(self, "ייבוא", f"לא נמצאו רשומות תקינות בקובץ.\n\n{details}")
+            return
+
+        text = f"נמצאו {result.row_count} רשומות ב-{len(result.rows_by_exercise)} תרגילים."
+        if result.errors:
+            text += f"\n\n{len(result.errors)} שורות לא תקינות ידולגו:\n" + "\n".join(result.errors[:10])
+            if len(result.errors) > 10:
+                text += "\n..."
+        reply = QMessageBox.question(
+            self,
+            "אישור ייבוא",
+            text + "\n\nלייבא?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.Yes
+        )
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+
+        # כל תרגיל נכנס כמנה אחת - undo אחד וחישוב סיכום אחד
+        added = 0
+        for exercise_name, rows in result.rows_by_exercise.items():
+            tab = self._find_exercise_tab(exercise_name)
+            if tab is None:
+                tab = self._take_exercise_tab(exercise_name, self.current_profile_name)
+                self.tab_widget.addTab(tab, exercise_name)
+            added += tab.add_entries(rows, skip_existing=True)
+
+        self._update_summary_tab()
+        skipped = result.row_count - added
+        message = f"יובאו {added} רשומות"
+        if skipped:
+            message += f" ({skipped} כפולות דולגו)"
+        self.statusBar().showMessage(message, 4000)
+
     def _undo_current_tab(self):
         """ביטול הפעולה האחרונה בעמוד הנוכחי"""
         current = self.tab_widget.currentWidget()
@@ -3106,14 +3673,18 @@ class MainWindow(QMainWindow):
             try:
                 # מחיקת כל השורות מהטבלה
                 current.table.setRowCount(0)
-                
+
+                # מחיקת הרשומות שבארכיון
+                current._release_archive()
+                storage.delete_archive(current.profile_name, current.exercise_name)
+
                 # איפוס כפתורי המחיקה
                 current.btn_pop.setEnabled(False)
                 current.btn_delete_row.setEnabled(False)
-                
+
                 # עדכון הסיכום
                 current._update_summary()
-                
+
                 # סימון שיש שינויים לא שמורים
                 current._has_unsaved_changes = True
                 
@@ -3141,30 +3712,28 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.StandardButton.Yes:
             try:
                 # שימוש בפורמט הקובץ החדש עם שם הפרופיל
-                path = Path.cwd() / f"exercise_{current.profile_name}_{current.exercise_name}.json"
-                if path.exists():
-                    os.remove(path)
+                current._release_archive()
+                storage.delete_exercise(current.profile_name, current.exercise_name)
                 # מחיקת קובץ ישן אם קיים
                 old_path = Path.cwd() / f"exercise_state_{current.exercise_name}.json"
                 if old_path.exists():
                     os.remove(old_path)
                 
                 # מחק את הטאב הנוכחי
-                idx = self.tab_widget.currentIndex()
-                self.tab_widget.removeTab(idx)
-                current.deleteLater()
+                exercise_name = current.exercise_name
+                self._remove_exercise_tab(self.tab_widget.currentIndex())
 
                 # אם זה היה הטאב האחרון, הצג דיאלוג ליצירת תרגיל חדש
                 if self.tab_widget.count() == 0:
                     title, ok = QInputDialog.getText(self, "תרגיל ראשון", "שם התרגיל:")
                     if ok and title.strip():
-                        tab = ExerciseTab(title, self.current_profile_name)
+                        tab = self._take_exercise_tab(title, self.current_profile_name)
                         self.tab_widget.addTab(tab, title)
                 
                 # עדכן את גיליון הסיכום
                 self._update_summary_tab()
 
-                self.statusBar().showMessage(f"נמחקו כל הנתונים מהעמוד '{current.exercise_name}'", 2000)
+                self.statusBar().showMessage(f"נמחקו כל הנתונים מהעמוד '{exercise_name}'", 2000)
             except Exception as e:
                 QMessageBox.warning(self, "שגיאה בניקוי", str(e))
 
@@ -3180,7 +3749,8 @@ class MainWindow(QMainWindow):
             try:
                 # מחק את כל הקבצים של הפרופיל הנוכחי
                 profile_name = self.current_profile_name or "ברירת מחדל"
-                for file in Path.cwd().glob(f"exercise_{profile_name}_*.json"):
+                self._release_archives()
+                for file in storage.exercise_files(profile_name):
                     try:
                         os.remove(file)
                     except Exception:
@@ -3194,17 +3764,14 @@ class MainWindow(QMainWindow):
 
                 # סגור את כל הטאבים
                 while self.tab_widget.count() > 0:
-                    tab = self.tab_widget.widget(0)
-                    self.tab_widget.removeTab(0)
-                    if isinstance(tab, ExerciseTab):
-                        tab.deleteLater()
+                    self._remove_exercise_tab(0)
 
                 self.statusBar().showMessage("נמחקו כל הנתונים וכל העמודים", 2000)
 
                 # הצג דיאלוג ליצירת תרגיל חדש
                 title, ok = QInputDialog.getText(self, "תרגיל ראשון", "שם התרגיל:")
                 if ok and title.strip():
-                    tab = ExerciseTab(title)
+                    tab = self._take_exercise_tab(title, profile_name)
                     self.tab_widget.addTab(tab, title)
 
             except Exception as e:
@@ -3259,162 +3826,74 @@ class MainWindow(QMainWindow):
 
 
 def apply_stylesheet(app: Any):
-    # הגדרת סגנון כללי לאפליקציה
-    app.setStyleSheet("""
-        QMainWindow {
-            background-color: #f0f0f0;
-        }
-        QTabWidget::pane {
-            border: 1px solid #cccccc;
-            background: white;
-            border-radius: 5px;
-        }
-        QTabBar::tab {
-            background: #e1e1e1;
-            border: 1px solid #cccccc;
-            padding: 8px 15px;
-            margin-right: 2px;
-            border-top-left-radius: 4px;
-            border-top-right-radius: 4px;
-            font-size: 11pt;
-        }
-        QTabBar::tab:selected {
-            background: white;
-            border-bottom-color: white;
-        }
-        QLineEdit {
-            padding: 6px;
-            border: 1px solid #cccccc;
-            border-radius: 4px;
-            background-color: white;
-            font-size: 11pt;
-        }
-        QLineEdit:focus {
-            border: 1px solid #2196F3;
-        }
-        QPushButton {
-            padding: 6px 12px;
-            background-color: #2196F3;
-            color: white;
-            border: none;
-            border-radius: 4px;
-            font-size: 11pt;
-        }
-        QPushButton:hover {
-            background-color: #1976D2;
-        }
-        QPushButton:disabled {
-            background-color: #BDBDBD;
-        }
-        QTableWidget {
-            border: 1px solid #cccccc;
-            border-radius: 4px;
-            font-size: 11pt;
-        }
-        QTableWidget::item {
-            padding: 4px;
-            min-height: 24px;
-        }
-        QTableWidget {
-            padding: 4px;
-            min-height: 400px;
-        }
-        QTableWidget {
-            gridline-color: #cccccc;
-        }
-        QTableWidget::item:selected {
-            background-color: #E3F2FD;
-            color: black;
-        }
-        QHeaderView::section {
-            background-color: #f5f5f5;
-            padding: 6px;
-            border: 1px solid #cccccc;
-            font-size: 11pt;
-            font-weight: bold;
-        }
-        QLabel {
-            font-size: 11pt;
-        }
-        QMenu {
-            background-color: white;
-            border: 1px solid #cccccc;
-        }
-        QMenu::item {
-            padding: 6px 20px;
-        }
-        QMenu::item:selected {
-            background-color: #E3F2FD;
-        }
-        QStatusBar {
-            background-color: #f5f5f5;
-            color: #333333;
-            font-size: 10pt;
-        }
-        QToolBar {
-            background-color: #f5f5f5;
-            border-bottom: 1px solid #cccccc;
-            spacing: 5px;
-            padding: 5px;
-        }
-        QToolBar QToolButton {
-            background-color: #2196F3;
-            color: white;
-            border-radius: 4px;
-            padding: 5px 10px;
-            font-size: 11pt;
-        }
-        QToolBar QToolButton:hover {
-            background-color: #1976D2;
-        }
-        QMessageBox {
-            font-size: 11pt;
-        }
-        QMessageBox QPushButton {
-            min-width: 80px;
-        }
-    """)
+    # סגנון כל האפליקציה - גיליון אחד שנבנה מראש (theme.py), מפוענח פעם אחת
+    app.setStyleSheet(STYLESHEET)
+
+class _FirstPaintProbe(QObject):
+    """רישום הציור הראשון של הווידג'ט שהוא מותקן עליו"""
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint:
+            _mark_startup("first_paint")
+            obj.removeEventFilter(self)
+        return False
+
+
+def write_startup_report(path: str):
+    """דוח זמני העלייה: נקודות זמן, זמן כל קבוצת ייבוא ואילו ספריות כבדות נטענו"""
+    import json
+
+    imports = {}
+    previous = 0.0
+    for name, at in _STARTUP_MARKS.items():
+        if name.startswith("import:"):
+            imports[name.split(":", 1)[1]] = at - previous
+            previous = at
+    report = {
+        "version": __version__,
+        "frozen": bool(getattr(sys, "frozen", False)),
+        "marks_ms": _STARTUP_MARKS,
+        "imports_ms": imports,
+        "loaded": {name: name in sys.modules for name in ("PySide6", "matplotlib", "openpyxl")},
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
 
 if __name__ == "__main__":
     if not _HAS_QT:
         raise RuntimeError("PySide6 is required to run the GUI. Install requirements from requirements.txt")
+    trace.init_from_env()
+    if os.environ.get("WORKOUT_TRACEMALLOC"):
+        memreport.start()
     app = QApplication(sys.argv)
     apply_stylesheet(app)
     window = MainWindow()
+    _mark_startup("window_constructed")
+    first_paint_probe = _FirstPaintProbe(window)
+    window.tab_widget.installEventFilter(first_paint_probe)
 
     # חפש קבצי שמירה קיימים לפרופיל הנוכחי
     profile_name = window.current_profile_name or "ברירת מחדל"
-    exercise_files = list(Path.cwd().glob(f"exercise_{profile_name}_*.json"))
+    exercise_names = storage.list_exercises(profile_name)
     
     # אם אין קבצים לפרופיל הנוכחי, חפש קבצים ישנים (exercise_state_) ומיגרר אותם
-    if not exercise_files:
-        old_files = list(Path.cwd().glob("exercise_state_*.json"))
-        if old_files and not window.current_profile_name:
-            # מיגרציה של קבצים ישנים לפורמט החדש
+    if not exercise_names and not window.current_profile_name:
+        # מיגרציה של קבצים ישנים לפורמט החדש
+        exercise_names = storage.migrate_legacy_exercises("ברירת מחדל")
+        if exercise_names:
             window.current_profile_name = "ברירת מחדל"
             profile_name = "ברירת מחדל"
-            for old_file in old_files:
-                old_name = old_file.stem.replace("exercise_state_", "")
-                new_file = Path.cwd() / f"exercise_{profile_name}_{old_name}.json"
-                try:
-                    import shutil
-                    shutil.copy2(old_file, new_file)
-                except Exception:
-                    pass
-            exercise_files = list(Path.cwd().glob(f"exercise_{profile_name}_*.json"))
     
-    if exercise_files:
+    if exercise_names:
         # אם יש קבצים קיימים, טען אותם
-        for file in exercise_files:
-            # חלץ את שם התרגיל מהקובץ
-            exercise_name = file.stem.replace(f"exercise_{profile_name}_", "")
-            tab = ExerciseTab(exercise_name, profile_name)
+        for exercise_name in exercise_names:
+            tab = window._take_exercise_tab(exercise_name, profile_name)
             window.tab_widget.addTab(tab, exercise_name)
     else:
         # אם אין קבצים קיימים, בקש שם תרגיל חדש
         title, ok = QInputDialog.getText(window, "תרגיל ראשון", "שם התרגיל:")
         if ok and title.strip():
-            tab = ExerciseTab(title, profile_name)
+            tab = window._take_exercise_tab(title, profile_name)
             window.tab_widget.addTab(tab, title)
 
     window.show()
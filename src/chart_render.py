@@ -0,0 +1,175 @@
+"""
+רינדור גרף המשקלים לתמונת PNG - ללא תלות ב-Qt
+
+הרינדור מתבצע עם matplotlib בצד ה-Agg בלבד, כך שניתן להריץ אותו
+ב-thread רקע. התוצאות נשמרות במטמון לפי hash של הנתונים והגודל.
+"""
+import hashlib
+import importlib.util
+import io
+import threading
+from collections import OrderedDict
+from datetime import datetime
+
+# matplotlib נטען רק ברינדור הראשון כדי לא להאט את עליית האפליקציה
+HAS_MPL = importlib.util.find_spec("matplotlib") is not None
+
+# צבעי נקודות לפי שינוי מהאימון הקודם: (צבע, גודל)
+_POINT_FIRST = ('#2196F3', 120)
+_POINT_UP = ('#4CAF50', 140)
+_POINT_DOWN = ('#f44336', 140)
+_POINT_SAME = ('#FF9800', 120)
+
+
+def chart_cache_key(title: str, points: list[tuple[datetime, float]],
+                    width: int, height: int, dpi: int = 100) -> str:
+    """מפתח מטמון לגרף - hash של הכותרת, הנתונים והגודל"""
+    h = hashlib.sha1()
+    h.update(f"{title}|{width}x{height}@{dpi}|{len(points)}|".encode("utf-8"))
+    for d, w in points:
+        h.update(f"{d.toordinal()}:{w!r};".encode("ascii"))
+    return h.hexdigest()
+
+
+class ChartCache:
+    """מטמון LRU לתמונות גרף מוכנות (בטוח לשימוש מכמה threads)"""
+
+    def __init__(self, max_entries: int = 32):
+        self.max_entries = max_entries
+        self._items: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str):
+        with self._lock:
+            data = self._items.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, key: str, data: bytes):
+        with self._lock:
+            self._items[key] = data
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def size_bytes(self) -> int:
+        with self._lock:
+            return sum(len(data) for data in self._items.values())
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __len__(self):
+        return len(self._items)
+
+
+# מטמון משותף לתצוגה ולייצוא
+chart_cache = ChartCache()
+
+
+def render_weight_chart(title: str, points: list[tuple[datetime, float]],
+                        width: int, height: int, dpi: int = 100) -> bytes:
+    """ציור גרף משקלים לתמונת PNG בגודל width x height פיקסלים"""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    from matplotlib.ticker import FuncFormatter
+    import matplotlib.dates as mdates
+
+    # מיין לפי תאריך
+    points = sorted(points, key=lambda x: x[0])
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+
+    figure = Figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+    FigureCanvasAgg(figure)
+    # הגדר סגנון גרף
+    figure.patch.set_facecolor('#ffffff')
+    ax = figure.add_subplot(111)
+
+    dates = mdates.date2num(xs)
+
+    # ציור הקו הבסיסי
+    ax.plot(dates, ys, '-', color='#2196F3', linewidth=3, alpha=0.7)
+
+    # נקודות צבעוניות לפי עלייה/ירידה/ללא שינוי - קריאה אחת לכל הנקודות
+    styles = []
+    for i, y in enumerate(ys):
+        if i == 0:
+            styles.append(_POINT_FIRST)
+        elif y > ys[i-1]:
+            styles.append(_POINT_UP)
+        elif y < ys[i-1]:
+            styles.append(_POINT_DOWN)
+        else:
+            styles.append(_POINT_SAME)
+    ax.scatter(dates, ys, s=[s for _, s in styles], c=[c for c, _ in styles], marker='o',
+               edgecolors='white', linewidths=2.5, zorder=5, alpha=0.9)
+
+    ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%d/%m/%Y'))
+    figure.autofmt_xdate(rotation=30)
+
+    # כותרת מעוצבת (הפיכת הטקסט לתצוגה נכונה של עברית)
+    LRM = '\u200E'
+    ax.set_title(f"{LRM}{title[::-1]}",
+                 fontsize=18,
+                 fontweight='bold',
+                 pad=20,
+                 color='#1976D2',
+                 bbox=dict(boxstyle='round,pad=0.5', facecolor='#E3F2FD',
+                           edgecolor='#2196F3', linewidth=1.5))
+
+    # הוספת kg למספרים על ציר Y
+    ax.yaxis.set_major_formatter(FuncFormatter(lambda x, pos: f'{int(x)} kg'))
+
+    # רשת עדינה מאחורי הנתונים
+    ax.grid(True, linestyle='--', alpha=0.4, color='#BDBDBD', linewidth=0.8)
+    ax.grid(True, which='minor', linestyle=':', alpha=0.2, color='#E0E0E0')
+    ax.set_axisbelow(True)
+
+    # עיצוב שולי הגרף
+    spine_colors = {
+        'top': '#64B5F6',
+        'bottom': '#1976D2',
+        'left': '#1976D2',
+        'right': '#64B5F6'
+    }
+    for position, spine in ax.spines.items():
+        spine.set_color(spine_colors.get(position, '#90A4AE'))
+        spine.set_linewidth(2.5)
+        spine.set_capstyle('round')
+
+    ax.tick_params(axis='both', colors='#424242', labelsize=10, width=1.5, length=6)
+    ax.tick_params(axis='x', rotation=0)
+    ax.set_facecolor('#FAFAFA')
+
+    figure.tight_layout(pad=2.0)
+
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format="png", dpi=dpi)
+    return buffer.getvalue()
+
+
+def render_weight_chart_cached(title: str, points: list[tuple[datetime, float]],
+                               width: int, height: int, dpi: int = 100,
+                               cache: ChartCache = None) -> bytes:
+    """רינדור גרף דרך המטמון - מחזיר תמונה קיימת אם הנתונים והגודל זהים"""
+    cache = cache if cache is not None else chart_cache
+    key = chart_cache_key(title, points, width, height, dpi)
+    data = cache.get(key)
+    if data is None:
+        data = render_weight_chart(title, points, width, height, dpi)
+        cache.put(key, data)
+    return data
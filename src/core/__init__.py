@@ -0,0 +1,34 @@
+"""
+ליבת האפליקציה - מודלים, שמירה, חישובי סיכום וייבוא/ייצוא, ללא תלות ב-Qt
+"""
+from .aggregation import (
+    PROGRESS_LEVELS,
+    ExerciseSummary,
+    ProgressLevel,
+    chart_points,
+    progress_level,
+    row_volume,
+    summarize,
+    total_volume,
+)
+from .history import UndoHistory
+from .models import DATE_FORMAT, WorkoutEntry, empty_profile, format_weight_text, parse_weight_text
+from . import storage
+
+__all__ = [
+    "DATE_FORMAT",
+    "PROGRESS_LEVELS",
+    "ExerciseSummary",
+    "ProgressLevel",
+    "UndoHistory",
+    "WorkoutEntry",
+    "chart_points",
+    "empty_profile",
+    "format_weight_text",
+    "parse_weight_text",
+    "progress_level",
+    "row_volume",
+    "storage",
+    "summarize",
+    "total_volume",
+]
@@ -0,0 +1,112 @@
+"""
+חישובי סיכום על היסטוריית אימונים - נפח, ממוצעים ורמת התקדמות
+"""
+from dataclasses import dataclass
+from datetime import datetime
+
+from .models import COL_DATE, COL_LAST_REPS, COL_REPS, COL_SETS, COL_WEIGHT, DATE_FORMAT, parse_weight_text
+
+# (מינימום, מקסימום, שם, אימוג'י, מספר רמה)
+PROGRESS_LEVELS = (
+    (0, 10, "טירון", "🌱", 0),
+    (10, 30, "מתחיל", "🌿", 1),
+    (30, 60, "מתקדם", "🌳", 2),
+    (60, 100, "מומחה", "🏆", 3),
+    (100, float('inf'), "אגדי", "👑", 4),
+)
+
+
+def row_volume(row) -> float:
+    """נפח שורה: (סטים-1 * חזרות * משקל) + (סט אחרון * משקל); 0 לשורה לא תקינה"""
+    try:
+        values = [row[COL_WEIGHT], row[COL_SETS], row[COL_REPS], row[COL_LAST_REPS]]
+        if not all(values):
+            return 0.0
+        weight = parse_weight_text(values[0])
+        sets = int(values[1])
+        reps = int(values[2])
+        last_reps = int(values[3])
+    except (ValueError, TypeError, IndexError):
+        return 0.0
+    return ((sets - 1) * reps * weight) + (last_reps * weight)
+
+
+def total_volume(rows) -> float:
+    """סך המשקל המצטבר מכל השורות"""
+    return sum(row_volume(row) for row in rows)
+
+
+def chart_points(rows) -> list[tuple[datetime, float]]:
+    """נקודות (תאריך, משקל) לגרף; שורות לא תקינות מדולגות"""
+    points = []
+    for row in rows:
+        try:
+            weight = parse_weight_text(row[COL_WEIGHT]) if row[COL_WEIGHT] else 0.0
+            date = datetime.strptime(row[COL_DATE].strip(), DATE_FORMAT) if row[COL_DATE] else datetime.now()
+        except (ValueError, IndexError, AttributeError):
+            continue
+        points.append((date, weight))
+    return points
+
+
+@dataclass(frozen=True)
+class ExerciseSummary:
+    count: int
+    total_weight: float
+
+    @property
+    def avg_weight(self) -> float:
+        return self.total_weight / self.count if self.count else 0.0
+
+
+def summarize(rows) -> ExerciseSummary:
+    rows = list(rows)
+    return ExerciseSummary(len(rows), total_volume(rows))
+
+
+@dataclass(frozen=True)
+class ProgressLevel:
+    name: str
+    emoji: str
+    level_num: int
+    percent: float
+    next_milestone: str
+    dots: str
+
+
+def progress_level(exercises_count: int) -> ProgressLevel:
+    """רמת התקדמות לפי מספר האימונים"""
+    current = PROGRESS_LEVELS[0]
+    for level in PROGRESS_LEVELS:
+        if level[0] <= exercises_count < level[1]:
+            current = level
+            break
+    min_val, max_val, name, emoji, level_num = current
+
+    if max_val == float('inf'):
+        percent = 100
+        next_milestone = "מקסימום!"
+    else:
+        percent = (exercises_count - min_val) / (max_val - min_val) * 100
+        next_milestone = f"עד {max_val}"
+
+    return ProgressLevel(name, emoji, level_num, percent, next_milestone,
+                         progress_dots(level_num, percent, len(PROGRESS_LEVELS)))
+
+
+def progress_dots(level_num: int, percent: float, total_levels: int = 5) -> str:
+    """פס נקודות: רמות שהושלמו מלאות, הנוכחית חלקית לפי האחוז"""
+    dots = []
+    for i in range(total_levels):
+        if i < level_num:
+            dots.append("●")
+        elif i == level_num:
+            if percent >= 66:
+                dots.append("◉")
+            elif percent >= 33:
+                dots.append("◔")
+            else:
+                dots.append("○")
+        else:
+            dots.append("○")
+    return "━".join(dots)
@@ -0,0 +1,135 @@
+"""
+ארכיון היסטוריה - מקטעים קבועים של רשומות ישנות
+
+רשומות ישנות עוברות מהטבלה הפעילה לקבצי .tmwh שלא משתנים יותר
+(archive_{פרופיל}_{תרגיל}.{מספר}.tmwh). המקטעים נקראים דרך mmap,
+והסיכום והגרף מחושבים ישירות מהעמודות (memoryview, או מערכי NumPy
+על אותו זיכרון כש-NumPy מותקן) - בלי לבנות שורות טקסט.
+הטבלה בטאב מחזיקה רק את הרשומות האחרונות.
+"""
+from datetime import datetime
+
+from . import binformat, storage
+from .aggregation import ExerciseSummary, chart_points, row_volume
+
+# כמה רשומות אחרונות נשארות בטבלה בהעברה לארכיון
+ARCHIVE_KEEP_RECENT = 200
+# מתחת לזה לא שווה ליצור מקטע חדש
+ARCHIVE_MIN_BATCH = 100
+
+
+def split_rows(rows, keep_recent: int = ARCHIVE_KEEP_RECENT, min_batch: int = ARCHIVE_MIN_BATCH):
+    """(ישנות לארכיון, אחרונות לטבלה); אם אין מספיק ישנות - ([], rows)"""
+    rows = list(rows)
+    cut = len(rows) - keep_recent
+    if cut < max(min_batch, 1):
+        return [], rows
+    return rows[:cut], rows[cut:]
+
+
+def write_segment(profile_name: str, exercise_name: str, rows, base_dir=None):
+    """כתיבת מקטע חדש (לא דחוס, כדי שייקרא ב-mmap); מחזיר את הנתיב"""
+    segments = storage.archive_segments(profile_name, exercise_name, base_dir)
+    index = segments[-1][0] + 1 if segments else 1
+    path = storage.archive_segment_path(profile_name, exercise_name, index, base_dir)
+    binformat.write_rows(path, rows)
+    return path
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _segment_volume(segment: binformat.HistoryFile) -> float:
+    """נפח כל השורות במקטע, לפי אותה נוסחה כמו row_volume"""
+    np = _numpy()
+    if np is not None and len(segment):
+        weight = np.frombuffer(segment.weight_g, dtype=np.uint32) / 1000
+        sets = np.frombuffer(segment.sets, dtype=np.uint16).astype(np.int64)
+        reps = np.frombuffer(segment.reps, dtype=np.uint16).astype(np.int64)
+        last_reps = np.frombuffer(segment.last_reps, dtype=np.uint16).astype(np.int64)
+        volumes = ((sets - 1) * reps + last_reps) * weight
+        if segment.exceptions:
+            volumes[list(segment.exceptions)] = 0.0
+        total = float(volumes.sum())
+    else:
+        exceptions = segment.exceptions
+        total = sum(((sets - 1) * reps + last_reps) * grams / 1000
+                    for index, (grams, sets, reps, last_reps)
+                    in enumerate(zip(segment.weight_g, segment.sets, segment.reps, segment.last_reps))
+                    if index not in exceptions)
+    return total + sum(row_volume(row) for row in segment.exceptions.values())
+
+
+def _segment_points(segment: binformat.HistoryFile) -> list[tuple[datetime, float]]:
+    ordinals = segment.ordinals()
+    next(ordinals)
+    exceptions = segment.exceptions
+    dates = {}
+    points = []
+    for index, (ordinal, grams) in enumerate(zip(ordinals, segment.weight_g)):
+        if index in exceptions:
+            points += chart_points([exceptions[index]])
+            continue
+        day = dates.get(ordinal)
+        if day is None:
+            day = dates[ordinal] = datetime.fromordinal(ordinal)
+        points.append((day, grams / 1000))
+    return points
+
+
+class ExerciseArchive:
+    """
+    כל מקטעי הארכיון של תרגיל, פתוחים ב-mmap.
+    הסיכום מחושב פעם אחת בפתיחה (המקטעים לא משתנים); יש לסגור לפני
+    שינוי שם או מחיקה של הקבצים.
+    """
+
+    def __init__(self, profile_name: str, exercise_name: str, base_dir=None):
+        self.segments = []
+        try:
+            for _, path in storage.archive_segments(profile_name, exercise_name, base_dir):
+                self.segments.append(binformat.HistoryFile(path))
+        except binformat.FormatError:
+            self.close()
+            raise
+        self.count = sum(len(segment) for segment in self.segments)
+        self.total_volume = sum(_segment_volume(segment) for segment in self.segments)
+        self._points = None
+
+    def __len__(self):
+        return self.count
+
+    def summary(self) -> ExerciseSummary:
+        return ExerciseSummary(self.count, self.total_volume)
+
+    def chart_points(self) -> list[tuple[datetime, float]]:
+        if self._points is None:
+            self._points = [point for segment in self.segments for point in _segment_points(segment)]
+        return self._points
+
+    def rows(self) -> list[list[str]]:
+        """כל השורות בפורמט הטבלה - לייצוא"""
+        return [row for segment in self.segments for row in segment.rows()]
+
+    def close(self):
+        for segment in self.segments:
+            segment.close()
+        self.segments = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_archive(profile_name: str, exercise_name: str, base_dir=None):
+    """ExerciseArchive, או None אם לתרגיל אין ארכיון"""
+    if not storage.archive_segments(profile_name, exercise_name, base_dir):
+        return None
+    return ExerciseArchive(profile_name, exercise_name, base_dir)
@@ -0,0 +1,146 @@
+"""
+מאגר נכסים לפי תוכן (content-addressed) - תמונות פרופיל
+
+כל קובץ נשמר פעם אחת בשם ה-SHA-256 של התוכן (assets/{hash}.png), כך
+שהעלאה חוזרת של אותה תמונה או שני פרופילים עם אותה תמונה חולקים קובץ.
+הפרופיל שומר הפניה יחסית "asset:{hash}.png" במקום נתיב מלא.
+מונה ההפניות נשמר ב-assets/refs.json; כשהוא מגיע לאפס הקובץ נמחק.
+collect_garbage מחשב את המונים מחדש מההפניות החיות ומוחק יתומים
+(למשל אחרי העתקה ידנית של קבצי פרופיל או העלאה שלא נשמרה).
+גרסאות מוקטנות ({hash}@64.png וכו') שייכות לנכס ונמחקות יחד איתו.
+"""
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+ASSET_DIR = "assets"
+ASSET_PREFIX = "asset:"
+REFS_FILE = "refs.json"
+# נכס חדש מזה לא נמחק באיסוף - ייתכן שהועלה עכשיו ועוד לא נשמר בפרופיל
+GC_GRACE_SECONDS = 600
+
+
+def is_asset_ref(value) -> bool:
+    return isinstance(value, str) and value.startswith(ASSET_PREFIX)
+
+
+class AssetStore:
+    def __init__(self, base_dir=None):
+        self._base_dir = base_dir
+
+    @property
+    def directory(self) -> Path:
+        base = Path(self._base_dir) if self._base_dir is not None else Path.cwd()
+        return base / ASSET_DIR
+
+    def path(self, ref: str) -> Path:
+        name = ref[len(ASSET_PREFIX):] if is_asset_ref(ref) else ref
+        return self.directory / Path(name).name
+
+    def resolve(self, value: str) -> str:
+        """נתיב הקובץ עבור הפניה לנכס; ערך אחר (נתיב ישן) מוחזר כמו שהוא"""
+        return str(self.path(value)) if is_asset_ref(value) else value
+
+    def add(self, data: bytes, suffix: str = ".png") -> str:
+        """הוספת תוכן (אם אינו קיים כבר); מחזיר הפניה. לא משנה את מונה ההפניות"""
+        name = hashlib.sha256(data).hexdigest() + suffix
+        path = self.directory / name
+        if not path.exists():
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(name + ".tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        return ASSET_PREFIX + name
+
+    def add_file(self, path) -> str:
+        return self.add(Path(path).read_bytes(), Path(path).suffix or ".png")
+
+    # --- מונה הפניות ---
+
+    def _read_refs(self) -> dict:
+        try:
+            with open(self.directory / REFS_FILE, "r", encoding="utf-8") as f:
+                refs = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return refs if isinstance(refs, dict) else {}
+
+    def _write_refs(self, refs: dict):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.directory / REFS_FILE, "w", encoding="utf-8") as f:
+            json.dump(refs, f, indent=2)
+
+    def ref_count(self, ref: str) -> int:
+        return self._read_refs().get(self.path(ref).name, 0)
+
+    def acquire(self, ref: str) -> int:
+        refs = self._read_refs()
+        name = self.path(ref).name
+        refs[name] = refs.get(name, 0) + 1
+        self._write_refs(refs)
+        return refs[name]
+
+    def release(self, ref: str) -> int:
+        """הורדת המונה; באפס - מחיקת הנכס והגרסאות שלו"""
+        refs = self._read_refs()
+        name = self.path(ref).name
+        count = max(refs.get(name, 0) - 1, 0)
+        if count:
+            refs[name] = count
+        else:
+            refs.pop(name, None)
+            self._delete(name)
+        self._write_refs(refs)
+        return count
+
+    def _files_of(self, name: str) -> list[Path]:
+        """הקובץ עצמו והגרסאות המוקטנות שלו"""
+        stem, suffix = os.path.splitext(name)
+        return [self.directory / name] + list(self.directory.glob(f"{stem}@*{suffix}"))
+
+    def _delete(self, name: str):
+        for file in self._files_of(name):
+            try:
+                file.unlink()
+            except OSError:
+                pass
+
+    def collect_garbage(self, live_refs) -> list[str]:
+        """
+        מונים מחדש לפי live_refs (כל ההפניות הקיימות, עם חזרות) ומחיקת
+        נכסים שאין אליהם הפניה. מחזיר את שמות הנכסים שנמחקו.
+        """
+        counts = {}
+        for ref in live_refs:
+            if is_asset_ref(ref):
+                name = self.path(ref).name
+                counts[name] = counts.get(name, 0) + 1
+        if not self.directory.exists():
+            return []
+
+        removed = []
+        now = time.time()
+        for file in self.directory.iterdir():
+            name = file.name
+            if "@" in name:
+                # גרסה מוקטנת נשארת כל עוד הנכס שלה קיים
+                stem, suffix = os.path.splitext(name)
+                main = stem.split("@", 1)[0] + suffix
+                if main in counts or (self.directory / main).exists():
+                    continue
+            if name == REFS_FILE or name in counts:
+                continue
+            try:
+                if now - file.stat().st_mtime < GC_GRACE_SECONDS:
+                    continue
+            except OSError:
+                continue
+            if name.endswith(".tmp"):
+                file.unlink(missing_ok=True)
+            else:
+                self._delete(name)
+            removed.append(name)
+        self._write_refs(counts)
+        return removed
@@ -0,0 +1,248 @@
+"""
+פורמט בינארי קומפקטי להיסטוריית תרגיל (.tmwh)
+
+מבנה הקובץ (little-endian):
+    כותרת: magic "TMWH", גרסה, דגלים, מספר שורות, גודל ה-payload
+    payload (דחוס ב-zlib אם הדגל FLAG_ZLIB דלוק):
+        int32   תאריך בסיס (ordinal)
+        uint32  משקל בגרמים              x n
+        int16   הפרש ימים מהשורה הקודמת    x n
+        uint16  סטים                      x n
+        uint16  חזרות                     x n
+        uint16  סט אחרון                  x n
+        uint32  אורך + JSON של שורות חריגות [[אינדקס, שורה], ...]
+
+שורה שלא חוזרת בדיוק לאותו טקסט אחרי קידוד (למשל "62,5 Kg" או תאריך
+בפורמט אחר) נשמרת כמו שהיא ברשימת החריגות - כך ההמרה מ-JSON ובחזרה
+ללא אובדן. קובץ לא דחוס נקרא דרך mmap והעמודות הן memoryview ללא העתקה.
+"""
+import json
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from datetime import date
+from itertools import accumulate
+
+from .models import DATE_FORMAT, format_weight_text
+
+MAGIC = b"TMWH"
+FORMAT_VERSION = 1
+FLAG_ZLIB = 1
+SUFFIX = ".tmwh"
+
+_HEADER = struct.Struct("<4sHHII")
+_U32 = struct.Struct("<I")
+_I32 = struct.Struct("<i")
+_LITTLE = sys.byteorder == "little"
+
+# (שם, typecode של array/memoryview, גודל בבתים) - לפי סדר הופעה בקובץ
+_COLUMNS = (
+    ("weight_g", "I", 4),
+    ("date_delta", "h", 2),
+    ("sets", "H", 2),
+    ("reps", "H", 2),
+    ("last_reps", "H", 2),
+)
+_U16_MAX = 0xFFFF
+_I16_MIN, _I16_MAX = -0x8000, 0x7FFF
+
+
+class FormatError(ValueError):
+    """הקובץ אינו בפורמט .tmwh תקין"""
+
+
+def _parse_count(text):
+    """ערך uint16 אם הטקסט הוא הייצוג הקנוני שלו, אחרת None"""
+    try:
+        value = int(text)
+    except (ValueError, TypeError):
+        return None
+    return value if str(value) == text and 0 <= value <= _U16_MAX else None
+
+
+def _parse_grams(text):
+    try:
+        grams = round(float(text.split()[0]) * 1000)
+    except (ValueError, TypeError, AttributeError, IndexError):
+        return None
+    if not 0 <= grams <= 0xFFFFFFFF or format_weight_text(grams / 1000) != text:
+        return None
+    return grams
+
+
+def _parse_ordinal(text):
+    try:
+        day = date(int(text[6:10]), int(text[3:5]), int(text[0:2]))
+    except (ValueError, TypeError):
+        return None
+    return day.toordinal() if day.strftime(DATE_FORMAT) == text else None
+
+
+class _Memo(dict):
+    """מטמון לפענוח ערכים שחוזרים (משקלים, תאריכים) - רוב השורות חוזרות על אותם טקסטים"""
+
+    def __init__(self, fn):
+        super().__init__()
+        self.fn = fn
+
+    def __missing__(self, key):
+        value = self[key] = self.fn(key)
+        return value
+
+
+def encode(rows, compress: bool = False) -> bytes:
+    """קידוד שורות בפורמט הטבלה לבתים של קובץ .tmwh"""
+    columns = {name: array(code) for name, code, _ in _COLUMNS}
+    weight_g, date_delta = columns["weight_g"], columns["date_delta"]
+    sets_column, reps_column, last_column = columns["sets"], columns["reps"], columns["last_reps"]
+    counts, grams_of, ordinal_of = _Memo(_parse_count), _Memo(_parse_grams), _Memo(_parse_ordinal)
+    exceptions = []
+    base_ordinal = None
+    previous = None
+    for index, row in enumerate(rows):
+        values = None
+        if len(row) == 5:
+            try:
+                last_reps, reps, sets = counts[row[0]], counts[row[1]], counts[row[2]]
+                grams, ordinal = grams_of[row[3]], ordinal_of[row[4]]
+            except TypeError:  # ערך שאינו hashable
+                last_reps = reps = sets = grams = ordinal = None
+            if None not in (last_reps, reps, sets, grams, ordinal):
+                delta = ordinal - previous if previous is not None else 0
+                if _I16_MIN <= delta <= _I16_MAX:
+                    values = (grams, delta, sets, reps, last_reps)
+                    previous = ordinal
+                    if base_ordinal is None:
+                        base_ordinal = ordinal
+        if values is None:
+            exceptions.append([index, [str(v) for v in row]])
+            values = (0, 0, 0, 0, 0)
+        weight_g.append(values[0])
+        date_delta.append(values[1])
+        sets_column.append(values[2])
+        reps_column.append(values[3])
+        last_column.append(values[4])
+
+    parts = [_I32.pack(base_ordinal or 0)]
+    for name, _, _ in _COLUMNS:
+        column = columns[name]
+        if not _LITTLE:
+            column.byteswap()
+        parts.append(column.tobytes())
+    exceptions_json = json.dumps(exceptions, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    parts += [_U32.pack(len(exceptions_json)), exceptions_json]
+
+    payload = b"".join(parts)
+    flags = 0
+    if compress:
+        payload = zlib.compress(payload, 6)
+        flags |= FLAG_ZLIB
+    row_count = len(columns["sets"])
+    return _HEADER.pack(MAGIC, FORMAT_VERSION, flags, row_count, len(payload)) + payload
+
+
+class HistoryFile:
+    """
+    קריאת קובץ .tmwh. קובץ לא דחוס ממופה עם mmap והעמודות (weight_g,
+    date_delta, sets, reps, last_reps) הן memoryview על הקובץ עצמו.
+    יש לסגור (או להשתמש ב-with) לפני שמחליפים או מוחקים את הקובץ.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        self._mmap = None
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._parse(memoryview(self._mmap))
+        except (ValueError, OSError, struct.error) as e:
+            self.close()
+            raise FormatError(f"{path}: {e}") from e
+
+    def _parse(self, view: memoryview):
+        if len(view) < _HEADER.size:
+            raise FormatError("קובץ קצר מדי")
+        magic, version, flags, count, payload_size = _HEADER.unpack_from(view)
+        if magic != MAGIC:
+            raise FormatError("חתימה שגויה")
+        if version > FORMAT_VERSION:
+            raise FormatError(f"גרסת פורמט {version} חדשה מהנתמכת ({FORMAT_VERSION})")
+        payload = view[_HEADER.size:_HEADER.size + payload_size]
+        if flags & FLAG_ZLIB:
+            payload = memoryview(zlib.decompress(payload))
+        self.compressed = bool(flags & FLAG_ZLIB)
+        self._count = count
+
+        (self.base_ordinal,) = _I32.unpack_from(payload)
+        offset = _I32.size
+        for name, code, width in _COLUMNS:
+            raw = payload[offset:offset + width * count]
+            if _LITTLE:
+                column = raw.cast(code)
+            else:
+                column = array(code, raw)
+                column.byteswap()
+                column = memoryview(column)
+            setattr(self, name, column)
+            offset += width * count
+        (exceptions_size,) = _U32.unpack_from(payload, offset)
+        offset += _U32.size
+        exceptions = json.loads(bytes(payload[offset:offset + exceptions_size]).decode("utf-8"))
+        self.exceptions = {index: row for index, row in exceptions}
+
+    def __len__(self):
+        return self._count
+
+    def ordinals(self):
+        """ordinal של כל שורה (שורה חריגה מקבלת את הקודם)"""
+        return accumulate(self.date_delta, initial=self.base_ordinal)
+
+    def rows(self) -> list[list[str]]:
+        """השורות המקוריות בפורמט הטבלה"""
+        counts = _Memo(str)
+        weights = _Memo(lambda grams: format_weight_text(grams / 1000))
+        dates = _Memo(lambda ordinal: date.fromordinal(ordinal).strftime(DATE_FORMAT))
+        ordinals = self.ordinals()
+        next(ordinals)
+        rows = [[counts[last_reps], counts[reps], counts[sets], weights[grams], dates[ordinal]]
+                for ordinal, grams, sets, reps, last_reps
+                in zip(ordinals, self.weight_g, self.sets, self.reps, self.last_reps)]
+        for index, row in self.exceptions.items():
+            rows[index] = list(row)
+        return rows
+
+    def close(self):
+        for name, _, _ in _COLUMNS:
+            column = self.__dict__.pop(name, None)
+            if isinstance(column, memoryview):
+                column.release()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                pass  # יש עדיין memoryview חיצוני על הקובץ - ייסגר באיסוף הזבל
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_rows(path) -> list[list[str]]:
+    with HistoryFile(path) as history:
+        return history.rows()
+
+
+def write_rows(path, rows, compress: bool = False):
+    """כתיבה אטומית - קובץ זמני ואז החלפה"""
+    data = encode(rows, compress=compress)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
@@ -0,0 +1,432 @@
+"""
+ייצוא נתוני תרגילים לאקסל - ללא תלות ב-Qt
+
+הייצוא עובד במצב write-only של openpyxl: שורות נכתבות לקובץ בזרימה,
+כך שצריכת הזיכרון נשארת קבועה גם בפרופילים עם היסטוריה ארוכה.
+"""
+import hashlib
+import importlib.util
+import json
+import os
+import warnings
+from datetime import datetime
+from typing import Callable, Iterable
+
+from .trace import traced
+
+HAS_OPENPYXL = importlib.util.find_spec("openpyxl") is not None
+
+# כותרות הגיליון (סדר העמודות בקובץ האקסל)
+EXPORT_HEADERS = ["תאריך", "משקל", "סטים", "חזרות", "סט אחרון"]
+
+# כל כמה שורות מדווחים התקדמות ובודקים ביטול
+_PROGRESS_EVERY = 500
+
+# גיליון מוסתר ששומר לכל תרגיל מה יוצא בפעם האחרונה (לעדכון מצטבר)
+STATE_SHEET = "_export_state"
+_STATE_HEADERS = ["exercise", "sheet", "rows", "last_row", "digest"]
+
+
+class ExportCancelled(Exception):
+    """הייצוא בוטל על ידי המשתמש"""
+
+
+def parse_weight(text: str):
+    """המרת משקל כמו '20 Kg' / '12,5kg' למספר (int אם שלם)"""
+    clean = text.strip().lower().replace("kg", " ").split()
+    if not clean:
+        return 0
+    number = clean[0].replace(",", ".")
+    try:
+        value = float(number)
+    except ValueError:
+        return 0
+    return int(value) if value.is_integer() and "." not in number else value
+
+
+def export_row(row: list[str]) -> list:
+    """המרת שורת טבלה (סט אחרון, חזרות, סטים, משקל, תאריך) לערכי אקסל מוקלדים"""
+    last_reps, reps, sets, weight, date = (list(row) + [""] * 5)[:5]
+    values = []
+
+    if date:
+        try:
+            values.append(datetime.strptime(date, "%d/%m/%Y"))
+        except ValueError:
+            values.append(date)
+    else:
+        values.append("")
+
+    values.append(parse_weight(weight) if weight else "")
+
+    for text in (sets, reps, last_reps):
+        if not text:
+            values.append("")
+            continue
+        try:
+            values.append(float(text) if "." in text else int(text))
+        except ValueError:
+            values.append(text)
+    return values
+
+
+def _sheet_title(name: str, used: set) -> str:
+    """שם גיליון חוקי וייחודי (מוגבל ל-31 תווים)"""
+    base = name[:31]
+    for ch in '[]:*?/\\':
+        base = base.replace(ch, "_")
+    title = base or "Sheet"
+    n = 2
+    while title in used:
+        suffix = f" ({n})"
+        title = base[:31 - len(suffix)] + suffix
+        n += 1
+    used.add(title)
+    return title
+
+
+class _Progress:
+    """מונה שורות משותף לדיווח התקדמות ובדיקת ביטול"""
+
+    def __init__(self, total: int, progress=None, is_cancelled=None):
+        self.total = total
+        self.done = 0
+        self._progress = progress
+        self._is_cancelled = is_cancelled
+
+    def step(self):
+        self.done += 1
+        if self.done % _PROGRESS_EVERY == 0:
+            self.check_cancelled()
+            if self._progress:
+                self._progress(self.done, self.total)
+
+    def check_cancelled(self):
+        if self._is_cancelled and self._is_cancelled():
+            raise ExportCancelled()
+
+    def finish(self):
+        if self._progress:
+            self._progress(self.total, self.total)
+
+
+def _header_style():
+    from openpyxl.styles import Alignment, Font, PatternFill
+    return (PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid"),
+            Font(bold=True, color="FFFFFF", size=12),
+            Alignment(horizontal="center", vertical="center"))
+
+
+def _prepare_sheet(ws):
+    """הגדרות גיליון - במצב write-only חייבות לבוא לפני השורה הראשונה"""
+    from openpyxl.utils import get_column_letter
+    ws.sheet_view.rightToLeft = True
+    for col in range(1, len(EXPORT_HEADERS) + 1):
+        ws.column_dimensions[get_column_letter(col)].width = 15
+
+
+def _add_table(ws, display_name: str, max_row: int):
+    """טבלה חכמה של Excel על טווח הנתונים"""
+    from openpyxl.utils import get_column_letter
+    from openpyxl.worksheet.table import Table, TableColumn, TableStyleInfo
+
+    table_range = f"A1:{get_column_letter(len(EXPORT_HEADERS))}{max_row}"
+    excel_table = Table(displayName=display_name, ref=table_range)
+    # במצב write-only העמודות לא נקראות מהגיליון - מגדירים אותן ידנית
+    excel_table.tableColumns = [TableColumn(id=i, name=name)
+                                for i, name in enumerate(EXPORT_HEADERS, 1)]
+    excel_table.tableStyleInfo = TableStyleInfo(
+        name="TableStyleMedium2",
+        showFirstColumn=False,
+        showLastColumn=False,
+        showRowStripes=True,
+        showColumnStripes=False
+    )
+    with warnings.catch_warnings():
+        # האזהרה על עמודות ידניות לא רלוונטית - העמודות כבר הוגדרו
+        warnings.simplefilter("ignore", UserWarning)
+        ws.add_table(excel_table)
+
+
+def _add_chart(ws, exercise_name: str, max_row: int):
+    """גרף קווי של המשקלים מתחת לנתונים"""
+    from openpyxl.chart import LineChart, Reference
+    from openpyxl.chart.marker import Marker
+    from openpyxl.drawing.line import LineProperties
+
+    chart = LineChart()
+    chart.title = f"גרף משקלים - {exercise_name}"
+    chart.style = 10
+    chart.y_axis.title = None
+    chart.x_axis.title = None
+    chart.legend = None
+    data = Reference(ws, min_col=2, min_row=2, max_col=2, max_row=max_row)
+    dates = Reference(ws, min_col=1, min_row=2, max_row=max_row)
+    chart.add_data(data, titles_from_data=False)
+    chart.set_categories(dates)
+    if chart.series:
+        series = chart.series[0]
+        series.smooth = False
+        line = LineProperties()
+        line.solidFill = "2196F3"
+        line.width = 25000
+        series.graphicalProperties.line = line
+        series.marker = Marker(symbol='circle', size=5)
+    chart.width = 20
+    chart.height = 12
+    ws.add_chart(chart, f"A{max_row + 3}")
+
+
+def _rows_digest(rows: list[list[str]]) -> str:
+    """טביעה של כל השורות שיוצאו - לזיהוי עריכה של שורה ישנה"""
+    return hashlib.sha1(json.dumps([list(row) for row in rows], ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def _state_entry(sheet_title: str, rows: list[list[str]]) -> dict:
+    return {
+        "sheet": sheet_title,
+        "rows": len(rows),
+        "last_row": json.dumps(list(rows[-1]), ensure_ascii=False) if rows else "",
+        "digest": _rows_digest(rows),
+    }
+
+
+def _save_atomic(wb, filename: str):
+    """שמירה לקובץ זמני והחלפה - כך שקובץ קיים לא נהרס אם השמירה נכשלה"""
+    tmp_filename = f"{filename}.tmp"
+    try:
+        wb.save(tmp_filename)
+        os.replace(tmp_filename, filename)
+    finally:
+        if os.path.exists(tmp_filename):
+            os.remove(tmp_filename)
+
+
+def _close_streams(wb):
+    """סגירת הגיליונות שנכתבו בזרימה (ביטול לפני השמירה) - אחרת הם נשארים פתוחים"""
+    for ws in wb.worksheets:
+        if not ws.closed:
+            ws.close()
+
+
+@traced("excel.write_workbook")
+def write_workbook(filename: str, exercises: Iterable[tuple[str, list[list[str]]]],
+                   progress: Callable[[int, int], None] = None,
+                   is_cancelled: Callable[[], bool] = None) -> int:
+    """
+    כתיבת חוברת אקסל חדשה - גיליון לכל תרגיל עם טבלה וגרף.
+
+    exercises: זוגות (שם תרגיל, שורות בפורמט הטבלה).
+    progress(done, total) נקרא מדי פעם; אם is_cancelled() מחזיר True
+    נזרק ExportCancelled והקובץ הקיים לא נפגע.
+    מחזיר את מספר הגיליונות שנכתבו.
+    """
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+
+    exercises = list(exercises)
+    counter = _Progress(sum(len(rows) for _, rows in exercises), progress, is_cancelled)
+
+    wb = Workbook(write_only=True)
+    header_fill, header_font, header_alignment = _header_style()
+    used_titles = set()
+    state = {}
+
+    try:
+        for sheet_index, (exercise_name, rows) in enumerate(exercises):
+            ws = wb.create_sheet(title=_sheet_title(exercise_name, used_titles))
+            _prepare_sheet(ws)
+
+            header = []
+            for text in EXPORT_HEADERS:
+                cell = WriteOnlyCell(ws, value=text)
+                cell.fill = header_fill
+                cell.font = header_font
+                cell.alignment = header_alignment
+                header.append(cell)
+            ws.append(header)
+
+            for row in rows:
+                values = export_row(row)
+                if isinstance(values[0], datetime):
+                    date_cell = WriteOnlyCell(ws, value=values[0])
+                    date_cell.number_format = 'DD/MM/YYYY'
+                    values[0] = date_cell
+                ws.append(values)
+                counter.step()
+
+            max_row = len(rows) + 1
+            if max_row > 1:
+                _add_table(ws, f"DataTable{sheet_index}", max_row)
+                _add_chart(ws, exercise_name, max_row)
+            state[exercise_name] = _state_entry(ws.title, rows)
+
+        state_ws = wb.create_sheet(title=STATE_SHEET)
+        state_ws.sheet_state = "hidden"
+        state_ws.append(_STATE_HEADERS)
+        for exercise_name, entry in state.items():
+            state_ws.append([exercise_name, entry["sheet"], entry["rows"], entry["last_row"], entry["digest"]])
+
+        counter.check_cancelled()
+    except ExportCancelled:
+        _close_streams(wb)
+        raise
+    _save_atomic(wb, filename)
+    counter.finish()
+    return len(exercises)
+
+
+def _read_state(wb) -> dict:
+    if STATE_SHEET not in wb.sheetnames:
+        return {}
+    state = {}
+    for values in wb[STATE_SHEET].iter_rows(min_row=2, values_only=True):
+        exercise_name, sheet_title, row_count, last_row, digest = (list(values) + [None] * 5)[:5]
+        if exercise_name:
+            state[str(exercise_name)] = {
+                "sheet": str(sheet_title),
+                "rows": int(row_count or 0),
+                "last_row": last_row or "",
+                "digest": digest or "",  # ריק בקבצים מגרסה קודמת
+            }
+    return state
+
+
+def exercise_names_by_sheet(wb) -> dict[str, str]:
+    """
+    שם גיליון -> שם התרגיל המקורי, לפי גיליון המצב. שמות הגיליונות מקוצרים
+    ל-31 תווים ותווים אסורים מוחלפים, כך שהם לא תמיד שווים לשם התרגיל.
+    """
+    return {entry["sheet"]: exercise_name for exercise_name, entry in _read_state(wb).items()}
+
+
+def _write_state(wb, state: dict):
+    if STATE_SHEET in wb.sheetnames:
+        del wb[STATE_SHEET]
+    ws = wb.create_sheet(title=STATE_SHEET)
+    ws.sheet_state = "hidden"
+    ws.append(_STATE_HEADERS)
+    for exercise_name, entry in state.items():
+        ws.append([exercise_name, entry["sheet"], entry["rows"], entry["last_row"], entry["digest"]])
+
+
+def _remove_charts(ws):
+    """
+    מחיקת הגרפים של גיליון לפני הוספת גרף בטווח החדש. ל-openpyxl אין API
+    ציבורי להסרת גרף, ולכן זו הגישה היחידה לרשימה הפרטית _charts (קיימת
+    בכל גרסאות 3.x; הגרסה נעולה ב-requirements.txt). אם היא תיעלם נכשלים
+    במפורש - אחרת כל עדכון היה מוסיף גרף כפול.
+    """
+    charts = getattr(ws, "_charts", None)
+    if not isinstance(charts, list):
+        import openpyxl
+        raise RuntimeError(f"openpyxl {openpyxl.__version__}: אין גישה לגרפים של הגיליון")
+    charts.clear()
+
+
+def _append_rows(ws, rows, counter: _Progress):
+    for row in rows:
+        ws.append(export_row(row))
+        date_cell = ws.cell(row=ws.max_row, column=1)
+        if isinstance(date_cell.value, datetime):
+            date_cell.number_format = 'DD/MM/YYYY'
+        counter.step()
+
+
+def _new_rows(entry: dict, rows: list[list[str]]):
+    """השורות שנוספו מאז הייצוא הקודם, או None אם ההיסטוריה נערכה"""
+    exported = entry["rows"]
+    if exported > len(rows):
+        return None
+    if entry["digest"]:
+        if _rows_digest(rows[:exported]) != entry["digest"]:
+            return None
+    elif exported and json.dumps(list(rows[exported - 1]), ensure_ascii=False) != entry["last_row"]:
+        return None
+    return rows[exported:]
+
+
+@traced("excel.update_workbook")
+def update_workbook(filename: str, exercises: Iterable[tuple[str, list[list[str]]]],
+                    progress: Callable[[int, int], None] = None,
+                    is_cancelled: Callable[[], bool] = None) -> tuple[int, int]:
+    """
+    עדכון חוברת שנוצרה ב-write_workbook: מוסיף רק שורות חדשות לכל תרגיל.
+
+    תרגיל שההיסטוריה שלו נערכה מאז הייצוא הקודם (שורות נמחקו או שונו)
+    נכתב מחדש בגיליון שלו בלבד; תרגיל חדש מקבל גיליון חדש.
+    הטבלה והגרף של כל גיליון שהשתנה מתעדכנים לטווח החדש.
+    מחזיר (מספר גיליונות שעודכנו, מספר שורות שנכתבו).
+    """
+    from openpyxl import load_workbook
+    from openpyxl.utils import get_column_letter
+
+    exercises = list(exercises)
+    all_rows = dict(exercises)
+    wb = load_workbook(filename)
+    state = _read_state(wb)
+    header_fill, header_font, header_alignment = _header_style()
+    used_titles = set(wb.sheetnames)
+    table_names = {name for ws in wb.worksheets for name in ws.tables.keys()}
+
+    # חישוב העבודה מראש כדי לדווח התקדמות מדויקת
+    plan = []
+    for exercise_name, rows in exercises:
+        entry = state.get(exercise_name)
+        if entry and entry["sheet"] in wb.sheetnames:
+            new_rows = _new_rows(entry, rows)
+            if new_rows is None:
+                plan.append((exercise_name, rows, entry["sheet"], True))
+            elif new_rows:
+                plan.append((exercise_name, new_rows, entry["sheet"], False))
+        else:
+            plan.append((exercise_name, rows, None, True))
+    if not plan:
+        return 0, 0  # אין מה לעדכן - הקובץ לא נכתב מחדש
+    counter = _Progress(sum(len(item[1]) for item in plan), progress, is_cancelled)
+
+    for exercise_name, rows_to_write, sheet_title, rewrite in plan:
+        if sheet_title is None:
+            ws = wb.create_sheet(title=_sheet_title(exercise_name, used_titles))
+            _prepare_sheet(ws)
+            ws.append(EXPORT_HEADERS)
+            for col in range(1, len(EXPORT_HEADERS) + 1):
+                cell = ws.cell(row=1, column=col)
+                cell.fill = header_fill
+                cell.font = header_font
+                cell.alignment = header_alignment
+        else:
+            ws = wb[sheet_title]
+            if rewrite:
+                ws.delete_rows(2, ws.max_row)
+
+        _append_rows(ws, rows_to_write, counter)
+        max_row = ws.max_row
+
+        # עדכון טווח הטבלה והגרף (ללא בנייה מחדש של שאר החוברת)
+        _remove_charts(ws)
+        if max_row <= 1:
+            for name in list(ws.tables.keys()):
+                del ws.tables[name]
+        else:
+            tables = list(ws.tables.values())
+            if tables:
+                for excel_table in tables:
+                    excel_table.ref = f"A1:{get_column_letter(len(EXPORT_HEADERS))}{max_row}"
+                    if excel_table.autoFilter is not None:
+                        excel_table.autoFilter.ref = excel_table.ref
+            else:
+                n = 0
+                while f"DataTable{n}" in table_names:
+                    n += 1
+                table_names.add(f"DataTable{n}")
+                _add_table(ws, f"DataTable{n}", max_row)
+            _add_chart(ws, exercise_name, max_row)
+
+        state[exercise_name] = _state_entry(ws.title, all_rows[exercise_name])
+
+    counter.check_cancelled()
+    _write_state(wb, state)
+    _save_atomic(wb, filename)
+    counter.finish()
+    return len(plan), counter.total
@@ -0,0 +1,46 @@
+"""
+היסטוריית Undo/Redo של מצבי טבלה
+"""
+
+
+class UndoHistory:
+    """מחסניות Undo/Redo; כל מצב הוא רשימת שורות"""
+
+    def __init__(self, max_undo: int = 5):
+        self.max_undo = max_undo
+        self.undo_stack: list = []
+        self.redo_stack: list = []
+
+    def clear(self):
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+
+    def push(self, state):
+        """שמירת מצב לפני פעולה חדשה - מנקה את מחסנית ה-Redo"""
+        # אם זה המצב הראשון, או שהמצב שונה מהמצב האחרון במחסנית
+        if not self.undo_stack or state != self.undo_stack[-1]:
+            self.undo_stack.append(state)
+            # שמירה של מקסימום max_undo+1 מצבים (כולל המצב הנוכחי)
+            if len(self.undo_stack) > self.max_undo + 1:
+                self.undo_stack.pop(0)
+        self.redo_stack.clear()
+
+    def undo(self, current):
+        """המצב הקודם לשחזור, או None אם אין; current נשמר ל-Redo"""
+        if not self.undo_stack:
+            return None
+        if not self.redo_stack or current != self.redo_stack[-1]:
+            self.redo_stack.append(current)
+            if len(self.redo_stack) > self.max_undo:
+                self.redo_stack.pop(0)
+        return self.undo_stack.pop()
+
+    def redo(self, current):
+        """המצב שבוטל לשחזור, או None אם אין; current נשמר ל-Undo"""
+        if not self.redo_stack:
+            return None
+        if not self.undo_stack or current != self.undo_stack[-1]:
+            self.undo_stack.append(current)
+            if len(self.undo_stack) > self.max_undo + 1:
+                self.undo_stack.pop(0)
+        return self.redo_stack.pop()
@@ -0,0 +1,163 @@
+"""
+דוח זיכרון מבוסס tracemalloc עם שיוך הקצאות לתתי-מערכות
+
+כל הקצאה חיה משויכת לתת-המערכת של ה-frame הקרוב ביותר בשרשרת הקריאות
+שמתאים לאחד הכללים: פונקציה מסוימת (לפי טווח השורות שלה) או קבצים
+שהנתיב שלהם מכיל מחרוזת (למשל ספריית matplotlib).
+זיכרון שמוקצה בצד ה-C++ של Qt לא נראה ל-tracemalloc - את החלק הזה
+מעבירים לדוח כ"מדדים נוספים" (למשל גודל הפיקסלים של תמונות).
+"""
+import inspect
+import linecache
+import os
+import tracemalloc
+from datetime import datetime
+
+TRACE_FRAMES = 25
+OTHER = "אחר"
+
+# קוד מודולים שנטענו - נבדק לפני כללי האפליקציה, אחרת ייבוא בתוך פונקציה נספר עליה
+IMPORT_SUBSYSTEM = "קוד מודולים (import)"
+_IMPORT_PATHS = ("<frozen importlib._bootstrap",)
+
+# הקצאות של tracemalloc ושל הדוח עצמו לא נספרות
+_SKIP = object()
+_SKIP_FILES = {os.path.normcase(tracemalloc.__file__), os.path.normcase(__file__)}
+
+
+def start(frames: int = TRACE_FRAMES):
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames)
+
+
+def stop():
+    tracemalloc.stop()
+
+
+def is_tracing() -> bool:
+    return tracemalloc.is_tracing()
+
+
+def _code_range(fn):
+    """(קובץ, שורה ראשונה, שורה אחרונה) של פונקציה; None אם אין קוד מקור"""
+    fn = inspect.unwrap(fn)
+    try:
+        lines, first = inspect.getsourcelines(fn)
+    except (OSError, TypeError):
+        return None
+    return os.path.normcase(fn.__code__.co_filename), first, first + len(lines) - 1
+
+
+class MemoryAttributor:
+    """
+    שיוך הקצאות לתתי-מערכות.
+
+    rules: רשימת (שם, יעדים); יעד הוא פונקציה/מתודה או מחרוזת שמופיעה בנתיב הקובץ.
+    כשכמה כללים מתאימים לאותו frame, הראשון ברשימה קובע.
+    """
+
+    def __init__(self, rules):
+        self.rules = []
+        for name, targets in [(IMPORT_SUBSYSTEM, _IMPORT_PATHS), *rules]:
+            ranges, paths = [], []
+            for target in targets:
+                if isinstance(target, str):
+                    paths.append(os.path.normcase(target))
+                else:
+                    code_range = _code_range(target)
+                    if code_range:
+                        ranges.append(code_range)
+            self.rules.append((name, ranges, paths))
+        self._frame_cache: dict[tuple[str, int], object] = {}
+        self._traceback_cache: dict = {}
+
+    def _match_frame(self, filename: str, lineno: int):
+        key = (filename, lineno)
+        if key in self._frame_cache:
+            return self._frame_cache[key]
+        normalized = os.path.normcase(filename)
+        result = _SKIP if normalized in _SKIP_FILES else None
+        for name, ranges, paths in self.rules if result is None else ():
+            if any(normalized == f and first <= lineno <= last for f, first, last in ranges) \
+                    or any(p in normalized for p in paths):
+                result = name
+                break
+        self._frame_cache[key] = result
+        return result
+
+    def subsystem(self, traceback):
+        """שם תת-המערכת של הקצאה, או None להקצאות של הדוח עצמו"""
+        if traceback in self._traceback_cache:
+            return self._traceback_cache[traceback]
+        result = OTHER
+        # מה-frame האחרון (הקרוב להקצאה) לראשון
+        for frame in reversed(traceback):
+            name = self._match_frame(frame.filename, frame.lineno)
+            if name is _SKIP:
+                result = None
+                break
+            if name:
+                result = name
+                break
+        self._traceback_cache[traceback] = result
+        return result
+
+    def attribute(self, snapshot) -> dict[str, dict]:
+        """{תת-מערכת: {"size", "count", "sites": {(קובץ, שורה): גודל}}}"""
+        result = {}
+        for trace in snapshot.traces:
+            name = self.subsystem(trace.traceback)
+            if name is None:
+                continue
+            entry = result.setdefault(name, {"size": 0, "count": 0, "sites": {}})
+            entry["size"] += trace.size
+            entry["count"] += 1
+            frame = trace.traceback[-1] if len(trace.traceback) else None
+            site = (frame.filename, frame.lineno) if frame else ("?", 0)
+            entry["sites"][site] = entry["sites"].get(site, 0) + trace.size
+        return result
+
+
+def _format_size(size: float) -> str:
+    for unit in ("B", "KB", "MB"):
+        if abs(size) < 1024:
+            return f"{size:,.1f} {unit}"
+        size /= 1024
+    return f"{size:,.1f} GB"
+
+
+def build_report(attributor: MemoryAttributor, snapshot=None, extra: dict = None, top_sites: int = 5) -> str:
+    """דוח טקסט; extra - מדדים שלא נראים ל-tracemalloc (שם -> טקסט)"""
+    if snapshot is None:
+        snapshot = tracemalloc.take_snapshot()
+    by_subsystem = attributor.attribute(snapshot)
+    total = sum(entry["size"] for entry in by_subsystem.values())
+    current, peak = tracemalloc.get_traced_memory()
+
+    lines = [
+        f"דוח זיכרון - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        f"זיכרון Python במעקב: {_format_size(current)} (שיא {_format_size(peak)})",
+        "",
+        "לפי תת-מערכת:",
+    ]
+    for name, entry in sorted(by_subsystem.items(), key=lambda item: -item[1]["size"]):
+        share = entry["size"] / total * 100 if total else 0
+        lines.append(f"  {name:<28}{_format_size(entry['size']):>14}{share:>7.1f}%{entry['count']:>10,} הקצאות")
+    if extra:
+        lines += ["", "מדדים נוספים (מחוץ ל-tracemalloc):"]
+        lines += [f"  {name:<28}  {value}" for name, value in extra.items()]
+
+    lines += ["", f"מקורות ההקצאה הגדולים (עד {top_sites} לכל תת-מערכת):"]
+    for name, entry in sorted(by_subsystem.items(), key=lambda item: -item[1]["size"]):
+        lines.append(f"  [{name}]")
+        for (filename, lineno), size in sorted(entry["sites"].items(), key=lambda item: -item[1])[:top_sites]:
+            source = linecache.getline(filename, lineno).strip()
+            lines.append(f"    {_format_size(size):>12}  {os.path.basename(filename)}:{lineno}  {source[:80]}")
+    return "\n".join(lines) + "\n"
+
+
+def write_report(path, attributor: MemoryAttributor, extra: dict = None) -> str:
+    report = build_report(attributor, extra=extra)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(report)
+    return report
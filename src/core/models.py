@@ -0,0 +1,63 @@
+"""
+מודל הנתונים של האפליקציה - ללא תלות ב-Qt
+
+רשומת אימון נשמרת בקבצים ובטבלה כשורת טקסט בסדר העמודות:
+[סט אחרון, חזרות, סטים, "משקל Kg", "dd/mm/YYYY"]
+"""
+from dataclasses import dataclass
+from datetime import datetime
+
+DATE_FORMAT = "%d/%m/%Y"
+
+# סדר העמודות בשורה
+COL_LAST_REPS, COL_REPS, COL_SETS, COL_WEIGHT, COL_DATE = range(5)
+COLUMN_COUNT = 5
+
+PROFILE_FIELDS = ("name", "height", "weight", "age", "gender", "profile_image")
+
+
+def parse_weight_text(text: str) -> float:
+    """'62.5 Kg' / '62,5' -> 62.5"""
+    return float(str(text).split()[0].replace(",", "."))
+
+
+def format_weight_text(weight: float) -> str:
+    """62.5 -> '62.5 Kg', 60.0 -> '60 Kg'"""
+    weight = float(weight)
+    text = f"{int(weight)}" if weight.is_integer() else f"{weight:.3f}".rstrip("0").rstrip(".")
+    return f"{text} Kg"
+
+
+@dataclass(frozen=True)
+class WorkoutEntry:
+    """רשומת אימון אחת"""
+    weight: float
+    sets: int
+    reps: int
+    last_reps: int
+    date: datetime
+
+    @classmethod
+    def from_row(cls, row) -> "WorkoutEntry":
+        """המרת שורת טקסט לרשומה; ValueError/IndexError אם השורה לא תקינה"""
+        return cls(
+            weight=parse_weight_text(row[COL_WEIGHT]),
+            sets=int(row[COL_SETS]),
+            reps=int(row[COL_REPS]),
+            last_reps=int(row[COL_LAST_REPS]),
+            date=datetime.strptime(str(row[COL_DATE]).strip(), DATE_FORMAT),
+        )
+
+    def to_row(self) -> list[str]:
+        return [str(self.last_reps), str(self.reps), str(self.sets),
+                format_weight_text(self.weight), self.date.strftime(DATE_FORMAT)]
+
+    @property
+    def volume(self) -> float:
+        """(סטים-1) * חזרות * משקל + סט אחרון * משקל"""
+        return ((self.sets - 1) * self.reps + self.last_reps) * self.weight
+
+
+def empty_profile() -> dict:
+    """נתוני פרופיל ריקים"""
+    return {key: "" for key in PROFILE_FIELDS}
@@ -0,0 +1,87 @@
+"""
+סקירה מהירה של פרופיל - מספר רשומות ותאריך האימון האחרון
+
+משמש את רשימת הפרופילים. הנתונים של כל קובץ תרגיל (כולל מקטעי ארכיון)
+נשמרים בזיכרון לפי נתיב יחד עם (mtime_ns, גודל), כך שפתיחה חוזרת של הרשימה
+קוראת רק קבצים שהשתנו. בקבצי .tmwh נקראות רק העמודות, בלי בניית שורות.
+"""
+import os
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime
+
+from . import binformat, storage
+from .models import COL_DATE, DATE_FORMAT
+
+
+@dataclass(frozen=True)
+class FileMeta:
+    entries: int
+    last_ordinal: int  # 0 אם אין תאריך תקין
+
+
+@dataclass(frozen=True)
+class ProfileOverview:
+    exercises: int
+    entries: int
+    last_workout: date = None
+
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+def _row_ordinal(row) -> int:
+    try:
+        return datetime.strptime(str(row[COL_DATE]).strip(), DATE_FORMAT).toordinal()
+    except (ValueError, IndexError):
+        return 0
+
+
+def _read_meta(path) -> FileMeta:
+    if str(path).endswith(binformat.SUFFIX):
+        with binformat.HistoryFile(path) as history:
+            ordinals = history.ordinals()
+            next(ordinals)
+            # שורה חריגה מקבלת את ה-ordinal של הקודמת, כך שהיא לא משנה את המקסימום
+            last = max(ordinals, default=0)
+            last = max([last] + [_row_ordinal(row) for row in history.exceptions.values()])
+            return FileMeta(len(history), last)
+    rows = storage.load_rows(path)
+    return FileMeta(len(rows), max((_row_ordinal(row) for row in rows), default=0))
+
+
+def file_meta(path) -> FileMeta:
+    """נתוני קובץ תרגיל אחד; FileMeta(0, 0) לקובץ חסר או פגום"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return FileMeta(0, 0)
+    key = os.path.abspath(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _cache_lock:
+        cached = _cache.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    try:
+        meta = _read_meta(path)
+    except (OSError, ValueError):
+        meta = FileMeta(0, 0)
+    with _cache_lock:
+        _cache[key] = (signature, meta)
+    return meta
+
+
+def profile_overview(profile_name: str, base_dir=None) -> ProfileOverview:
+    metas = [file_meta(path) for path in storage.exercise_files(profile_name, base_dir)]
+    last = max((meta.last_ordinal for meta in metas), default=0)
+    return ProfileOverview(
+        exercises=len(storage.list_exercises(profile_name, base_dir)),
+        entries=sum(meta.entries for meta in metas),
+        last_workout=date.fromordinal(last) if last else None,
+    )
+
+
+def clear_cache():
+    with _cache_lock:
+        _cache.clear()
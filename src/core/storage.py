@@ -0,0 +1,347 @@
+"""
+שמירה וטעינה של פרופילים ותרגילים
+
+כל הקבצים נשמרים בתיקיית העבודה (או בתיקייה שמועברת כ-base_dir):
+- profile_{שם}.json - נתוני פרופיל; התמונה כהפניה למאגר הנכסים (assets/, ראו assets)
+- active_profile.json - הפרופיל הפעיל האחרון
+- exercise_{פרופיל}_{תרגיל}.json - {"rows": [...]}
+  או exercise_{פרופיל}_{תרגיל}.tmwh - פורמט בינארי קומפקטי (ראו binformat),
+  לפי WORKOUT_STORAGE_FORMAT=json|binary|binary-zlib
+- archive_{פרופיל}_{תרגיל}.{מספר}.tmwh - מקטעי ארכיון קבועים (ראו archive)
+- exercise_state_{תרגיל}.json - פורמט ישן, לפני שהיו פרופילים
+"""
+import json
+import os
+import shutil
+from pathlib import Path
+
+from . import binformat
+from .assets import AssetStore, is_asset_ref
+from .models import empty_profile
+
+ACTIVE_PROFILE_FILE = "active_profile.json"
+LEGACY_PROFILE_FILE = "user_profile.json"
+LEGACY_EXERCISE_PREFIX = "exercise_state_"
+ARCHIVE_PREFIX = "archive_"
+
+STORAGE_FORMAT_ENV = "WORKOUT_STORAGE_FORMAT"
+FORMAT_JSON = "json"
+FORMAT_BINARY = "binary"
+FORMAT_BINARY_ZLIB = "binary-zlib"
+STORAGE_FORMATS = (FORMAT_JSON, FORMAT_BINARY, FORMAT_BINARY_ZLIB)
+_EXERCISE_SUFFIXES = (".json", binformat.SUFFIX)
+
+
+def _base(base_dir) -> Path:
+    return Path(base_dir) if base_dir is not None else Path.cwd()
+
+
+def _write_json(path: Path, data):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def _read_json(path: Path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# --- תרגילים ---
+
+def storage_format() -> str:
+    """פורמט השמירה לתרגילים: json (ברירת מחדל), binary או binary-zlib (משתנה הסביבה)"""
+    value = os.environ.get(STORAGE_FORMAT_ENV, FORMAT_JSON).strip().lower()
+    return value if value in STORAGE_FORMATS else FORMAT_JSON
+
+
+def _suffix(fmt: str) -> str:
+    return ".json" if fmt == FORMAT_JSON else binformat.SUFFIX
+
+
+def exercise_path(profile_name: str, exercise_name: str, base_dir=None, fmt: str = None) -> Path:
+    """
+    נתיב קובץ התרגיל. בלי fmt - הקובץ הקיים (בכל פורמט), ואם אין -
+    הנתיב בפורמט השמירה הנוכחי.
+    """
+    stem = _base(base_dir) / f"exercise_{profile_name}_{exercise_name}"
+    if fmt is not None:
+        return stem.with_name(stem.name + _suffix(fmt))
+    for suffix in _EXERCISE_SUFFIXES:
+        path = stem.with_name(stem.name + suffix)
+        if path.exists():
+            return path
+    return stem.with_name(stem.name + _suffix(storage_format()))
+
+
+def _live_files(profile_name: str, base_dir=None) -> list[Path]:
+    base = _base(base_dir)
+    return [file for suffix in _EXERCISE_SUFFIXES for file in base.glob(f"exercise_{profile_name}_*{suffix}")]
+
+
+def exercise_files(profile_name: str, base_dir=None) -> list[Path]:
+    """כל קבצי התרגילים של הפרופיל, בכל הפורמטים וכולל מקטעי ארכיון"""
+    archives = _base(base_dir).glob(f"{ARCHIVE_PREFIX}{profile_name}_*{binformat.SUFFIX}")
+    return _live_files(profile_name, base_dir) + list(archives)
+
+
+def list_exercises(profile_name: str, base_dir=None) -> list[str]:
+    """שמות התרגילים השמורים של הפרופיל"""
+    prefix = f"exercise_{profile_name}_"
+    names = (file.stem[len(prefix):] for file in _live_files(profile_name, base_dir))
+    return list(dict.fromkeys(names))
+
+
+def load_rows(path) -> list[list[str]]:
+    """טעינת שורות תרגיל (JSON או .tmwh לפי הסיומת); רשימה ריקה אם הקובץ לא קיים"""
+    path = Path(path)
+    if not path.exists():
+        return []
+    if path.suffix == binformat.SUFFIX:
+        return binformat.read_rows(path)
+    data = _read_json(path)
+    rows = data.get("rows", []) if isinstance(data, dict) else None
+    if not isinstance(rows, list) or not all(isinstance(row, list) for row in rows):
+        raise ValueError(f"מבנה לא תקין בקובץ {path.name}")
+    return [[str(v) for v in row] for row in rows]
+
+
+def save_rows(path, rows, compress: bool = False):
+    """compress רלוונטי רק לקובץ .tmwh"""
+    path = Path(path)
+    if path.suffix == binformat.SUFFIX:
+        binformat.write_rows(path, rows, compress=compress)
+    else:
+        _write_json(path, {"rows": [list(row) for row in rows]})
+
+
+def load_exercise(profile_name: str, exercise_name: str, base_dir=None) -> list[list[str]]:
+    return load_rows(exercise_path(profile_name, exercise_name, base_dir))
+
+
+def save_exercise(profile_name: str, exercise_name: str, rows, base_dir=None, fmt: str = None) -> Path:
+    """שמירה בפורמט fmt (ברירת מחדל - storage_format()); עותק בפורמט האחר נמחק"""
+    fmt = fmt or storage_format()
+    path = exercise_path(profile_name, exercise_name, base_dir, fmt=fmt)
+    save_rows(path, rows, compress=fmt == FORMAT_BINARY_ZLIB)
+    for suffix in _EXERCISE_SUFFIXES:
+        other = path.with_suffix(suffix)
+        if other != path and other.exists():
+            other.unlink()
+    return path
+
+
+def convert_exercises(fmt: str, base_dir=None) -> int:
+    """המרת כל קבצי התרגילים בתיקייה לפורמט fmt (ללא אובדן); מחזיר את מספר הקבצים שהומרו"""
+    compress = fmt == FORMAT_BINARY_ZLIB
+    converted = 0
+    for suffix in _EXERCISE_SUFFIXES:
+        for file in _base(base_dir).glob(f"exercise_*{suffix}"):
+            if file.name.startswith(LEGACY_EXERCISE_PREFIX):
+                continue
+            target = file.with_suffix(_suffix(fmt))
+            if target == file and (suffix == ".json" or _is_compressed(file) == compress):
+                continue
+            save_rows(target, load_rows(file), compress=compress)
+            if target != file:
+                file.unlink()
+            converted += 1
+    return converted
+
+
+def _is_compressed(path: Path) -> bool:
+    if path.suffix != binformat.SUFFIX:
+        return False
+    with binformat.HistoryFile(path) as history:
+        return history.compressed
+
+
+def delete_exercise(profile_name: str, exercise_name: str, base_dir=None):
+    """מחיקת קובץ התרגיל (בכל פורמט) ומקטעי הארכיון שלו"""
+    for suffix in _EXERCISE_SUFFIXES:
+        path = _base(base_dir) / f"exercise_{profile_name}_{exercise_name}{suffix}"
+        if path.exists():
+            path.unlink()
+    delete_archive(profile_name, exercise_name, base_dir)
+
+
+def rename_exercise(profile_name: str, old_name: str, new_name: str, base_dir=None):
+    old_path = exercise_path(profile_name, old_name, base_dir)
+    if old_path.exists():
+        old_path.rename(old_path.with_name(f"exercise_{profile_name}_{new_name}{old_path.suffix}"))
+    for index, segment in archive_segments(profile_name, old_name, base_dir):
+        segment.rename(archive_segment_path(profile_name, new_name, index, base_dir))
+
+
+def rename_profile_exercises(old_name: str, new_name: str, base_dir=None):
+    for file in exercise_files(old_name, base_dir):
+        kind = ARCHIVE_PREFIX if file.name.startswith(ARCHIVE_PREFIX) else "exercise_"
+        file.rename(file.with_name(f"{kind}{new_name}_{file.name[len(kind) + len(old_name) + 1:]}"))
+
+
+# --- מקטעי ארכיון ---
+
+def archive_segment_path(profile_name: str, exercise_name: str, index: int, base_dir=None) -> Path:
+    return _base(base_dir) / f"{ARCHIVE_PREFIX}{profile_name}_{exercise_name}.{index:04d}{binformat.SUFFIX}"
+
+
+def archive_segments(profile_name: str, exercise_name: str, base_dir=None) -> list[tuple[int, Path]]:
+    """(מספר, נתיב) של מקטעי הארכיון של התרגיל, מהישן לחדש"""
+    prefix = f"{ARCHIVE_PREFIX}{profile_name}_{exercise_name}."
+    segments = []
+    for file in _base(base_dir).glob(f"{ARCHIVE_PREFIX}*{binformat.SUFFIX}"):
+        index = file.name[len(prefix):-len(binformat.SUFFIX)]
+        if file.name.startswith(prefix) and index.isdigit():
+            segments.append((int(index), file))
+    return sorted(segments)
+
+
+def delete_archive(profile_name: str, exercise_name: str, base_dir=None):
+    for _, segment in archive_segments(profile_name, exercise_name, base_dir):
+        segment.unlink()
+
+
+def migrate_legacy_exercises(profile_name: str, base_dir=None) -> list[str]:
+    """העתקת קבצי exercise_state_* ישנים לפורמט של הפרופיל; מחזיר את שמות התרגילים"""
+    migrated = []
+    for old_file in _base(base_dir).glob(f"{LEGACY_EXERCISE_PREFIX}*.json"):
+        name = old_file.stem[len(LEGACY_EXERCISE_PREFIX):]
+        try:
+            shutil.copy2(old_file, exercise_path(profile_name, name, base_dir, fmt=FORMAT_JSON))
+        except OSError:
+            continue
+        migrated.append(name)
+    return migrated
+
+
+# --- פרופילים ---
+
+def profile_path(profile_name: str, base_dir=None) -> Path:
+    return _base(base_dir) / f"profile_{profile_name}.json"
+
+
+def list_profiles(base_dir=None) -> list[str]:
+    return sorted(file.stem[len("profile_"):] for file in _base(base_dir).glob("profile_*.json"))
+
+
+def load_profile(profile_name: str, base_dir=None) -> dict:
+    """נתוני הפרופיל; שדות חסרים או קובץ פגום - ערכים ריקים"""
+    data = empty_profile()
+    path = profile_path(profile_name, base_dir)
+    if path.exists():
+        try:
+            data.update(_read_json(path))
+        except (OSError, ValueError):
+            pass
+    return data
+
+
+def _write_profile(profile_name: str, profile_data: dict, base_dir=None):
+    """כתיבת קובץ הפרופיל ועדכון מונה ההפניות אם התמונה הוחלפה"""
+    path = profile_path(profile_name, base_dir)
+    old_image = load_profile(profile_name, base_dir).get("profile_image", "") if path.exists() else ""
+    _write_json(path, profile_data)
+    new_image = profile_data.get("profile_image", "")
+    if new_image != old_image:
+        store = asset_store(base_dir)
+        if is_asset_ref(new_image):
+            store.acquire(new_image)
+        if is_asset_ref(old_image):
+            store.release(old_image)
+
+
+def save_profile(profile_name: str, profile_data: dict, base_dir=None):
+    """שמירת הפרופיל וסימונו כפעיל"""
+    _write_profile(profile_name, profile_data, base_dir)
+    write_active_profile(profile_name, base_dir)
+
+
+def rename_profile(old_name: str, new_name: str, base_dir=None):
+    """שינוי שם של קובץ הפרופיל וקבצי התרגילים; התמונה במאגר לא משתנה"""
+    old_path = profile_path(old_name, base_dir)
+    if old_path.exists():
+        old_path.rename(profile_path(new_name, base_dir))
+    rename_profile_exercises(old_name, new_name, base_dir)
+
+
+def delete_profile(profile_name: str, base_dir=None):
+    """מחיקת הפרופיל והתרגילים שלו; ההפניה לתמונה משוחררת"""
+    path = profile_path(profile_name, base_dir)
+    if path.exists():
+        image = load_profile(profile_name, base_dir).get("profile_image", "")
+        path.unlink()
+        if is_asset_ref(image):
+            asset_store(base_dir).release(image)
+    for file in exercise_files(profile_name, base_dir):
+        try:
+            file.unlink()
+        except OSError:
+            pass
+
+
+# --- תמונות פרופיל ---
+
+def asset_store(base_dir=None) -> AssetStore:
+    return AssetStore(_base(base_dir) if base_dir is not None else None)
+
+
+def profile_image_path(profile_data: dict, base_dir=None) -> str:
+    """נתיב קובץ התמונה של הפרופיל ("" אם אין)"""
+    value = profile_data.get("profile_image", "") or ""
+    return asset_store(base_dir).resolve(value) if value else ""
+
+
+def migrate_profile_image(profile_name: str, base_dir=None) -> dict:
+    """
+    העברת תמונה שנשמרה כנתיב מלא (גרסאות קודמות) למאגר הנכסים.
+    קבצי profile_image_*.png שהאפליקציה יצרה בתיקיית העבודה נמחקים אחרי
+    ההעברה. מחזיר את נתוני הפרופיל העדכניים.
+    """
+    data = load_profile(profile_name, base_dir)
+    value = data.get("profile_image", "")
+    if not value or is_asset_ref(value) or not Path(value).is_file():
+        return data
+    old_file = Path(value)
+    data["profile_image"] = asset_store(base_dir).add_file(old_file)
+    _write_profile(profile_name, data, base_dir)
+    if old_file.parent.resolve() == _base(base_dir).resolve() and old_file.name.startswith("profile_image_"):
+        for file in [old_file, *old_file.parent.glob(f"{old_file.stem}@*{old_file.suffix}")]:
+            try:
+                file.unlink()
+            except OSError:
+                pass
+    return data
+
+
+def collect_asset_garbage(base_dir=None) -> list[str]:
+    """מחיקת נכסים שאף פרופיל לא מפנה אליהם וחישוב המונים מחדש"""
+    live = [load_profile(name, base_dir).get("profile_image", "") for name in list_profiles(base_dir)]
+    return asset_store(base_dir).collect_garbage(live)
+
+
+def read_active_profile(base_dir=None):
+    path = _base(base_dir) / ACTIVE_PROFILE_FILE
+    if not path.exists():
+        return None
+    try:
+        return _read_json(path).get("active_profile")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def write_active_profile(profile_name: str, base_dir=None):
+    _write_json(_base(base_dir) / ACTIVE_PROFILE_FILE, {"active_profile": profile_name})
+
+
+def read_legacy_profile(base_dir=None):
+    """user_profile.json מגרסאות ללא פרופילים מרובים"""
+    path = _base(base_dir) / LEGACY_PROFILE_FILE
+    if not path.exists():
+        return None
+    try:
+        return _read_json(path)
+    except (OSError, ValueError):
+        return None
+
+
+def write_legacy_profile(profile_data: dict, base_dir=None):
+    _write_json(_base(base_dir) / LEGACY_PROFILE_FILE, profile_data)
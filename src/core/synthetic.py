@@ -0,0 +1,139 @@
+"""
+יצירת נתונים סינתטיים בפורמטים שהאפליקציה קוראת - לבדיקות עומס ולשחזור באגים
+
+הכול דטרמיניסטי לפי seed: אותם פרמטרים יוצרים בדיוק אותם קבצים.
+"""
+import random
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from . import storage
+from .models import DATE_FORMAT, format_weight_text
+
+EXERCISE_NAMES = (
+    "סקוואט", "לחיצת חזה", "דדליפט", "לחיצת כתפיים", "חתירה", "מתח",
+    "מקבילים", "כפיפת מרפקים", "פשיטת מרפקים", "לאנג'ים", "לחיצת רגליים", "הרחקת כתפיים",
+)
+PROFILE_NAMES = ("אלעד", "אנה", "נועה", "יוסי", "מיכל", "דני", "רותם", "עומר")
+GENDERS = ("זכר", "נקבה")
+
+# uniform - תאריכים אקראיים בטווח; regular - כל כמה ימים בקצב קבוע;
+# bursty - תקופות אימון צפופות עם הפסקות ארוכות ביניהן
+DATE_DISTRIBUTIONS = ("uniform", "regular", "bursty")
+
+
+def generate_dates(rng: random.Random, count: int, start: datetime, end: datetime,
+                   distribution: str = "regular") -> list[datetime]:
+    """count תאריכים ממוינים בטווח [start, end]"""
+    if distribution not in DATE_DISTRIBUTIONS:
+        raise ValueError(f"התפלגות לא מוכרת: {distribution}")
+    span = max((end - start).days, 0)
+    if count <= 0:
+        return []
+    if distribution == "uniform":
+        days = sorted(rng.randint(0, span) for _ in range(count))
+    elif distribution == "regular":
+        # הרעש קטן מחצי צעד - כך הסדר נשמר גם כשיש יותר תאריכים מימים בטווח
+        step = span / count
+        days = [min(span, int((i + rng.random() * 0.5) * step)) for i in range(count)]
+    else:
+        days = []
+        day = 0
+        while len(days) < count:
+            for _ in range(rng.randint(5, 30)):
+                if len(days) >= count:
+                    break
+                days.append(min(day, span))
+                day += rng.randint(1, 3)
+            day += rng.randint(14, 60)
+        if days[-1] > span:
+            # דחיסה לטווח המבוקש תוך שמירה על הסדר
+            scale = span / days[-1]
+            days = [int(d * scale) for d in days]
+    return [start + timedelta(days=d) for d in days]
+
+
+def generate_rows(rng: random.Random, dates: list[datetime], start_weight: float = None) -> list[list[str]]:
+    """היסטוריית אימונים בפורמט הטבלה - משקל שמתקדם בהדרגה עם נסיגות"""
+    weight = start_weight if start_weight is not None else rng.choice((20, 30, 40, 50, 60))
+    rows = []
+    for date in dates:
+        weight = max(2.5, weight + rng.choices((-2.5, 0, 2.5, 5), weights=(1, 5, 3, 1))[0])
+        sets = rng.randint(2, 5)
+        reps = rng.randint(5, 12)
+        last_reps = max(1, reps - rng.randint(0, 3))
+        rows.append([str(last_reps), str(reps), str(sets), format_weight_text(weight), date.strftime(DATE_FORMAT)])
+    return rows
+
+
+def synthetic_rows(count: int, seed: int = 0, start: datetime = datetime(2000, 1, 1),
+                   end: datetime = None, distribution: str = "regular") -> list[list[str]]:
+    """היסטוריה אחת של count שורות; ברירת המחדל - כשלושה אימונים ביום לאורך הטווח"""
+    rng = random.Random(seed)
+    end = end or start + timedelta(days=max(count // 3, 1))
+    return generate_rows(rng, generate_dates(rng, count, start, end, distribution))
+
+
+def generate_profile(rng: random.Random, name: str) -> dict:
+    return {
+        "name": name,
+        "height": str(rng.randint(150, 200)),
+        "weight": str(rng.randint(45, 120)),
+        "age": str(rng.randint(16, 70)),
+        "gender": rng.choice(GENDERS),
+        "profile_image": "",
+    }
+
+
+def _names(pool: tuple, count: int, prefix: str) -> list[str]:
+    if count <= len(pool):
+        return list(pool[:count])
+    return list(pool) + [f"{prefix} {i}" for i in range(len(pool) + 1, count + 1)]
+
+
+def generate_dataset(base_dir, profiles: int = 1, exercises: int = 3, entries: int = 100,
+                     seed: int = 0, start: datetime = None, end: datetime = None,
+                     distribution: str = "regular", legacy_exercises: int = 0,
+                     legacy_profile: bool = False) -> dict:
+    """
+    כתיבת פרופילים ותרגילים ל-base_dir בפורמט שהאפליקציה קוראת.
+
+    entries - מספר השורות לכל תרגיל. legacy_exercises - קבצי exercise_state_*
+    מהגרסה שלפני הפרופילים; legacy_profile - גם user_profile.json.
+    מחזיר סיכום: {"profiles": [...], "files": n, "rows": n}.
+    """
+    base = Path(base_dir)
+    base.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(seed)
+    end = end or datetime(2025, 10, 1)
+    start = start or end - timedelta(days=365 * 2)
+
+    profile_names = _names(PROFILE_NAMES, profiles, "פרופיל")
+    exercise_names = _names(EXERCISE_NAMES, exercises, "תרגיל")
+    files = rows_written = 0
+
+    for profile_name in profile_names:
+        storage.save_profile(profile_name, generate_profile(rng, profile_name), base_dir=base)
+        files += 1
+        for exercise_name in exercise_names:
+            rows = generate_rows(rng, generate_dates(rng, entries, start, end, distribution))
+            storage.save_exercise(profile_name, exercise_name, rows, base_dir=base)
+            files += 1
+            rows_written += len(rows)
+    if profile_names:
+        storage.write_active_profile(profile_names[0], base_dir=base)
+        files += 1
+
+    for exercise_name in _names(EXERCISE_NAMES, legacy_exercises, "תרגיל"):
+        rows = generate_rows(rng, generate_dates(rng, entries, start, end, distribution))
+        storage.save_rows(base / f"{storage.LEGACY_EXERCISE_PREFIX}{exercise_name}.json", rows)
+        files += 1
+        rows_written += len(rows)
+
+    if legacy_profile:
+        legacy = generate_profile(rng, "פרופיל ראשי")
+        legacy.pop("profile_image")
+        storage.write_legacy_profile(legacy, base_dir=base)
+        files += 1
+
+    return {"profiles": profile_names, "files": files, "rows": rows_written}
@@ -0,0 +1,84 @@
+"""
+מידע על התהליך הנוכחי - זיכרון בשימוש ותיקיות המערכת, ללא תלויות חיצוניות
+"""
+import os
+import sys
+from pathlib import Path
+
+# שם התיקייה של האפליקציה בתיקיות המשתמש (בלי עברית - חלק מהכלים לא אוהבים)
+APP_DIR_NAME = "TrackMyWorkout"
+CACHE_DIR_ENV = "WORKOUT_CACHE_DIR"
+
+
+def rss_bytes() -> int:
+    """זיכרון פיזי בשימוש (RSS) בבתים; 0 אם לא ניתן למדוד"""
+    try:
+        if sys.platform == "win32":
+            return _rss_windows()
+        if os.path.exists("/proc/self/statm"):
+            with open("/proc/self/statm", "r") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        import resource
+        # ב-macOS ru_maxrss בבתים (שיא ולא נוכחי - הקירוב הטוב ביותר בלי psutil)
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    except (OSError, ValueError, ImportError, AttributeError):
+        return 0
+
+
+def _rss_windows() -> int:
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    counters = PROCESS_MEMORY_COUNTERS()
+    counters.cb = ctypes.sizeof(counters)
+    handle = ctypes.windll.kernel32.GetCurrentProcess()
+    if not ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+        return 0
+    return counters.WorkingSetSize
+
+
+def format_bytes(size: int) -> str:
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def user_cache_dir() -> Path:
+    """
+    תיקיית מטמון למשתמש (לא תלויה בתיקיית העבודה):
+    Windows - %LOCALAPPDATA%, macOS - ~/Library/Caches, אחרת XDG_CACHE_HOME או ~/.cache.
+    WORKOUT_CACHE_DIR גובר על כולם.
+    """
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return Path(override)
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+        return Path(base) / APP_DIR_NAME / "Cache"
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches" / APP_DIR_NAME
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / APP_DIR_NAME
+
+
+def resource_dir() -> Path:
+    """קבצים שנארזו עם האפליקציה: בגרסה הבנויה (PyInstaller) - בתוך החבילה, אחרת src/resources"""
+    bundle = getattr(sys, "_MEIPASS", None)
+    if getattr(sys, "frozen", False) and bundle:
+        return Path(bundle) / "resources"
+    return Path(__file__).resolve().parent.parent / "resources"
@@ -0,0 +1,114 @@
+"""
+מטמון דיסק לתמונות ממוזערות (תמונת פרופיל וכד') - ללא תלות ב-Qt
+
+המפתח נגזר מהנתיב, זמן השינוי וגודל קובץ המקור, וגם מגודל וסגנון
+התמונה הממוזערת - כך שהחלפת התמונה יוצרת מפתח חדש ואין צורך לנקות ידנית.
+הקבצים הם PNG מוכנים; הצד של Qt מפענח אותם ושומר גם ב-QPixmapCache.
+"""
+import hashlib
+import os
+from pathlib import Path
+
+from .sysinfo import user_cache_dir
+
+THUMBNAIL_DIR = "thumbnail_cache"
+# מעבר לזה נמחקים הקבצים הישנים ביותר
+MAX_FILES = 200
+
+# תמונת פרופיל נשמרת בהעלאה בגודל מוגבל, ולצידה גרסאות מוקטנות (צלע בפיקסלים):
+# assets/{hash}.png, assets/{hash}@64.png, ...
+PROFILE_IMAGE_MAX = 512
+PYRAMID_SIZES = (64, 128, 256)
+
+
+def variant_path(path, size: int) -> Path:
+    path = Path(path)
+    return path.with_name(f"{path.stem}@{size}{path.suffix}")
+
+
+def pick_variant(path, size: int) -> Path:
+    """
+    הגרסה הקטנה ביותר שצלעה לפחות size; אחרת התמונה עצמה.
+    גרסה ישנה מהתמונה (שהוחלפה אחרי ההעלאה) לא נבחרת.
+    """
+    try:
+        source_mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return Path(path)
+    for variant_size in PYRAMID_SIZES:
+        if variant_size < size:
+            continue
+        candidate = variant_path(path, variant_size)
+        try:
+            if os.stat(candidate).st_mtime_ns >= source_mtime:
+                return candidate
+        except OSError:
+            continue
+    return Path(path)
+
+
+def source_signature(path):
+    """(נתיב מלא, mtime_ns, גודל) של קובץ המקור, או None אם אינו קיים"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return os.path.normcase(os.path.abspath(path)), stat.st_mtime_ns, stat.st_size
+
+
+def thumbnail_key(path, size: int, style: str = ""):
+    """מפתח מטמון לתמונה ממוזערת; None אם קובץ המקור לא קיים"""
+    signature = source_signature(path)
+    if signature is None:
+        return None
+    source, mtime_ns, file_size = signature
+    text = f"{source}|{mtime_ns}|{file_size}|{size}|{style}"
+    return "thumb_" + hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class ThumbnailDiskCache:
+    """קבצי PNG לפי מפתח בתיקייה אחת; כשלון קריאה/כתיבה פשוט נחשב החטאה"""
+
+    def __init__(self, directory=None, max_files: int = MAX_FILES):
+        self._directory = directory
+        self.max_files = max_files
+
+    @property
+    def directory(self) -> Path:
+        """ברירת מחדל - בתיקיית המטמון של המשתמש, לא לצד קבצי הנתונים"""
+        return Path(self._directory) if self._directory is not None else user_cache_dir() / THUMBNAIL_DIR
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.png"
+
+    def get(self, key: str):
+        try:
+            return self._path(key).read_bytes()
+        except OSError:
+            return None
+
+    def put(self, key: str, data: bytes):
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._path(key).with_suffix(".tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            return
+        self.prune()
+
+    def prune(self):
+        """מחיקת הקבצים הישנים ביותר מעבר ל-max_files"""
+        try:
+            files = sorted(self.directory.glob("*.png"), key=lambda f: f.stat().st_mtime_ns)
+            for file in files[:max(len(files) - self.max_files, 0)]:
+                file.unlink()
+        except OSError:
+            pass
+
+    def clear(self):
+        for file in self.directory.glob("*.png"):
+            try:
+                file.unlink()
+            except OSError:
+                pass
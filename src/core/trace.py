@@ -0,0 +1,148 @@
+"""
+מדידת זמנים של נתיבים חמים - ring buffer וייצוא ל-Chrome trace / Perfetto
+
+כבוי כברירת מחדל; כשהוא כבוי, פונקציה עטופה עולה בדיקת דגל אחת בלבד.
+הפעלה: משתנה הסביבה WORKOUT_TRACE=<קובץ.json> - הרישום מתחיל מיד
+והקובץ נכתב ביציאה מהתוכנית. אפשר גם enable()/export_chrome_trace() ידנית.
+קובץ הפלט נפתח ב-chrome://tracing או ב-https://ui.perfetto.dev
+"""
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+TRACE_ENV = "WORKOUT_TRACE"
+DEFAULT_CAPACITY = 10_000
+
+# (שם, התחלה בננו-שניות, משך בננו-שניות, מזהה thread)
+_events: deque = deque(maxlen=DEFAULT_CAPACITY)
+_enabled = False
+_listeners: list = []
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def enable(capacity: int = None):
+    """הפעלת הרישום; capacity משנה את גודל ה-ring buffer (ומרוקן אותו)"""
+    global _enabled, _events
+    if capacity is not None and capacity != _events.maxlen:
+        _events = deque(maxlen=capacity)
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def clear():
+    _events.clear()
+
+
+def add_listener(callback):
+    """callback(name, duration_ms) אחרי כל מדידה - למשל לתצוגת HUD"""
+    _listeners.append(callback)
+
+
+def remove_listener(callback):
+    if callback in _listeners:
+        _listeners.remove(callback)
+
+
+def _record(name: str, start_ns: int, end_ns: int):
+    _events.append((name, start_ns, end_ns - start_ns, threading.get_ident()))
+    for callback in _listeners:
+        try:
+            callback(name, (end_ns - start_ns) / 1e6)
+        except Exception:
+            pass
+
+
+@contextmanager
+def span(name: str):
+    """מדידת בלוק קוד: with span("export"): ..."""
+    if not _enabled:
+        yield
+        return
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        _record(name, start, time.perf_counter_ns())
+
+
+def traced(name=None):
+    """דקורטור למדידת פונקציה; @traced או @traced("שם")"""
+    def decorate(fn):
+        label = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _record(label, start, time.perf_counter_ns())
+        return wrapper
+
+    if callable(name):
+        fn, name = name, None
+        return decorate(fn)
+    return decorate
+
+
+def events() -> list[tuple[str, int, int, int]]:
+    """העתק של האירועים שבבאפר: (שם, התחלה ns, משך ns, thread)"""
+    return list(_events)
+
+
+def chrome_trace() -> dict:
+    """האירועים בפורמט Trace Event (אירועי 'X' עם זמנים במיקרו-שניות)"""
+    pid = os.getpid()
+    main_thread = threading.main_thread().ident
+    trace_events = []
+    for event_name, start_ns, duration_ns, tid in list(_events):
+        trace_events.append({
+            "name": event_name,
+            "cat": event_name.split(".", 1)[0],
+            "ph": "X",
+            "ts": start_ns / 1000,
+            "dur": duration_ns / 1000,
+            "pid": pid,
+            "tid": tid,
+        })
+    trace_events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": main_thread,
+                         "args": {"name": "GUI"}})
+    return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+
+def export_chrome_trace(path) -> int:
+    """כתיבת קובץ trace; מחזיר את מספר האירועים"""
+    data = chrome_trace()
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    return len(data["traceEvents"]) - 1
+
+
+def _export_on_exit(path):
+    try:
+        export_chrome_trace(path)
+    except OSError:
+        pass
+
+
+def init_from_env():
+    """הפעלה לפי WORKOUT_TRACE - נקרא פעם אחת בעליית האפליקציה"""
+    path = os.environ.get(TRACE_ENV)
+    if path and not _enabled:
+        enable()
+        atexit.register(_export_on_exit, path)
+    return path
@@ -0,0 +1,314 @@
+"""
+ייבוא היסטוריית אימונים מקבצי אקסל ו-CSV - ללא תלות ב-Qt
+
+נתמכים:
+- קבצי אקסל שנוצרו בייצוא של האפליקציה (גיליון לכל תרגיל)
+- CSV באותו מבנה עמודות (עברית או אנגלית), עם עמודת תרגיל אופציונלית
+- CSV של אפליקציות נפוצות (Strong, Hevy, FitNotes) - שורה לכל סט
+
+הקבצים נקראים בזרימה; שורות מאומתות (אותם טווחים כמו בהזנה מרובה)
+ומקובצות לפי תרגיל, והתוצאה היא שורות בפורמט הטבלה: [סט אחרון, חזרות, סטים, "משקל Kg", תאריך].
+"""
+import csv
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+from .excel_export import EXPORT_HEADERS, STATE_SHEET, exercise_names_by_sheet
+
+_LBS_TO_KG = 0.45359237
+
+_DATE_FORMATS = (
+    "%d/%m/%Y",
+    "%Y-%m-%d",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%d %b %Y, %H:%M",
+    "%d.%m.%Y",
+)
+
+# עמודות המבנה של האפליקציה: שם שדה -> כותרות אפשריות
+_NATIVE_COLUMNS = {
+    "date": ("תאריך", "date"),
+    "weight": ("משקל", "weight"),
+    "sets": ("סטים", "sets"),
+    "reps": ("חזרות", "reps"),
+    "last_reps": ("סט אחרון", "last set", "last_set", "last_reps"),
+}
+_EXERCISE_COLUMNS = ("תרגיל", "exercise")
+
+
+@dataclass
+class ImportResult:
+    """תוצאת ניתוח קובץ ייבוא"""
+    rows_by_exercise: dict[str, list[list[str]]] = field(default_factory=dict)
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def row_count(self) -> int:
+        return sum(len(rows) for rows in self.rows_by_exercise.values())
+
+
+def format_weight(value: float) -> str:
+    """פורמט משקל כמו בהוספה ידנית: '20' / '12.5'"""
+    value = float(value)
+    return f"{int(value)}" if value.is_integer() else f"{value:.3f}".rstrip("0").rstrip(".")
+
+
+def format_row(date: datetime, weight: float, sets: int, reps: int, last_reps: int) -> list[str]:
+    """שורה בפורמט הטבלה"""
+    return [str(last_reps), str(reps), str(sets), f"{format_weight(weight)} Kg", date.strftime("%d/%m/%Y")]
+
+
+def parse_date(value) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    text = str(value).strip()
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    raise ValueError(f"תאריך לא מוכר: {text}")
+
+
+def parse_number(value) -> float:
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value).strip().lower().replace("kg", "").replace(",", ".").strip()
+    return float(text.split()[0]) if text else 0.0
+
+
+def parse_count(value) -> int:
+    number = parse_number(value)
+    if number < 0 or not number.is_integer():
+        raise ValueError(f"ערך לא תקין: {value}")
+    return int(number)
+
+
+def check_values(date: datetime, weight: float, sets: int, reps: int, last_reps: int):
+    """אימות טווחים משותף להזנה מרובה ולייבוא קבצים"""
+    if weight < 0 or weight > 1000 or sets > 1000 or reps > 1000 or last_reps > 1000:
+        raise ValueError("ערך מחוץ לטווח")
+    if date > datetime.now():
+        raise ValueError("תאריך עתידי")
+
+
+def _find_column(headers: list[str], names) -> int:
+    lowered = [str(h).strip().lower() if h is not None else "" for h in headers]
+    for name in names:
+        if name in lowered:
+            return lowered.index(name)
+    return -1
+
+
+def _native_indexes(headers: list[str]):
+    indexes = {key: _find_column(headers, names) for key, names in _NATIVE_COLUMNS.items()}
+    if indexes["date"] < 0 or indexes["weight"] < 0:
+        return None
+    return indexes
+
+
+def _row_from_native(values, indexes) -> list[str]:
+    def get(key, default=0):
+        i = indexes[key]
+        if i < 0 or i >= len(values) or values[i] in (None, ""):
+            return default
+        return values[i]
+
+    sets = parse_count(get("sets", 1))
+    reps = parse_count(get("reps"))
+    last_reps = parse_count(get("last_reps", reps))
+    date, weight = parse_date(get("date", "")), parse_number(get("weight"))
+    check_values(date, weight, sets, reps, last_reps)
+    return format_row(date, weight, sets, reps, last_reps)
+
+
+class _SetAggregator:
+    """קיבוץ סטים רצופים של אותו תרגיל, תאריך ומשקל לשורה אחת"""
+
+    def __init__(self, result: ImportResult):
+        self.result = result
+        self._key = None
+        self._reps = []
+
+    def add(self, exercise: str, date: datetime, weight: float, reps: int):
+        key = (exercise, date.date(), weight)
+        if key != self._key:
+            self.flush()
+            self._key = key
+        self._reps.append(reps)
+
+    def flush(self):
+        if self._key is None:
+            return
+        exercise, day, weight = self._key
+        row = format_row(datetime(day.year, day.month, day.day), weight,
+                         len(self._reps), self._reps[0], self._reps[-1])
+        self.result.rows_by_exercise.setdefault(exercise, []).append(row)
+        self._key = None
+        self._reps = []
+
+
+def _per_set_columns(headers: list[str]):
+    """זיהוי CSV של סט לשורה: (תרגיל, תאריך, משקל, חזרות, יחידות lbs?)"""
+    formats = (
+        # Strong
+        (("exercise name",), ("date",), ("weight",), ("reps",), False),
+        # Hevy
+        (("exercise_title",), ("start_time",), ("weight_kg",), ("reps",), False),
+        # FitNotes
+        (("exercise",), ("date",), ("weight (kgs)", "weight (kg)"), ("reps",), False),
+        (("exercise",), ("date",), ("weight (lbs)",), ("reps",), True),
+    )
+    for exercise_names, date_names, weight_names, reps_names, lbs in formats:
+        cols = [_find_column(headers, names) for names in (exercise_names, date_names, weight_names, reps_names)]
+        if all(c >= 0 for c in cols):
+            return cols, lbs
+    return None
+
+
+def read_csv(path, default_exercise: str = None) -> ImportResult:
+    """ניתוח קובץ CSV - מבנה האפליקציה או יומן סטים של אפליקציה אחרת"""
+    result = ImportResult()
+    default_exercise = default_exercise or Path(path).stem
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        sample = f.read(4096)
+        f.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+        except csv.Error:
+            dialect = csv.excel
+        reader = csv.reader(f, dialect)
+        headers = next(reader, None)
+        if not headers:
+            result.errors.append("הקובץ ריק")
+            return result
+
+        per_set = _per_set_columns(headers)
+        native = None if per_set else _native_indexes(headers)
+        if per_set is None and native is None:
+            result.errors.append("מבנה הקובץ לא מוכר (חסרות עמודות תאריך/משקל)")
+            return result
+
+        exercise_col = _find_column(headers, _EXERCISE_COLUMNS)
+        aggregator = _SetAggregator(result)
+        for line_no, values in enumerate(reader, start=2):
+            if not any(v.strip() for v in values):
+                continue
+            try:
+                if per_set:
+                    (ex_col, date_col, weight_col, reps_col), lbs = per_set
+                    weight = parse_number(values[weight_col] or 0)
+                    if lbs:
+                        weight = round(weight * _LBS_TO_KG, 3)
+                    date, reps = parse_date(values[date_col]), parse_count(values[reps_col] or 0)
+                    check_values(date, weight, 1, reps, reps)
+                    aggregator.add(values[ex_col].strip(), date, weight, reps)
+                else:
+                    exercise = values[exercise_col].strip() if 0 <= exercise_col < len(values) else ""
+                    row = _row_from_native(values, native)
+                    result.rows_by_exercise.setdefault(exercise or default_exercise, []).append(row)
+            except (ValueError, IndexError) as e:
+                result.errors.append(f"שורה {line_no}: {e}")
+        aggregator.flush()
+    return result
+
+
+def read_excel(path) -> ImportResult:
+    """ניתוח קובץ אקסל במבנה הייצוא של האפליקציה (גיליון לכל תרגיל)"""
+    from openpyxl import load_workbook
+
+    result = ImportResult()
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        # קובץ של הייצוא שומר את שמות התרגילים המלאים; אחרת - שם הגיליון
+        exercise_names = exercise_names_by_sheet(wb)
+        for ws in wb.worksheets:
+            if ws.title == STATE_SHEET:
+                continue
+            exercise_name = exercise_names.get(ws.title, ws.title)
+            rows = ws.iter_rows(values_only=True)
+            headers = next(rows, None)
+            indexes = _native_indexes(list(headers)) if headers else None
+            if indexes is None:
+                result.errors.append(f"גיליון '{ws.title}': חסרות כותרות {', '.join(EXPORT_HEADERS)}")
+                continue
+            for line_no, values in enumerate(rows, start=2):
+                if not values or all(v in (None, "") for v in values):
+                    continue
+                try:
+                    row = _row_from_native(values, indexes)
+                except (ValueError, IndexError) as e:
+                    result.errors.append(f"גיליון '{ws.title}' שורה {line_no}: {e}")
+                    continue
+                result.rows_by_exercise.setdefault(exercise_name, []).append(row)
+    finally:
+        wb.close()
+    return result
+
+
+def read_import_file(path, default_exercise: str = None) -> ImportResult:
+    """ניתוח קובץ ייבוא לפי הסיומת"""
+    suffix = Path(path).suffix.lower()
+    if suffix in (".xlsx", ".xlsm"):
+        return read_excel(path)
+    return read_csv(path, default_exercise)
+
+
+_BULK_SPLIT = re.compile(r"[\t;| ]+")
+_SETS_X_REPS = re.compile(r"^(\d+)[xX×*](\d+)$")
+
+
+def _looks_like_date(token: str) -> bool:
+    return any(sep in token for sep in "/-.") and sum(ch.isdigit() for ch in token) >= 4 \
+        and not token.replace(".", "", 1).isdigit()
+
+
+def parse_bulk_line(line: str, default_date: datetime) -> list[str]:
+    """
+    ניתוח שורת הזנה מרובה לשורת טבלה.
+
+    הפורמט: משקל סטים חזרות [סט אחרון] [תאריך], מופרדים ברווח, טאב או ';'.
+    נתמך גם 3x10 במקום "סטים חזרות", ושורה מופרדת בפסיקים (60,3,10,8).
+    """
+    text = line.strip()
+    if text.count(",") >= 2 and not re.search(r"[\t;| ]", text):
+        text = text.replace(",", " ")
+    tokens = [t for t in _BULK_SPLIT.split(text) if t and t.lower() not in ("kg", "ק\"ג")]
+
+    date = default_date
+    numbers = []
+    for token in tokens:
+        if _looks_like_date(token):
+            date = parse_date(token)
+            continue
+        match = _SETS_X_REPS.match(token)
+        if match:
+            numbers.extend(match.groups())
+            continue
+        numbers.append(token)
+
+    if len(numbers) not in (3, 4):
+        raise ValueError("צפויים משקל, סטים, חזרות ו(אופציונלי) סט אחרון")
+    weight = parse_number(numbers[0])
+    sets = parse_count(numbers[1])
+    reps = parse_count(numbers[2])
+    last_reps = parse_count(numbers[3]) if len(numbers) == 4 else reps
+    check_values(date, weight, sets, reps, last_reps)
+    return format_row(date, weight, sets, reps, last_reps)
+
+
+def parse_bulk_text(text: str, default_date: datetime = None) -> tuple[list[list[str]], list[str]]:
+    """ניתוח טקסט רב-שורות (הדבקה מהלוח) - מחזיר (שורות תקינות, שגיאות)"""
+    default_date = default_date or datetime.now()
+    rows, errors = [], []
+    for line_no, line in enumerate(text.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            rows.append(parse_bulk_line(line, default_date))
+        except ValueError as e:
+            errors.append(f"שורה {line_no}: {e}")
+    return rows, errors
@@ -0,0 +1,342 @@
+"""
+ערכת העיצוב של האפליקציה - גיליון סגנון אחד לכל החלונות
+
+כל הסגנונות נמצאים כאן ומוחלים פעם אחת על QApplication (apply_stylesheet
+ב-app.py). widget לא מקבל setStyleSheet משלו; הוא משויך לכללים לפי
+objectName (#שם) או לפי מאפיינים דינמיים דרך styled() - variant ו-scale
+לכפתורים (לא size - זה כבר מאפיין של QWidget), role לתוויות וכו'.
+כך Qt מפענח את הגיליון פעם אחת, וטאב או דיאלוג חדש נבנה בלי פענוח סגנון.
+כללים ל-QFrame נכתבים כ-.QFrame (המחלקה עצמה) - אחרת הם חלים גם על QLabel.
+שינוי מאפיין אחרי שה-widget כבר מוצג - דרך restyle() (ליטוש מחדש בלבד).
+ללא תלות ב-Qt: הפונקציות מקבלות כל אובייקט עם ממשק QWidget.
+"""
+from string import Template
+
+PALETTE = {
+    "primary": "#2196F3",
+    "primary_dark": "#1976D2",
+    "primary_light": "#E3F2FD",
+    "success": "#4CAF50",
+    "success_dark": "#388E3C",
+    "danger": "#f44336",
+    "danger_dark": "#d32f2f",
+    "danger_disabled": "#ffcdd2",
+    "warning": "#FF9800",
+    "warning_dark": "#F57C00",
+    "warning_disabled": "#FFE0B2",
+    "neutral": "#6c757d",
+    "neutral_dark": "#5a6268",
+    "muted": "#666666",
+    "separator": "#cccccc",
+    "disabled": "#BDBDBD",
+    "text": "#212529",
+}
+
+# קופסאות הסיכום בטאב תרגיל (SummaryCard - מצוירות, לא בגיליון): (צבע התחלה, צבע סוף, מסגרת)
+CARD_COLORS = {
+    "exercises": ("#2196F3", "#1976D2", "#1565C0"),
+    "weight": ("#4CAF50", "#388E3C", "#2E7D32"),
+    "average": ("#FF9800", "#F57C00", "#E65100"),
+    "progress": ("#9C27B0", "#7B1FA2", "#6A1B9A"),
+}
+
+# פרטי הפרופיל בחלון הצפייה: (רקע, מסגרת וכותרת)
+ACCENT_COLORS = {
+    "blue": ("#E3F2FD", "#2196F3"),
+    "green": ("#E8F5E9", "#4CAF50"),
+    "orange": ("#FFF3E0", "#FF9800"),
+    "pink": ("#FCE4EC", "#E91E63"),
+    "purple": ("#F3E5F5", "#9C27B0"),
+}
+
+_BASE = """
+QMainWindow {
+    background-color: #f0f0f0;
+}
+QTabWidget::pane {
+    border: 1px solid #cccccc;
+    background: white;
+    border-radius: 5px;
+}
+QTabBar::tab {
+    background: #e1e1e1;
+    border: 1px solid #cccccc;
+    padding: 8px 15px;
+    margin-right: 2px;
+    border-top-left-radius: 4px;
+    border-top-right-radius: 4px;
+    font-size: 11pt;
+}
+QTabBar::tab:selected {
+    background: white;
+    border-bottom-color: white;
+}
+QLineEdit {
+    padding: 6px;
+    border: 1px solid #cccccc;
+    border-radius: 4px;
+    background-color: white;
+    font-size: 11pt;
+}
+QLineEdit:focus {
+    border: 1px solid $primary;
+}
+QPushButton {
+    padding: 6px 12px;
+    background-color: $primary;
+    color: white;
+    border: none;
+    border-radius: 4px;
+    font-size: 11pt;
+}
+QPushButton:hover {
+    background-color: $primary_dark;
+}
+QPushButton:disabled {
+    background-color: $disabled;
+}
+QTableWidget {
+    border: 1px solid #cccccc;
+    border-radius: 4px;
+    font-size: 11pt;
+}
+QTableWidget::item {
+    padding: 4px;
+    min-height: 24px;
+}
+QTableWidget {
+    padding: 4px;
+    min-height: 400px;
+}
+QTableWidget {
+    gridline-color: #cccccc;
+}
+QTableWidget::item:selected {
+    background-color: $primary_light;
+    color: black;
+}
+QHeaderView::section {
+    background-color: #f5f5f5;
+    padding: 6px;
+    border: 1px solid #cccccc;
+    font-size: 11pt;
+    font-weight: bold;
+}
+QLabel {
+    font-size: 11pt;
+}
+QMenu {
+    background-color: white;
+    border: 1px solid #cccccc;
+}
+QMenu::item {
+    padding: 6px 20px;
+}
+QMenu::item:selected {
+    background-color: $primary_light;
+}
+QStatusBar {
+    background-color: #f5f5f5;
+    color: #333333;
+    font-size: 10pt;
+}
+QToolBar {
+    background-color: #f5f5f5;
+    border-bottom: 1px solid #cccccc;
+    spacing: 5px;
+    padding: 5px;
+}
+QToolBar QToolButton {
+    background-color: $primary;
+    color: white;
+    border-radius: 4px;
+    padding: 5px 10px;
+    font-size: 11pt;
+}
+QToolBar QToolButton:hover {
+    background-color: $primary_dark;
+}
+QMessageBox {
+    font-size: 11pt;
+}
+QMessageBox QPushButton {
+    min-width: 80px;
+}
+
+/* --- כפתורים: variant (צבע) ו-scale (גודל) --- */
+QPushButton[variant="success"] { background-color: $success; }
+QPushButton[variant="success"]:hover { background-color: $success_dark; }
+QPushButton[variant="danger"] { background-color: $danger; }
+QPushButton[variant="danger"]:hover { background-color: $danger_dark; }
+QPushButton[variant="danger"]:disabled { background-color: $danger_disabled; }
+QPushButton[variant="warning"] { background-color: $warning; }
+QPushButton[variant="warning"]:hover { background-color: $warning_dark; }
+QPushButton[variant="warning"]:disabled { background-color: $warning_disabled; }
+QPushButton[variant="neutral"] { background-color: $neutral; }
+QPushButton[variant="neutral"]:hover { background-color: $neutral_dark; }
+QPushButton[scale="large"] {
+    padding: 10px 20px;
+    font-size: 12pt;
+    font-weight: bold;
+    border-radius: 5px;
+}
+QPushButton[scale="medium"] {
+    padding: 8px 16px;
+    font-size: 11pt;
+    border-radius: 5px;
+}
+QPushButton[scale="small"] {
+    padding: 8px;
+    font-size: 10pt;
+    border-radius: 5px;
+}
+
+/* --- תוויות לפי role --- */
+QLabel[role="title"] {
+    font-size: 16pt;
+    font-weight: bold;
+    color: $primary;
+    padding: 10px;
+}
+QLabel[role="heading"] {
+    font-size: 12pt;
+    font-weight: bold;
+}
+QLabel[role="field"] {
+    font-weight: bold;
+}
+QLabel[role="hint"] {
+    font-size: 10pt;
+    color: $muted;
+    padding: 5px;
+}
+QLabel[role="highlight"] {
+    font-size: 12pt;
+    padding: 10px;
+    background-color: $primary_light;
+    border-radius: 4px;
+}
+QLabel[validation="error"] { color: $danger_dark; }
+QLabel[validation="ok"] { color: $success_dark; }
+.QFrame[role="separator"] { color: $separator; }
+QLineEdit[scale="large"] {
+    padding: 8px;
+    border: 2px solid $primary;
+    border-radius: 5px;
+}
+
+/* --- חלון ראשי וגיליון סיכום --- */
+QLabel#profileNameLabel {
+    font-size: 13pt;
+    font-weight: bold;
+    color: $primary;
+    padding: 5px;
+}
+QLabel#perfHud {
+    background-color: rgba(33, 33, 33, 200);
+    color: #E0E0E0;
+    font-family: Consolas, monospace;
+    font-size: 9pt;
+    padding: 8px;
+    border-radius: 6px;
+}
+QLabel#summaryTitle {
+    font-size: 24pt;
+    font-weight: bold;
+    color: $primary;
+    padding: 20px;
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 $primary_light, stop:1 #BBDEFB);
+    border-radius: 10px;
+}
+QLabel#summaryPlaceholder {
+    font-size: 14pt;
+    color: $muted;
+    padding: 40px;
+    background-color: #FAFAFA;
+    border: 2px dashed $disabled;
+    border-radius: 8px;
+}
+
+/* --- דיאלוגים של פרופיל --- */
+QListWidget#profileList {
+    border: 2px solid $primary;
+    border-radius: 5px;
+    padding: 5px;
+    font-size: 11pt;
+}
+QListWidget#profileList::item {
+    padding: 8px;
+    border-radius: 3px;
+}
+QListWidget#profileList::item:selected {
+    background-color: $primary;
+    color: white;
+}
+QListWidget#profileList::item:hover {
+    background-color: $primary_light;
+}
+QLabel[avatar="view"] {
+    border: 4px solid $primary;
+    border-radius: 60px;
+    background-color: $primary_light;
+}
+QLabel[avatar="edit"] {
+    border: 3px solid $primary;
+    border-radius: 50px;
+    background-color: $primary_light;
+}
+QLabel[avatar="edit"][empty="true"] {
+    border-style: dashed;
+    color: $primary;
+    font-size: 10pt;
+}
+.QFrame#profileInfo {
+    background-color: #f8f9fa;
+    border-radius: 10px;
+}
+QLabel[role="profileValue"] {
+    font-size: 13pt;
+    font-weight: 600;
+    color: $text;
+    padding: 12px;
+}
+"""
+
+
+def _accent_rules() -> str:
+    rules = []
+    for name, (background, color) in ACCENT_COLORS.items():
+        rules.append(f"""
+.QFrame[accent="{name}"] {{
+    background-color: {background};
+    border: 2px solid {color};
+    border-radius: 8px;
+}}
+QLabel[accent="{name}"] {{
+    font-size: 13pt;
+    font-weight: bold;
+    color: {color};
+    padding: 12px;
+}}""")
+    return "".join(rules)
+
+
+# הגיליון המלא - נבנה פעם אחת בייבוא המודול
+STYLESHEET = Template(_BASE).substitute(PALETTE) + _accent_rules()
+
+
+def styled(widget, object_name: str = None, **properties):
+    """שיוך widget לכללי הגיליון לפי שם ומאפיינים; מחזיר את ה-widget"""
+    if object_name:
+        widget.setObjectName(object_name)
+    for name, value in properties.items():
+        widget.setProperty(name, value)
+    return widget
+
+
+def restyle(widget, **properties):
+    """שינוי מאפיינים של widget שכבר לוטש - Qt לא מחיל אותם מעצמו"""
+    styled(widget, **properties)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
@@ -0,0 +1,147 @@
+"""
+מדידת זמן עליית האפליקציה ובדיקת תקציב
+
+מריץ את האפליקציה במצב מדידה (WORKOUT_STARTUP_REPORT) על נתונים סינתטיים,
+מציג פירוק של זמני הייבוא (PySide6, matplotlib, openpyxl, version ...) ושל
+בניית החלון עד הציור הראשון, ונכשל (קוד יציאה 1) אם העלייה חורגת מהתקציב.
+
+דוגמאות:
+    python startup_profile.py                          # הרצה מקוד המקור
+    python startup_profile.py --runs 5 --budget-ms 1500
+    python startup_profile.py --exe dist/TrackMyWorkout.exe   # הגרסה הבנויה (build.py)
+
+בהרצה מקוד המקור נאסף גם פירוק לכל מודול עם python -X importtime.
+בגרסה הבנויה אין -X importtime, והפירוק מגיע מנקודות הזמן שהאפליקציה רושמת.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+sys.path.insert(0, str(ROOT / "src"))
+from core.synthetic import generate_dataset
+
+# תקציב ברירת מחדל לזמן עד אינטראקטיבי (מילישניות); ניתן לשינוי עם --budget-ms או STARTUP_BUDGET_MS
+DEFAULT_BUDGET_MS = 3000
+
+# קבוצות לפירוק -X importtime לפי שם החבילה העליונה
+IMPORT_GROUPS = {
+    "PySide6": ("PySide6", "shiboken6"),
+    "matplotlib": ("matplotlib", "numpy", "PIL", "kiwisolver", "pyparsing", "cycler", "fontTools", "contourpy"),
+    "openpyxl": ("openpyxl", "et_xmlfile"),
+    "version": ("version",),
+    "core": ("core",),
+    "chart_render": ("chart_render",),
+    "theme": ("theme",),
+}
+
+
+def parse_importtime(stderr: str) -> dict[str, float]:
+    """סכום זמן ה-self (מילישניות) לכל קבוצה מפלט -X importtime"""
+    owners = {module: group for group, modules in IMPORT_GROUPS.items() for module in modules}
+    totals = defaultdict(float)
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        try:
+            self_us, _cumulative, name = line[len("import time:"):].split("|")
+            top = name.strip().split(".")[0]
+            totals[owners.get(top, "other")] += int(self_us) / 1000
+        except ValueError:
+            continue
+    return dict(totals)
+
+
+def run_once(command: list[str], data_dir: Path, env: dict) -> tuple[dict, dict]:
+    report_path = data_dir / "startup_report.json"
+    if report_path.exists():
+        report_path.unlink()
+    env = dict(env, WORKOUT_STARTUP_REPORT=str(report_path))
+    result = subprocess.run(command, cwd=data_dir, env=env, capture_output=True, text=True,
+                            encoding="utf-8", errors="replace", timeout=120)
+    if not report_path.exists():
+        raise RuntimeError(f"האפליקציה לא כתבה דוח עלייה (קוד יציאה {result.returncode}):\n{result.stderr[-2000:]}")
+    with open(report_path, "r", encoding="utf-8") as f:
+        report = json.load(f)
+    return report, parse_importtime(result.stderr)
+
+
+def main(argv=None):
+    """פונקציה ראשית"""
+    parser = argparse.ArgumentParser(description="מדידת זמן עליית האפליקציה ובדיקת תקציב")
+    parser.add_argument("--exe", type=Path, help="קובץ הרצה בנוי (PyInstaller); ברירת מחדל - src/app.py")
+    parser.add_argument("--runs", type=int, default=3, help="מספר הרצות (נלקח החציון)")
+    parser.add_argument("--budget-ms", type=float,
+                        default=float(os.environ.get("STARTUP_BUDGET_MS", DEFAULT_BUDGET_MS)),
+                        help="תקציב לזמן עד אינטראקטיבי")
+    parser.add_argument("--entries", type=int, default=500, help="שורות לכל תרגיל בנתוני הבדיקה")
+    parser.add_argument("--exercises", type=int, default=4, help="תרגילים בנתוני הבדיקה")
+    parser.add_argument("--show", action="store_true", help="הצגת החלון (ברירת מחדל: offscreen)")
+    args = parser.parse_args(argv)
+
+    if args.exe:
+        command = [str(args.exe.resolve())]
+    else:
+        command = [sys.executable, "-X", "importtime", str((ROOT / "src" / "app.py").resolve())]
+
+    env = dict(os.environ)
+    if not args.show:
+        env.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    reports, import_groups = [], []
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        generate_dataset(data_dir, profiles=1, exercises=args.exercises, entries=args.entries)
+        # הרצת חימום - מטמון הקבצים של מערכת ההפעלה משפיע מאוד על ההרצה הראשונה
+        run_once(command, data_dir, env)
+        for _ in range(args.runs):
+            report, groups = run_once(command, data_dir, env)
+            reports.append(report)
+            import_groups.append(groups)
+
+    def median(values):
+        values = [v for v in values if v is not None]
+        return statistics.median(values) if values else None
+
+    print(f"⏱  זמן עלייה - {'EXE' if args.exe else 'קוד מקור'}, גרסה {reports[0]['version']}, "
+          f"{args.runs} הרצות (חציון)")
+    print("-" * 50)
+    if any(import_groups):
+        print("ייבוא לפי חבילה (-X importtime, זמן self):")
+        names = sorted({name for groups in import_groups for name in groups},
+                       key=lambda n: -median([g.get(n, 0.0) for g in import_groups]))
+        for name in names:
+            print(f"  {name:<14}{median([g.get(name, 0.0) for g in import_groups]):>10.1f} ms")
+    else:
+        print("ייבוא לפי קבוצה (נקודות זמן באפליקציה):")
+        for name in reports[0]["imports_ms"]:
+            print(f"  {name:<14}{median([r['imports_ms'].get(name) for r in reports]):>10.1f} ms")
+    lazy = [name for name, loaded in reports[0]["loaded"].items() if not loaded]
+    if lazy:
+        print(f"  (לא נטענו בעלייה: {', '.join(lazy)})")
+
+    print("שלבים (מילישניות מתחילת app.py):")
+    for mark in ("window_constructed", "first_paint", "interactive"):
+        value = median([r["marks_ms"].get(mark) for r in reports])
+        print(f"  {mark:<20}{value:>10.1f} ms" if value is not None else f"  {mark:<20}{'-':>10}")
+
+    total = median([r["marks_ms"].get("interactive") for r in reports])
+    print("-" * 50)
+    if total is None:
+        print("❌ האפליקציה לא הגיעה למצב אינטראקטיבי")
+        return 1
+    if total > args.budget_ms:
+        print(f"❌ חריגה מהתקציב: {total:.0f} ms > {args.budget_ms:.0f} ms")
+        return 1
+    print(f"✅ בתקציב: {total:.0f} ms <= {args.budget_ms:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
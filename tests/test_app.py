@@ -1,6 +1,27 @@
-from src.app import greet
+from src.app import get_version_string
+from src.version import __version__
 
 
-def test_greet():
-    out = greet("אלעד")
-    assert "אלעד" in out
+def test_version_string():
+    out = get_version_string()
+    assert __version__ in out
+
+
+def test_reimport_skips_rows_already_in_archive(tmp_path, monkeypatch):
+    monkeypatch.setenv("QT_QPA_PLATFORM", "offscreen")
+    monkeypatch.chdir(tmp_path)
+    from PySide6.QtWidgets import QApplication
+
+    from src.app import ExerciseTab
+    from src.core.synthetic import synthetic_rows
+
+    app = QApplication.instance() or QApplication([])
+    rows = synthetic_rows(150, seed=4)
+    tab = ExerciseTab("סקוואט", "p")
+    assert tab.add_entries(rows, skip_existing=True) == 150
+    assert tab.archive_old_entries(keep_recent=10) == 140
+
+    assert tab.add_entries(rows, skip_existing=True) == 0
+    assert tab._history_rows() == rows
+    tab.deleteLater()
+    app.processEvents()
@@ -0,0 +1,509 @@
+from datetime import datetime
+
+import pytest
+
+from src.core import WorkoutEntry, progress_level, row_volume, storage, summarize, total_volume
+
+
+ROWS = [
+    ["8", "10", "3", "60 Kg", "01/10/2025"],
+    ["10", "10", "3", "62,5 Kg", "03/10/2025"],
+]
+
+
+def test_row_volume():
+    assert row_volume(ROWS[0]) == (2 * 10 * 60) + (8 * 60)
+    assert row_volume(ROWS[1]) == 30 * 62.5
+
+
+@pytest.mark.parametrize("row", [["", "10", "3", "60 Kg", ""], ["x", "10", "3", "60 Kg", ""], ["8"]])
+def test_row_volume_invalid_rows_are_skipped(row):
+    assert row_volume(row) == 0
+
+
+def test_summarize():
+    summary = summarize(ROWS)
+    assert summary.count == 2
+    assert summary.total_weight == total_volume(ROWS)
+    assert summary.avg_weight == summary.total_weight / 2
+
+
+@pytest.mark.parametrize("count, name, dots", [
+    (0, "טירון", "○━○━○━○━○"),
+    (25, "מתחיל", "●━◉━○━○━○"),
+    (150, "אגדי", "●━●━●━●━◉"),
+])
+def test_progress_level(count, name, dots):
+    level = progress_level(count)
+    assert level.name == name
+    assert level.dots == dots
+
+
+def test_workout_entry_roundtrip():
+    entry = WorkoutEntry.from_row(ROWS[1])
+    assert entry.weight == 62.5
+    assert entry.date == datetime(2025, 10, 3)
+    assert entry.to_row() == ["10", "10", "3", "62.5 Kg", "03/10/2025"]
+    assert entry.volume == row_volume(ROWS[1])
+
+
+def test_exercise_storage_roundtrip(tmp_path):
+    storage.save_exercise("אלעד", "סקוואט", ROWS, base_dir=tmp_path)
+    assert storage.list_exercises("אלעד", base_dir=tmp_path) == ["סקוואט"]
+    assert storage.load_exercise("אלעד", "סקוואט", base_dir=tmp_path) == ROWS
+    assert storage.load_exercise("אלעד", "חסר", base_dir=tmp_path) == []
+
+
+@pytest.mark.parametrize("content", ["{not json", "[]", '{"rows": 5}', '{"rows": [5]}'])
+def test_load_rows_rejects_corrupt_files(tmp_path, content):
+    path = tmp_path / "exercise_p_x.json"
+    path.write_text(content, encoding="utf-8")
+    with pytest.raises(ValueError):
+        storage.load_rows(path)
+
+
+def test_profile_storage(tmp_path):
+    storage.save_profile("אנה", {"name": "אנה", "age": "30"}, base_dir=tmp_path)
+    assert storage.list_profiles(base_dir=tmp_path) == ["אנה"]
+    assert storage.read_active_profile(base_dir=tmp_path) == "אנה"
+    profile = storage.load_profile("אנה", base_dir=tmp_path)
+    assert profile["age"] == "30"
+    assert profile["gender"] == ""
+
+
+def test_migrate_legacy_exercises(tmp_path):
+    storage.save_rows(tmp_path / "exercise_state_לחיצה.json", ROWS)
+    assert storage.migrate_legacy_exercises("ברירת מחדל", base_dir=tmp_path) == ["לחיצה"]
+    assert storage.load_exercise("ברירת מחדל", "לחיצה", base_dir=tmp_path) == ROWS
+
+
+def test_binary_format_round_trip_is_lossless(tmp_path):
+    from src.core import binformat
+    from src.core.synthetic import synthetic_rows
+
+    rows = synthetic_rows(500, seed=1) + ROWS + [["", "", "", "", ""], ["8", "10", "3", "60 Kg", "2025-10-01"]]
+    storage.save_exercise("p", "לחיצה", rows, base_dir=tmp_path)
+    json_size = storage.exercise_path("p", "לחיצה", base_dir=tmp_path).stat().st_size
+
+    for fmt in (storage.FORMAT_BINARY, storage.FORMAT_BINARY_ZLIB, storage.FORMAT_JSON):
+        assert storage.convert_exercises(fmt, base_dir=tmp_path) == 1
+        path = storage.exercise_path("p", "לחיצה", base_dir=tmp_path)
+        assert storage.load_exercise("p", "לחיצה", base_dir=tmp_path) == rows
+        assert storage.list_exercises("p", base_dir=tmp_path) == ["לחיצה"]
+        if fmt != storage.FORMAT_JSON:
+            assert path.suffix == binformat.SUFFIX and path.stat().st_size < json_size / 4
+            with binformat.HistoryFile(path) as history:
+                assert len(history) == len(rows) and sorted(history.exceptions) == [501, 502, 503]
+    assert path.suffix == ".json"
+
+
+def test_archive_segments_match_live_aggregation(tmp_path):
+    from src.core import archive, chart_points
+    from src.core.synthetic import synthetic_rows
+
+    rows = synthetic_rows(450, seed=2) + ROWS
+    old_rows, recent_rows = archive.split_rows(rows, keep_recent=100)
+    assert old_rows + recent_rows == rows and len(recent_rows) == 100
+    archive.write_segment("p", "לחיצה", old_rows[:200], base_dir=tmp_path)
+    archive.write_segment("p", "לחיצה", old_rows[200:], base_dir=tmp_path)
+
+    with archive.open_archive("p", "לחיצה", base_dir=tmp_path) as archived:
+        assert archived.rows() == old_rows
+        assert archived.summary().count == len(old_rows)
+        assert archived.total_volume == pytest.approx(total_volume(old_rows))
+        assert archived.chart_points() == chart_points(old_rows)
+
+    storage.rename_exercise("p", "לחיצה", "חזה", base_dir=tmp_path)
+    assert [i for i, _ in storage.archive_segments("p", "חזה", base_dir=tmp_path)] == [1, 2]
+    storage.delete_exercise("p", "חזה", base_dir=tmp_path)
+    assert archive.open_archive("p", "חזה", base_dir=tmp_path) is None
+
+
+def test_thumbnail_key_tracks_source_and_disk_cache_prunes(tmp_path):
+    import os
+
+    from src.core.thumbnails import ThumbnailDiskCache, thumbnail_key
+
+    image = tmp_path / "profile.png"
+    assert thumbnail_key(image, 56) is None
+    image.write_bytes(b"first")
+    key = thumbnail_key(image, 56, "toolbar")
+    assert key == thumbnail_key(image, 56, "toolbar") != thumbnail_key(image, 120, "toolbar")
+    image.write_bytes(b"second image")
+    os.utime(image, ns=(1, 1))
+    assert thumbnail_key(image, 56, "toolbar") != key
+
+    cache = ThumbnailDiskCache(tmp_path / "cache", max_files=2)
+    assert cache.get(key) is None
+    for i in range(3):
+        cache.put(f"k{i}", b"png%d" % i)
+        os.utime(cache.directory / f"k{i}.png", ns=(i, i))
+    cache.prune()
+    assert cache.get("k0") is None and cache.get("k2") == b"png2"
+
+
+def test_pick_variant_prefers_smallest_fresh_variant(tmp_path):
+    import os
+
+    from src.core.thumbnails import pick_variant, variant_path
+
+    image = tmp_path / "profile_image_p.png"
+    image.write_bytes(b"main")
+    assert pick_variant(image, 56) == image
+    for size, stamp in ((64, 10), (128, 10), (256, 1)):
+        variant_path(image, size).write_bytes(b"v")
+        os.utime(variant_path(image, size), ns=(stamp, stamp))
+    os.utime(image, ns=(5, 5))
+    assert pick_variant(image, 56).name == "profile_image_p@64.png"
+    assert pick_variant(image, 100).name == "profile_image_p@128.png"
+    # @256 ישנה מהתמונה - לא נבחרת
+    assert pick_variant(image, 200) == image
+
+
+def test_profile_images_are_shared_assets_with_refcount(tmp_path):
+    import os
+
+    from src.core.assets import AssetStore, is_asset_ref
+
+    store = AssetStore(tmp_path)
+    ref = store.add(b"png")
+    assert is_asset_ref(ref) and store.add(b"png") == ref
+    storage.save_profile("a", {"profile_image": ref}, base_dir=tmp_path)
+    storage.save_profile("b", {"profile_image": ref}, base_dir=tmp_path)
+    assert store.ref_count(ref) == 2
+
+    storage.rename_profile("a", "c", base_dir=tmp_path)
+    storage.delete_profile("b", base_dir=tmp_path)
+    assert store.path(ref).exists() and store.ref_count(ref) == 1
+    storage.save_profile("c", {"profile_image": ""}, base_dir=tmp_path)
+    assert not store.path(ref).exists()
+
+    # נתיב ישן עובר למאגר; יתום ישן נמחק באיסוף
+    legacy = tmp_path / "profile_image_c.png"
+    legacy.write_bytes(b"old")
+    storage.save_profile("c", {"profile_image": str(legacy)}, base_dir=tmp_path)
+    migrated = storage.migrate_profile_image("c", base_dir=tmp_path)["profile_image"]
+    assert store.path(migrated).read_bytes() == b"old" and not legacy.exists()
+    orphan = store.path(store.add(b"orphan"))
+    os.utime(orphan, (0, 0))
+    assert storage.collect_asset_garbage(base_dir=tmp_path) == [orphan.name]
+    assert store.ref_count(migrated) == 1
+
+
+def test_profile_overview_counts_live_and_archived_entries(tmp_path):
+    from datetime import date
+
+    from src.core import archive, overview
+
+    storage.save_exercise("p", "a", ROWS, base_dir=tmp_path)
+    storage.save_exercise("p", "b", ROWS[:1], base_dir=tmp_path, fmt=storage.FORMAT_BINARY)
+    archive.write_segment("p", "b", [["8", "10", "3", "60 Kg", "05/11/2025"]], base_dir=tmp_path)
+    info = overview.profile_overview("p", base_dir=tmp_path)
+    assert (info.exercises, info.entries, info.last_workout) == (2, 4, date(2025, 11, 5))
+
+    storage.save_exercise("p", "a", ROWS * 2, base_dir=tmp_path)
+    assert overview.profile_overview("p", base_dir=tmp_path).entries == 6
+    assert overview.profile_overview("empty", base_dir=tmp_path) == overview.ProfileOverview(0, 0)
+
+
+@pytest.mark.parametrize("distribution", ["uniform", "regular", "bursty"])
+@pytest.mark.parametrize("count, days", [(1000, 121), (50, 365)])
+def test_generate_dates_are_sorted_and_in_range(distribution, count, days):
+    from datetime import timedelta
+    from random import Random
+
+    from src.core.synthetic import generate_dates
+
+    start = datetime(2000, 1, 1)
+    end = start + timedelta(days=days)
+    dates = generate_dates(Random(0), count, start, end, distribution)
+    assert len(dates) == count
+    assert dates == sorted(dates)
+    assert start <= dates[0] and dates[-1] <= end
+
+
+def test_generate_dataset_is_deterministic_and_loadable(tmp_path):
+    from src.core.synthetic import generate_dataset
+
+    first = generate_dataset(tmp_path / "a", profiles=2, exercises=2, entries=30, seed=3,
+                             distribution="bursty", legacy_exercises=1, legacy_profile=True)
+    generate_dataset(tmp_path / "b", profiles=2, exercises=2, entries=30, seed=3,
+                     distribution="bursty", legacy_exercises=1, legacy_profile=True)
+    for path in (tmp_path / "a").iterdir():
+        assert path.read_bytes() == (tmp_path / "b" / path.name).read_bytes()
+
+    assert first["rows"] == 2 * 2 * 30 + 30
+    profile = first["profiles"][0]
+    assert storage.read_active_profile(base_dir=tmp_path / "a") == profile
+    assert storage.read_legacy_profile(base_dir=tmp_path / "a")["name"]
+    for exercise in storage.list_exercises(profile, base_dir=tmp_path / "a"):
+        rows = storage.load_exercise(profile, exercise, base_dir=tmp_path / "a")
+        assert [WorkoutEntry.from_row(row).to_row() for row in rows] == rows
+
+
+def test_trace_ring_buffer_and_chrome_export(tmp_path):
+    import json
+
+    from src.core import trace
+
+    @trace.traced("bench.work")
+    def work():
+        return 42
+
+    trace.disable()
+    trace.clear()
+    assert work() == 42
+    assert trace.events() == []
+
+    trace.enable(capacity=3)
+    try:
+        for _ in range(5):
+            work()
+        with trace.span("bench.block"):
+            pass
+    finally:
+        trace.disable()
+    names = [event[0] for event in trace.events()]
+    assert names == ["bench.work", "bench.work", "bench.block"]
+
+    path = tmp_path / "trace.json"
+    assert trace.export_chrome_trace(path) == 3
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert {e["ph"] for e in data["traceEvents"]} == {"X", "M"}
+    trace.enable(capacity=trace.DEFAULT_CAPACITY)
+    trace.disable()
+
+
+def test_chart_cache_evicts_least_recently_used_and_counts_hits():
+    from src.chart_render import ChartCache, chart_cache_key
+
+    points = [(datetime(2025, 10, 1), 60.0), (datetime(2025, 10, 3), 62.5)]
+    key = chart_cache_key("t", points, 640, 480)
+    assert key == chart_cache_key("t", list(points), 640, 480)
+    assert key != chart_cache_key("t", points, 641, 480)
+    assert key != chart_cache_key("t", points[:1], 640, 480)
+
+    cache = ChartCache(max_entries=2)
+    assert cache.get("a") is None
+    assert cache.hit_rate == 0.0
+    cache.put("a", b"1")
+    cache.put("b", b"22")
+    assert cache.get("a") == b"1"  # a הופך לאחרון בשימוש
+    cache.put("c", b"333")
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1" and cache.get("c") == b"333"
+    assert (cache.hits, cache.misses) == (3, 2)
+    assert cache.hit_rate == 3 / 5
+    assert cache.size_bytes() == 4
+    cache.clear()
+    assert len(cache) == 0 and cache.size_bytes() == 0
+
+
+def test_sysinfo():
+    from src.core.sysinfo import format_bytes, rss_bytes
+
+    assert rss_bytes() >= 0
+    assert format_bytes(512) == "512 B"
+    assert format_bytes(3 * 1024 * 1024) == "3 MB"
+
+
+def test_memory_attribution():
+    import tracemalloc
+
+    from src.core import memreport
+
+    def make_snapshots():
+        return [[str(i)] * 5 for i in range(2000)]
+
+    was_tracing = tracemalloc.is_tracing()
+    memreport.start(frames=5)
+    try:
+        kept = make_snapshots()
+        attributor = memreport.MemoryAttributor([("Undo/Redo", [make_snapshots])])
+        by_subsystem = attributor.attribute(tracemalloc.take_snapshot())
+        report = memreport.build_report(attributor, extra={"RSS": "1 MB"})
+    finally:
+        if not was_tracing:
+            memreport.stop()
+    assert by_subsystem["Undo/Redo"]["size"] > 2000 * 5 * 8
+    assert "Undo/Redo" in report and "RSS" in report
+    assert kept
+
+
+def test_excel_export_reimports_original_exercise_names(tmp_path):
+    pytest.importorskip("openpyxl")
+    from src.core.excel_export import write_workbook
+    from src.core.workout_import import read_excel
+
+    # שמות שהגיליון לא יכול לשמור כמו שהם: ארוך מ-31 תווים, תו אסור, ושני שמות
+    # שמתקצרים לאותה כותרת
+    names = ["לחיצת חזה בשיפוע חיובי עם משקולות יד", "Squat/Front",
+             "Romanian deadlift with a pause at knee", "Romanian deadlift with a pause at shin"]
+    path = tmp_path / "export.xlsx"
+    write_workbook(str(path), [(name, ROWS) for name in names])
+
+    result = read_excel(path)
+    assert not result.errors
+    assert sorted(result.rows_by_exercise) == sorted(names)
+    # הפסיק העשרוני מנורמל לנקודה בייצוא
+    expected = [["8", "10", "3", "60 Kg", "01/10/2025"], ["10", "10", "3", "62.5 Kg", "03/10/2025"]]
+    assert all(rows == expected for rows in result.rows_by_exercise.values())
+
+
+def test_import_files_skip_out_of_range_and_future_rows(tmp_path):
+    from src.core.workout_import import read_csv, read_import_file
+
+    native = tmp_path / "native.csv"
+    native.write_text("תאריך,משקל,סטים,חזרות\n01/10/2025,60,3,10\n02/10/2025,1500,3,10\n"
+                      "01/12/2999,60,3,10\n", encoding="utf-8")
+    result = read_csv(native, "סקוואט")
+    assert result.rows_by_exercise == {"סקוואט": [["10", "10", "3", "60 Kg", "01/10/2025"]]}
+    assert result.errors == ["שורה 3: ערך מחוץ לטווח", "שורה 4: תאריך עתידי"]
+
+    strong = tmp_path / "strong.csv"
+    strong.write_text("Date,Exercise Name,Weight,Reps\n2025-10-01 10:00:00,Squat,100,5\n"
+                      "2025-10-01 10:00:00,Squat,100,5000\n", encoding="utf-8")
+    result = read_csv(strong)
+    assert result.rows_by_exercise == {"Squat": [["5", "5", "1", "100 Kg", "01/10/2025"]]}
+    assert result.errors == ["שורה 3: ערך מחוץ לטווח"]
+
+    openpyxl = pytest.importorskip("openpyxl")
+    wb = openpyxl.Workbook()
+    wb.active.title = "Bench"
+    wb.active.append(["תאריך", "משקל", "סטים", "חזרות"])
+    wb.active.append(["01/10/2025", 60, 3, 10])
+    wb.active.append(["01/12/2999", 60, 3, 10])
+    path = tmp_path / "import.xlsm"
+    wb.save(path)
+    result = read_import_file(path)
+    assert result.row_count == 1
+    assert result.errors == ["גיליון 'Bench' שורה 3: תאריך עתידי"]
+
+
+def _chart_count(path) -> int:
+    import zipfile
+    with zipfile.ZipFile(path) as archive_file:
+        return sum(1 for name in archive_file.namelist() if name.startswith("xl/charts/chart"))
+
+
+def test_update_workbook_appends_rewrites_and_skips(tmp_path):
+    pytest.importorskip("openpyxl")
+    from src.core.excel_export import ExportCancelled, update_workbook, write_workbook
+    from src.core.workout_import import read_excel
+
+    path = tmp_path / "export.xlsx"
+    bench = [["8", "10", "3", f"{60 + i} Kg", f"{i + 1:02d}/10/2025"] for i in range(3)]
+    squat = [["5", "5", "5", "100 Kg", "02/10/2025"]]
+    write_workbook(str(path), [("bench", bench), ("squat", squat)])
+
+    # שורה חדשה בתרגיל אחד - רק היא נכתבת
+    bench.append(["8", "10", "3", "70 Kg", "20/10/2025"])
+    progress = []
+    assert update_workbook(str(path), [("bench", bench), ("squat", squat)],
+                           progress=lambda done, total: progress.append((done, total))) == (1, 1)
+    assert progress[-1] == (1, 1)
+    assert read_excel(path).rows_by_exercise["bench"][-1] == ["8", "10", "3", "70 Kg", "20/10/2025"]
+
+    # בלי שינוי - הקובץ לא נכתב מחדש
+    mtime = path.stat().st_mtime_ns
+    assert update_workbook(str(path), [("bench", bench), ("squat", squat)]) == (0, 0)
+    assert path.stat().st_mtime_ns == mtime
+
+    # עריכה של שורה ישנה - הגיליון נכתב מחדש; תרגיל חדש מקבל גיליון
+    bench[0] = ["6", "10", "3", "55 Kg", "01/10/2025"]
+    deadlift = [["3", "3", "3", "140 Kg", "05/10/2025"]]
+    assert update_workbook(str(path), [("bench", bench), ("squat", squat), ("deadlift", deadlift)]) == (2, 5)
+    result = read_excel(path)
+    assert result.rows_by_exercise == {"bench": bench, "squat": squat, "deadlift": deadlift}
+    # גרף אחד לכל גיליון - הגרף הישן הוחלף ולא שוכפל
+    assert _chart_count(path) == 3
+
+    # ביטול - הקובץ הקיים לא משתנה
+    before = path.read_bytes()
+    with pytest.raises(ExportCancelled):
+        update_workbook(str(path), [("bench", bench + bench), ("squat", squat)], is_cancelled=lambda: True)
+    assert path.read_bytes() == before
+    assert not (tmp_path / "export.xlsx.tmp").exists()
+
+
+def test_write_workbook_streams_sheets_state_and_progress(tmp_path):
+    openpyxl = pytest.importorskip("openpyxl")
+    from src.core import excel_export
+    from src.core.excel_export import EXPORT_HEADERS, STATE_SHEET, ExportCancelled, write_workbook
+
+    rows = [["8", "10", "3", f"{60 + i % 5} Kg", "01/10/2025"] for i in range(1200)]
+    path = tmp_path / "export.xlsx"
+    progress = []
+    assert write_workbook(str(path), [("bench", rows), ("empty", [])],
+                          progress=lambda done, total: progress.append((done, total))) == 2
+    # דיווח כל _PROGRESS_EVERY שורות ובסיום
+    every = excel_export._PROGRESS_EVERY
+    assert progress == [(n, 1200) for n in range(every, 1200, every)] + [(1200, 1200)]
+
+    wb = openpyxl.load_workbook(path)
+    ws = wb["bench"]
+    assert [cell.value for cell in ws[1]] == EXPORT_HEADERS
+    assert ws.max_row == 1201
+    assert [cell.value for cell in ws[2]] == [datetime(2025, 10, 1), 60, 3, 10, 8]
+    assert ws.sheet_view.rightToLeft
+    assert list(ws.tables) == ["DataTable0"] and ws.tables["DataTable0"].ref == "A1:E1201"
+    assert wb["empty"].max_row == 1 and not wb["empty"].tables
+
+    state = wb[STATE_SHEET]
+    assert state.sheet_state == "hidden"
+    entries = {values[0]: values for values in state.iter_rows(min_row=2, values_only=True)}
+    assert entries["bench"][1:3] == ("bench", 1200)
+    assert entries["empty"][1:3] == ("empty", 0)
+
+    # ביטול באמצע - הקובץ הקיים נשאר כמו שהוא ואין קובץ זמני
+    before = path.read_bytes()
+    with pytest.raises(ExportCancelled):
+        write_workbook(str(path), [("bench", rows)], is_cancelled=lambda: True)
+    assert path.read_bytes() == before
+    assert not (tmp_path / "export.xlsx.tmp").exists()
+
+
+BULK_DATE = datetime(2025, 10, 5)
+
+
+@pytest.mark.parametrize("line, expected", [
+    ("60 3 10", ["10", "10", "3", "60 Kg", "05/10/2025"]),
+    ("60 3 10 8", ["8", "10", "3", "60 Kg", "05/10/2025"]),
+    ("62.5 3x10", ["10", "10", "3", "62.5 Kg", "05/10/2025"]),
+    ("62,5 3X10 8", ["8", "10", "3", "62.5 Kg", "05/10/2025"]),
+    ("60,3,10,8", ["8", "10", "3", "60 Kg", "05/10/2025"]),
+    ("60;3;10;8", ["8", "10", "3", "60 Kg", "05/10/2025"]),
+    ("60\t3\t10", ["10", "10", "3", "60 Kg", "05/10/2025"]),
+    ("60 kg 3 10", ["10", "10", "3", "60 Kg", "05/10/2025"]),
+    ('60 ק"ג 3x10', ["10", "10", "3", "60 Kg", "05/10/2025"]),
+    ("60 3 10 01/10/2025", ["10", "10", "3", "60 Kg", "01/10/2025"]),
+    ("60 3 10 8 2025-10-02", ["8", "10", "3", "60 Kg", "02/10/2025"]),
+])
+def test_parse_bulk_line(line, expected):
+    from src.core.workout_import import parse_bulk_line
+    assert parse_bulk_line(line, BULK_DATE) == expected
+
+
+@pytest.mark.parametrize("line, message", [
+    ("60 3", "צפויים"),
+    ("60 3 10 8 7", "צפויים"),
+    ("60 3 10 01/12/2999", "תאריך עתידי"),
+    ("1001 3 10", "מחוץ לטווח"),
+    ("-5 3 10", "מחוץ לטווח"),
+    ("60 1001 10", "מחוץ לטווח"),
+    ("60 3 10 1001", "מחוץ לטווח"),
+    ("60 3 10 32/13/2025", "תאריך"),
+    ("abc 3 10", "abc"),
+])
+def test_parse_bulk_line_rejects(line, message):
+    from src.core.workout_import import parse_bulk_line
+    with pytest.raises(ValueError, match=message):
+        parse_bulk_line(line, BULK_DATE)
+
+
+def test_parse_bulk_text_skips_blank_lines_and_numbers_errors():
+    from src.core.workout_import import parse_bulk_text
+    rows, errors = parse_bulk_text("60 3 10\n\nxx\n70 3x8\n", BULK_DATE)
+    assert rows == [["10", "10", "3", "60 Kg", "05/10/2025"], ["8", "8", "3", "70 Kg", "05/10/2025"]]
+    assert len(errors) == 1 and errors[0].startswith("שורה 3:")